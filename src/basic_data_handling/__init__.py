@@ -1,8 +1,12 @@
+from . import _profiling
 from . import (boolean_nodes, casting_nodes, comparison_nodes, control_flow_nodes,
                data_list_nodes, dict_nodes, float_nodes, int_nodes, list_nodes,
                math_nodes, math_formula_node, path_nodes, regex_nodes, set_nodes,
                string_nodes, time_nodes)
 
+# With BASIC_DATA_HANDLING_PROFILE=1 the calls of the nodes are recorded, see _profiling.
+PROFILE = _profiling.profiling_enabled()
+
 NODE_CLASS_MAPPINGS = {}
 NODE_CLASS_MAPPINGS.update(boolean_nodes.NODE_CLASS_MAPPINGS)
 NODE_CLASS_MAPPINGS.update(casting_nodes.NODE_CLASS_MAPPINGS)
@@ -38,3 +42,7 @@ NODE_DISPLAY_NAME_MAPPINGS.update(math_nodes.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(math_formula_node.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(string_nodes.NODE_DISPLAY_NAME_MAPPINGS)
 NODE_DISPLAY_NAME_MAPPINGS.update(time_nodes.NODE_DISPLAY_NAME_MAPPINGS)
+
+if PROFILE:
+    _profiling.instrument_node_classes(NODE_CLASS_MAPPINGS)
+    _profiling.setup_profiling_output()
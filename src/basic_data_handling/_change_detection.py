@@ -0,0 +1,79 @@
+"""
+Change detection for the `IS_CHANGED` of the file loader nodes.
+
+The strategies are:
+- mtime: the modification time of the file, touching the file counts as a change
+- stat: the modification time in ns, size and inode, also notices a replaced file
+- content hash: a hash of the content, with xxhash when it is installed and blake2b otherwise,
+  so touching or rewriting a file with the same content doesn't count as a change
+
+The hashes are cached by the stat signature of the file, so an unchanged file isn't read again.
+A file modified right before it was hashed is hashed again the next time, as it may have been
+changed again within the same mtime tick.
+"""
+import hashlib
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CHANGE_DETECTION_STRATEGIES = ["mtime", "stat", "content hash"]
+# number of file hashes that are kept
+HASH_CACHE_SIZE = 1024
+# files modified this many seconds before they were hashed may change within the same mtime tick
+HASH_RACY_SECONDS = 2.0
+
+_hash_cache = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
+
+def _new_hasher():
+    try:
+        import xxhash
+        return xxhash.xxh3_128()
+    except ModuleNotFoundError:
+        return hashlib.blake2b(digest_size=16)
+
+
+def hash_file(path: str) -> str:
+    """Return the hash of the content of a file, read through mmap"""
+    hasher = _new_hasher()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                hasher.update(buffer)
+    return hasher.hexdigest()
+
+
+def cached_file_hash(path: str) -> str:
+    """Return the hash of a file, hashed again only when its stat signature changed"""
+    st = os.stat(path)
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+    with _hash_cache_lock:
+        digest = _hash_cache.get(key)
+        if digest is not None:
+            _hash_cache.move_to_end(key)
+            return digest
+    digest = hash_file(path)
+    if st.st_mtime_ns < time.time_ns() - int(HASH_RACY_SECONDS * 1e9):
+        with _hash_cache_lock:
+            _hash_cache[key] = digest
+            while len(_hash_cache) > HASH_CACHE_SIZE:
+                _hash_cache.popitem(last=False)
+    return digest
+
+
+def file_change_signature(path: str, strategy: str = "mtime"):
+    """Return the value for `IS_CHANGED` of a file loader, NaN when the file can't be accessed"""
+    try:
+        if strategy == "stat":
+            st = os.stat(path)
+            return f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}"
+        if strategy == "content hash":
+            return cached_file_hash(path)
+        if os.path.exists(path):
+            return os.path.getmtime(path)
+    except Exception:
+        pass
+    return float("NaN")  # Return NaN if file doesn't exist or can't access it
@@ -0,0 +1,198 @@
+"""
+Optional persistent index of directory listings for the path nodes.
+
+When the environment variable BASIC_DATA_HANDLING_DIRECTORY_INDEX is set, `PathGlob` and
+`PathListDir` read directories through a SQLite index instead of `os.scandir`. Set it to 1 to keep
+the index in the ComfyUI output directory, or to the file name of the index.
+
+The index stores the name, type, size and mtime of the entries of every directory that was read,
+together with the mtime and inode of the directory. Adding, removing or renaming an entry changes
+the mtime of its directory, so a directory is only read again when its signature changed. A
+directory that was checked less than `max_age` seconds ago is trusted without a stat. The sizes and
+mtimes of the entries are the ones of the last time their directory was read, as changing a file
+doesn't change the mtime of its directory, so `PathListDir` doesn't use the index when it returns or
+sorts by them. The checks and entries of at most `max_directories` directories are kept in memory.
+"""
+import os
+from collections import OrderedDict
+import sqlite3
+import threading
+import time
+from contextlib import nullcontext
+from typing import NamedTuple, Optional
+
+try:
+    from folder_paths import get_output_directory
+except:
+    def get_output_directory():
+        return "./"
+
+INDEX_FILE_NAME = "basic_data_handling_directory_index.sqlite"
+SCHEMA_VERSION = 1
+
+
+class IndexedStat(NamedTuple):
+    st_size: int
+    st_mtime: float
+
+
+class IndexedEntry:
+    """An entry of the index with the interface of `os.DirEntry` that the path nodes use"""
+    __slots__ = ("name", "path", "_is_dir", "_is_file", "_is_symlink", "_stat")
+
+    def __init__(self, directory: str, name: str, is_dir: bool, is_file: bool, is_symlink: bool, size: int, mtime: float):
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_dir = is_dir
+        self._is_file = is_file
+        self._is_symlink = is_symlink
+        self._stat = IndexedStat(size, mtime)
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._is_dir and (follow_symlinks or not self._is_symlink)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._is_file and (follow_symlinks or not self._is_symlink)
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def stat(self, follow_symlinks: bool = True) -> IndexedStat:
+        return self._stat
+
+    def __repr__(self):
+        return f"<IndexedEntry '{self.name}'>"
+
+
+class DirectoryIndex:
+    """
+    A SQLite index of directory listings.
+
+    `scandir(path)` is a drop-in replacement for `os.scandir` that answers from the index and only
+    reads the directory again when its mtime or inode changed.
+    """
+
+    def __init__(self, index_path: str, max_age: float = 1.0, racy_seconds: float = 2.0, max_directories: int = 1024):
+        self.index_path = index_path
+        self.max_age = max_age
+        # a directory modified this many seconds before it was read may change again within the same mtime tick
+        self.racy_seconds = racy_seconds
+        self.max_directories = max_directories
+        self._checked: OrderedDict[str, float] = OrderedDict()
+        # the entries of the directories by absolute path and path as passed to scandir, valid while unchanged
+        self._entries: OrderedDict[str, dict[str, list[IndexedEntry]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(index_path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._lock, self._connection:
+            version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS directories")
+                self._connection.execute("DROP TABLE IF EXISTS entries")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS directories (path TEXT PRIMARY KEY, mtime_ns INTEGER, inode INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (directory TEXT, name TEXT, is_dir INTEGER, is_file INTEGER,"
+                " is_symlink INTEGER, size INTEGER, mtime REAL, PRIMARY KEY (directory, name))"
+            )
+            self._connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _remember(self, cache: OrderedDict, directory: str, value) -> None:
+        """Store a value of a directory in one of the in-memory caches, dropping the least recently used ones"""
+        cache[directory] = value
+        cache.move_to_end(directory)
+        while len(cache) > self.max_directories:
+            cache.popitem(last=False)
+
+    def _read_directory(self, directory: str) -> list[tuple]:
+        rows = []
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                    size, mtime = st.st_size, st.st_mtime
+                except OSError:
+                    # e.g. a dangling symbolic link
+                    size, mtime = 0, 0.0
+                rows.append((directory, entry.name, entry.is_dir(), entry.is_file(), entry.is_symlink(), size, mtime))
+        return rows
+
+    def refresh(self, directory: str) -> None:
+        """Read the directory again when its signature changed since it was indexed"""
+        directory = os.path.abspath(directory)
+        now = time.monotonic()
+        if now - self._checked.get(directory, -float("inf")) < self.max_age:
+            return
+
+        # the signature is taken before reading, so a change while reading is noticed the next time
+        st = os.stat(directory)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT mtime_ns, inode FROM directories WHERE path = ?", (directory,)
+            ).fetchone()
+        if row != (st.st_mtime_ns, st.st_ino):
+            rows = self._read_directory(directory)
+            # a racy directory is stored without mtime, so it is read again the next time
+            racy = st.st_mtime_ns >= time.time_ns() - int(self.racy_seconds * 1e9)
+            with self._lock, self._connection:
+                self._entries.pop(directory, None)
+                self._connection.execute("DELETE FROM entries WHERE directory = ?", (directory,))
+                self._connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                    (directory, None if racy else st.st_mtime_ns, st.st_ino),
+                )
+            if racy:
+                self._checked.pop(directory, None)
+                return
+        with self._lock:
+            self._remember(self._checked, directory, now)
+
+    def scandir(self, path: str = "."):
+        """Like `os.scandir`, but the entries come from the index"""
+        self.refresh(path)
+        directory = os.path.abspath(path)
+        with self._lock:
+            paths = self._entries.get(directory, {})
+            entries = paths.get(path)
+            if entries is None:
+                rows = self._connection.execute(
+                    "SELECT name, is_dir, is_file, is_symlink, size, mtime FROM entries WHERE directory = ?", (directory,)
+                ).fetchall()
+                entries = paths[path] = [
+                    IndexedEntry(path, name, bool(is_dir), bool(is_file), bool(is_symlink), size, mtime)
+                    for name, is_dir, is_file, is_symlink, size, mtime in rows
+                ]
+            self._remember(self._entries, directory, paths)
+        return nullcontext(iter(entries))
+
+
+_indexes: dict[str, DirectoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_directory_index() -> Optional[DirectoryIndex]:
+    """Return the index configured by BASIC_DATA_HANDLING_DIRECTORY_INDEX, or None when it isn't enabled"""
+    setting = os.environ.get("BASIC_DATA_HANDLING_DIRECTORY_INDEX", "")
+    if setting.lower() in ("", "0", "false", "no"):
+        return None
+    if setting.lower() in ("1", "true", "yes"):
+        setting = os.path.join(get_output_directory(), INDEX_FILE_NAME)
+    index_path = os.path.abspath(setting)
+    with _indexes_lock:
+        if index_path not in _indexes:
+            _indexes[index_path] = DirectoryIndex(index_path)
+        return _indexes[index_path]
+
+
+def get_scandir():
+    """Return the `scandir` of the configured index, or `os.scandir` when it isn't enabled"""
+    index = get_directory_index()
+    return index.scandir if index is not None else os.scandir
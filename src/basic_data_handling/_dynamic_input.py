@@ -1,8 +1,15 @@
+_MISSING = object()
+# number of dynamic key lookups remembered by every ContainsDynamicDict
+DYNAMIC_KEY_CACHE_SIZE = 1024
+
+
 class ContainsDynamicDict(dict):
     """
     A custom dictionary that dynamically returns values for keys based on a pattern.
     - If a key in the passed dictionary has a value with `{"_dynamic": "number"}` in the tuple's second position,
       then any other key starting with the same string and ending with a number will return that value.
+    - If a key in the passed dictionary has a value with `{"_dynamic": "letter"}` in the tuple's second position,
+      then any other key starting with the same string and ending with a single letter will return that value.
     - For other keys, normal dictionary lookup behavior applies.
     """
 
@@ -14,18 +21,42 @@ class ContainsDynamicDict(dict):
             for key, value in self.items()
             if isinstance(value, tuple) and len(value) > 1 and value[1].get("_dynamic") == "number"
         }
+        self._dynamic_letter_prefixes = {
+            key[:-1]: value
+            for key, value in self.items()
+            if isinstance(value, tuple) and len(value) > 1 and value[1].get("_dynamic") == "letter"
+        }
+        # Memo of the dynamic lookups already done, ComfyUI asks for the same keys over and over
+        self._resolved = {}
+
+    def _resolve_dynamic(self, key):
+        # Split the key once into prefix and suffix and look the prefix up, instead of testing every prefix
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        value = _MISSING
+        if isinstance(key, str):
+            prefix = key.rstrip("0123456789")
+            if prefix != key and prefix in self._dynamic_prefixes:
+                value = self._dynamic_prefixes[prefix]
+            elif key[-1:].isascii() and key[-1:].isalpha() and key[:-1] in self._dynamic_letter_prefixes:
+                value = self._dynamic_letter_prefixes[key[:-1]]
+        if len(self._resolved) >= DYNAMIC_KEY_CACHE_SIZE:
+            # drop the oldest lookup, so the memo stays bounded
+            del self._resolved[next(iter(self._resolved))]
+        self._resolved[key] = value
+        return value
 
     def __contains__(self, key):
         # Check if key matches a dynamically handled prefix or exists normally
-        return (
-            any(key.startswith(prefix) and key[len(prefix):].isdigit() for prefix in self._dynamic_prefixes)
-            or super().__contains__(key)
-        )
+        return self._resolve_dynamic(key) is not _MISSING or super().__contains__(key)
 
     def __getitem__(self, key):
-        # Dynamically return the value for keys matching a `prefix<number>` pattern
-        for prefix, value in self._dynamic_prefixes.items():
-            if key.startswith(prefix) and key[len(prefix):].isdigit():
-                return value
+        # Dynamically return the value for keys matching a `prefix<number>` or `prefix<letter>` pattern
+        value = self._resolve_dynamic(key)
+        if value is not _MISSING:
+            return value
         # Fallback to normal dictionary behavior for other keys
         return super().__getitem__(key)
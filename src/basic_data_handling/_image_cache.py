@@ -0,0 +1,121 @@
+"""
+Process-wide cache of decoded images for the image and mask loaders.
+
+The loaded tensors are kept in a least recently used cache that is bounded by the bytes of the
+tensors. The key contains the real path, mtime and size of the file, so a changed file is never
+served from the cache. The cache is off by default, its cap is set in MB with the environment
+variable BASIC_DATA_HANDLING_IMAGE_CACHE_MB.
+
+Every load returns its own copy of the cached tensors, so a node that modifies its image in place
+doesn't change the cache for the other loads.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+DEFAULT_IMAGE_CACHE_MB = 0
+
+
+def tensors_nbytes(value: Any) -> int:
+    """Return the bytes of the tensors in a tensor or a tuple of tensors"""
+    if isinstance(value, tuple):
+        return sum(tensors_nbytes(item) for item in value)
+    if hasattr(value, "element_size") and hasattr(value, "nelement"):
+        return value.element_size() * value.nelement()
+    return 0
+
+
+def clone_tensors(value: Any) -> Any:
+    """Return a copy of a tensor or a tuple of tensors, other values are returned as they are"""
+    if isinstance(value, tuple):
+        return tuple(clone_tensors(item) for item in value)
+    if hasattr(value, "clone"):
+        return value.clone()
+    return value
+
+
+class ImageCache:
+    """A least recently used cache of tensors bounded by their size in bytes"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, bytes), with the least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, value: Any) -> None:
+        nbytes = tensors_nbytes(value)
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def load(self, path: str, mode: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Return a copy of the cached result of `loader(path)` for the current version of the file.
+
+        `mode` tells the different kinds of loads of the same file apart. Results that are None,
+        i.e. files that couldn't be loaded, aren't cached.
+        """
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return loader(path)
+        key = (os.path.realpath(path), st.st_mtime_ns, st.st_size, mode)
+        value = self.get(key)
+        if value is None:
+            value = loader(path)
+            if value is not None:
+                self.put(key, value)
+        return clone_tensors(value)
+
+
+_image_cache: Optional[ImageCache] = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Return the process-wide image cache, with the cap of BASIC_DATA_HANDLING_IMAGE_CACHE_MB"""
+    global _image_cache
+    with _image_cache_lock:
+        if _image_cache is None:
+            max_mb = float(os.environ.get("BASIC_DATA_HANDLING_IMAGE_CACHE_MB", DEFAULT_IMAGE_CACHE_MB))
+            _image_cache = ImageCache(int(max_mb * 1024 * 1024))
+        return _image_cache
+
+
+def load_cached(path: str, mode: str, loader: Callable[[str], Any]) -> Any:
+    """`loader(path)` through the process-wide image cache, see `ImageCache.load`"""
+    cache = get_image_cache()
+    if cache.max_bytes <= 0:
+        return loader(path)
+    return cache.load(path, mode, loader)
@@ -0,0 +1,75 @@
+from functools import wraps
+
+from ._dynamic_input import ContainsDynamicDict
+
+
+class _ReadOnlyMixin:
+    """
+    Makes a dict read-only.
+
+    `copy()`, `copy.copy()`, `copy.deepcopy()` and pickling return a normal, mutable
+    version of the dict, so code that needs to modify it works on its own copy.
+    """
+    _mutable_type: type = dict
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def copy(self):
+        return self._mutable_type(self)
+
+    def __reduce__(self):
+        return self._mutable_type, (dict(self),)
+
+
+class FrozenDict(_ReadOnlyMixin, dict):
+    """A read-only dict."""
+
+
+class FrozenContainsDynamicDict(_ReadOnlyMixin, ContainsDynamicDict):
+    """A read-only ContainsDynamicDict."""
+    _mutable_type = ContainsDynamicDict
+
+
+def freeze_input_types(input_types: dict) -> FrozenDict:
+    """
+    Return a read-only version of the INPUT_TYPES result.
+
+    The top level dict, the sections like "required" and "optional" and the options dicts of
+    the inputs are frozen. Lists (e.g. the choices of a combo) are left as they are, as ComfyUI
+    recognises combos by their type.
+    """
+    def freeze_input(spec):
+        if isinstance(spec, tuple):
+            return tuple(FrozenDict(item) if isinstance(item, dict) else item for item in spec)
+        return spec
+
+    sections = {}
+    for name, section in input_types.items():
+        frozen_type = FrozenContainsDynamicDict if isinstance(section, ContainsDynamicDict) else FrozenDict
+        sections[name] = frozen_type({key: freeze_input(spec) for key, spec in section.items()})
+    return FrozenDict(sections)
+
+
+def cached_input_types(input_types):
+    """
+    Decorator for the INPUT_TYPES classmethod of the nodes.
+
+    The INPUT_TYPES of the nodes don't change, but ComfyUI asks for them for every `/object_info`
+    request and every prompt validation. So they are built only once per class and returned as a
+    shared, read-only FrozenDict. Use it below `@classmethod`.
+    """
+    cache = {}
+
+    @wraps(input_types)
+    def wrapper(cls):
+        try:
+            return cache[cls]
+        except KeyError:
+            result = cache[cls] = freeze_input_types(input_types(cls))
+            return result
+
+    return wrapper
@@ -0,0 +1,142 @@
+"""
+Opt-in profiling of the nodes.
+
+When the environment variable BASIC_DATA_HANDLING_PROFILE is set to 1, the FUNCTION,
+`check_lazy_status` and `IS_CHANGED` methods of every node class are wrapped to record the number
+of calls, the wall time and the sizes of the inputs and outputs. Calls that raise are recorded as
+well and counted as errors. When it isn't set, nothing is wrapped at all, so there is no overhead.
+
+The records can be read with `get_profile()`, written as JSON with `dump_json()` or shown as a
+text table with `report()`. With BASIC_DATA_HANDLING_PROFILE_OUTPUT set to a file name, the JSON
+is also written there when the process exits.
+"""
+import atexit
+import inspect
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+PROFILED_METHODS = ("check_lazy_status", "IS_CHANGED")
+
+_profile: dict[str, dict[str, dict[str, Any]]] = {}
+_lock = threading.Lock()
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get("BASIC_DATA_HANDLING_PROFILE", "0").lower() not in ("", "0", "false", "no")
+
+
+def _size(value: Any) -> Optional[int]:
+    if isinstance(value, (list, tuple, dict, set, frozenset, str, bytes)):
+        return len(value)
+    return None
+
+
+def _total_size(values) -> int:
+    return sum(size for size in map(_size, values) if size is not None)
+
+
+def _record(node_name: str, method: str, elapsed: float, input_size: int, output_size: int, failed: bool) -> None:
+    with _lock:
+        entry = _profile.setdefault(node_name, {}).setdefault(method, {
+            "calls": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0,
+            "input_size_total": 0, "input_size_max": 0,
+            "output_size_total": 0, "output_size_max": 0,
+        })
+        entry["calls"] += 1
+        entry["errors"] += failed
+        entry["total_time"] += elapsed
+        entry["max_time"] = max(entry["max_time"], elapsed)
+        entry["input_size_total"] += input_size
+        entry["input_size_max"] = max(entry["input_size_max"], input_size)
+        entry["output_size_total"] += output_size
+        entry["output_size_max"] = max(entry["output_size_max"], output_size)
+
+
+def _profiled(node_name: str, method: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        outputs, failed = (), True
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            # the outputs of the FUNCTION are a tuple, or a dict with the tuple as "result"
+            outputs = result.get("result", ()) if isinstance(result, dict) else result
+            outputs = outputs if isinstance(outputs, tuple) else (outputs,)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            _record(node_name, method, elapsed, _total_size(kwargs.values()), _total_size(outputs), failed)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def instrument_node_class(node_name: str, node_class: type) -> None:
+    """Wrap the FUNCTION, `check_lazy_status` and `IS_CHANGED` of a node class to record their calls."""
+    for method in (node_class.FUNCTION, *PROFILED_METHODS):
+        try:
+            attribute = inspect.getattr_static(node_class, method)
+        except AttributeError:
+            continue
+        descriptor = type(attribute) if isinstance(attribute, (classmethod, staticmethod)) else None
+        func = attribute.__func__ if descriptor else attribute
+        if not callable(func):
+            continue
+        if getattr(func, "__profiled__", False):
+            if method in vars(node_class):
+                continue
+            # inherited from an already instrumented node class, record it for this node on its own
+            func = func.__wrapped__
+        wrapped = _profiled(node_name, method, func)
+        setattr(node_class, method, descriptor(wrapped) if descriptor else wrapped)
+
+
+def instrument_node_classes(node_class_mappings: dict[str, type]) -> None:
+    for node_name, node_class in node_class_mappings.items():
+        instrument_node_class(node_name, node_class)
+
+
+def get_profile() -> dict[str, dict[str, dict[str, Any]]]:
+    """Return a copy of the records: node name -> method -> statistics."""
+    with _lock:
+        return {node_name: {method: dict(entry) for method, entry in methods.items()}
+                for node_name, methods in _profile.items()}
+
+
+def reset_profile() -> None:
+    with _lock:
+        _profile.clear()
+
+
+def dump_json(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_profile(), f, indent=2, sort_keys=True)
+
+
+def report() -> str:
+    """Return the records as a text table, sorted by the total time."""
+    rows = [
+        (entry["total_time"], node_name, method, entry)
+        for node_name, methods in get_profile().items()
+        for method, entry in methods.items()
+    ]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    lines = [f"{'node':<50} {'method':<20} {'calls':>8} {'errors':>8} {'total s':>10} {'max s':>10} {'max in':>10}"
+             f" {'max out':>10}"]
+    for _, node_name, method, entry in rows:
+        lines.append(
+            f"{node_name:<50} {method:<20} {entry['calls']:>8} {entry['errors']:>8} {entry['total_time']:>10.4f}"
+            f" {entry['max_time']:>10.4f} {entry['input_size_max']:>10} {entry['output_size_max']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def setup_profiling_output() -> None:
+    output = os.environ.get("BASIC_DATA_HANDLING_PROFILE_OUTPUT")
+    if output:
+        atexit.register(dump_json, os.path.abspath(output))
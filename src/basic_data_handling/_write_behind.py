@@ -0,0 +1,106 @@
+"""
+Write-behind queue for the save nodes.
+
+In write-behind mode a save node only queues the encoding and writing of its files and returns
+right away, so the next nodes don't wait for the disk. A background thread works through the queue
+and writes every file atomically, first to a temporary file that is then renamed. The queue is
+bounded by BASIC_DATA_HANDLING_WRITE_BEHIND_QUEUE jobs (default 64), when it is full a save node
+waits for a free slot.
+
+Failed writes are reported by the next save node that runs in write-behind mode, and by the "flush
+pending writes" node that waits until everything queued so far is written. A synchronous save
+reports only its own errors.
+"""
+import atexit
+import os
+import queue
+import secrets
+import threading
+from typing import Callable, Optional
+
+DEFAULT_MAX_PENDING = 64
+
+
+def atomic_write(path: str, write: Callable[[str], None]) -> None:
+    """Call `write(temporary_path)`, sync the temporary file to the disk and rename it to `path`"""
+    directory, name = os.path.split(path)
+    temporary_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+    try:
+        write(temporary_path)
+        # the data must be on the disk before the rename, or a crash can leave an empty or truncated file
+        with open(temporary_path, "rb+") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+class WriteBehindQueue:
+    """A bounded queue of write jobs, run one after the other by a background thread"""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._failures: list[str] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while True:
+            description, job = self._queue.get()
+            try:
+                job()
+            except Exception as e:
+                with self._lock:
+                    self._failures.append(f"{description}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, description: str, job: Callable[[], None]) -> None:
+        """Queue a job, waiting while the queue is full"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="basic data handling writer", daemon=True)
+                self._thread.start()
+                # don't lose the queued writes when the process exits
+                atexit.register(self._queue.join)
+        self._queue.put((description, job))
+
+    def pending(self) -> int:
+        """Return the number of jobs that are queued or running"""
+        return self._queue.unfinished_tasks
+
+    def take_failures(self) -> list[str]:
+        """Return the failures since the last call"""
+        with self._lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def flush(self) -> list[str]:
+        """Wait until all queued jobs are done and return the failures since the last call"""
+        self._queue.join()
+        return self.take_failures()
+
+
+_write_behind_queue: Optional[WriteBehindQueue] = None
+_write_behind_queue_lock = threading.Lock()
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    """Return the process-wide write-behind queue, bounded by BASIC_DATA_HANDLING_WRITE_BEHIND_QUEUE"""
+    global _write_behind_queue
+    with _write_behind_queue_lock:
+        if _write_behind_queue is None:
+            max_pending = int(os.environ.get("BASIC_DATA_HANDLING_WRITE_BEHIND_QUEUE", DEFAULT_MAX_PENDING))
+            _write_behind_queue = WriteBehindQueue(max_pending)
+        return _write_behind_queue
+
+
+def report_write_failures() -> bool:
+    """Print the failed writes since the last call and return whether there were any"""
+    failures = get_write_behind_queue().take_failures()
+    for failure in failures:
+        print(f"Basic data handling: Error in a write-behind save: {failure}")
+    return bool(failures)
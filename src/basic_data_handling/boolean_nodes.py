@@ -14,6 +14,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 
 class BooleanAnd(ComfyNodeABC):
@@ -23,6 +24,7 @@ class BooleanAnd(ComfyNodeABC):
     This node takes two boolean inputs and returns their logical AND result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -47,6 +49,7 @@ class BooleanNand(ComfyNodeABC):
     This node takes two boolean inputs and returns their logical NAND result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -71,6 +74,7 @@ class BooleanNor(ComfyNodeABC):
     This node takes two boolean inputs and returns their logical NOR result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -95,6 +99,7 @@ class BooleanNot(ComfyNodeABC):
     This node takes one boolean input and returns its logical NOT result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -118,6 +123,7 @@ class BooleanOr(ComfyNodeABC):
     This node takes two boolean inputs and returns their logical OR result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -142,6 +148,7 @@ class BooleanXor(ComfyNodeABC):
     This node takes two boolean inputs and returns their logical XOR result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -168,6 +175,7 @@ class GenericOr(ComfyNodeABC):
     `false`, an integer 0 is also `false`, etc.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -196,6 +204,7 @@ class GenericAnd(ComfyNodeABC):
     `false`, an integer 0 is also `false`, etc.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
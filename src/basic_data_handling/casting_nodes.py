@@ -13,11 +13,14 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 class CastToBoolean(ComfyNodeABC):
     """
     Converts any input to a BOOLEAN. Follows standard Python truthy/falsy rules.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -39,6 +42,7 @@ class CastToDict(ComfyNodeABC):
     Converts compatible inputs to a DICT. Input must be a mapping or a list of key-value pairs.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -63,6 +67,7 @@ class CastToFloat(ComfyNodeABC):
     Converts any numeric input to a FLOAT. Non-numeric or invalid inputs raise a ValueError.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -87,6 +92,7 @@ class CastToInt(ComfyNodeABC):
     Converts any numeric input to an INT. Non-numeric or invalid inputs raise a ValueError.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -112,6 +118,7 @@ class CastToList(ComfyNodeABC):
     it converts the individual items into a Python LIST.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -136,6 +143,7 @@ class CastToSet(ComfyNodeABC):
     it casts the individual items into a SET.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -159,6 +167,7 @@ class CastToString(ComfyNodeABC):
     Converts any input to a STRING. Non-string values are converted using str().
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -13,6 +13,8 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 class Equal(ComfyNodeABC):
     """
     Checks if two values are equal.
@@ -21,6 +23,7 @@ class Equal(ComfyNodeABC):
     and False otherwise. For complex objects, structural equality is tested.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -47,6 +50,7 @@ class NotEqual(ComfyNodeABC):
     and False otherwise. For complex objects, structural inequality is tested.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -77,6 +81,7 @@ class LessThan(ComfyNodeABC):
     is less than the second value, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -103,6 +108,7 @@ class LessThanOrEqual(ComfyNodeABC):
     is less than or equal to the second value, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -129,6 +135,7 @@ class GreaterThan(ComfyNodeABC):
     is greater than the second value, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -155,6 +162,7 @@ class GreaterThanOrEqual(ComfyNodeABC):
     is greater than or equal to the second value, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -181,6 +189,7 @@ class IsNull(ComfyNodeABC):
     and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -207,6 +216,7 @@ class NumberInRange(ComfyNodeABC):
     whether the bounds are inclusive or exclusive.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -242,6 +252,7 @@ class CompareLength(ComfyNodeABC):
     result based on the comparison of the container's length with the value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -288,6 +299,7 @@ class StringComparison(ComfyNodeABC):
     a boolean result based on the selected comparison.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -16,6 +16,7 @@ except:
     ExecutionBlocker = lambda x: x
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 
 class IfElse(ComfyNodeABC):
@@ -27,6 +28,7 @@ class IfElse(ComfyNodeABC):
     is returned. This allows conditional data flow in ComfyUI workflows.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -65,6 +67,7 @@ class IfElifElse(ComfyNodeABC):
     This allows conditional data flow in ComfyUI workflows.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -154,6 +157,7 @@ class SwitchCase(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": ContainsDynamicDict({
@@ -222,6 +226,7 @@ class ContinueFlow(ComfyNodeABC):
     Leave it empty for silent operation.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -256,6 +261,7 @@ class FlowSelect(ComfyNodeABC):
     "filter select" instead.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -289,6 +295,7 @@ class ForceCalculation(ComfyNodeABC):
     OUTPUT_NODE = True  # Marks as an output node to force calculation
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -323,6 +330,7 @@ class ExecutionOrder(ComfyNodeABC):
     its second output.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": {
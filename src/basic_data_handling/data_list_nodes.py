@@ -1,5 +1,7 @@
 from typing import Any
 from inspect import cleandoc
+from itertools import compress
+from operator import not_
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -14,6 +16,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 INT_MAX = 2**15-1 # the computer can do more but be nice to the eyes
 
@@ -26,6 +29,7 @@ class DataListCreate(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -55,6 +59,7 @@ class DataListListCreate(ComfyNodeABC):
     Each input can be a list, so you'll get a list of lists.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -83,6 +88,7 @@ class DataListCreateFromBoolean(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -110,6 +116,7 @@ class DataListCreateFromFloat(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -137,6 +144,7 @@ class DataListCreateFromInt(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -164,6 +172,7 @@ class DataListCreateFromString(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -190,6 +199,7 @@ class DataListAll(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -215,6 +225,7 @@ class DataListAny(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -241,6 +252,7 @@ class DataListAppend(ComfyNodeABC):
     list with the new item appended.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": {
@@ -273,6 +285,7 @@ class DataListContains(ComfyNodeABC):
     is present in the list, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -303,6 +316,7 @@ class DataListCount(ComfyNodeABC):
     the value appears in the list.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -330,6 +344,7 @@ class DataListEnumerate(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -362,6 +377,7 @@ class DataListExtend(ComfyNodeABC):
     all elements from both lists.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": {
@@ -394,6 +410,7 @@ class DataListFilter(ComfyNodeABC):
     till the lengths are matching.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -415,7 +432,7 @@ class DataListFilter(ComfyNodeABC):
         filters = kwargs.get('filter', [])
 
         # Create a new list with only items where the filter is False
-        result = [_val for _val, _filter in zip(values, filters) if not _filter]
+        result = list(compress(values, map(not_, filters)))
 
         return (result,)
 
@@ -432,6 +449,7 @@ class DataListFilterSelect(ComfyNodeABC):
     till the lengths are matching.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -468,6 +486,7 @@ class DataListFirst(ComfyNodeABC):
     If the list is empty, it returns None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -496,6 +515,7 @@ class DataListGetItem(ComfyNodeABC):
     Out of range indices return None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -528,6 +548,7 @@ class DataListIndex(ComfyNodeABC):
     of the list. Returns -1 if the value is not present.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -569,6 +590,7 @@ class DataListInsert(ComfyNodeABC):
     list with the item inserted at the specified index.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -600,6 +622,7 @@ class DataListLast(ComfyNodeABC):
     If the list is empty, it returns None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -626,6 +649,7 @@ class DataListLength(ComfyNodeABC):
     This node takes a list as input and returns its length as an integer.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -653,6 +677,7 @@ class DataListMax(ComfyNodeABC):
     non-numeric values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -689,6 +714,7 @@ class DataListMin(ComfyNodeABC):
     non-numeric values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -726,6 +752,7 @@ class DataListPop(ComfyNodeABC):
     When the list is empty, the item is None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -762,6 +789,7 @@ class DataListPopRandom(ComfyNodeABC):
     and the removed element itself. If the list is empty, it returns None for the element.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -798,6 +826,7 @@ class DataListRange(ComfyNodeABC):
     It takes start, stop, and step parameters to define the sequence.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -829,6 +858,7 @@ class DataListRemove(ComfyNodeABC):
     the first occurrence of the value removed. Raises a ValueError if the value is not present.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -862,6 +892,7 @@ class DataListReverse(ComfyNodeABC):
     This node takes a list as input and returns a new list with the items in reversed order.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -891,6 +922,7 @@ class DataListSetItem(ComfyNodeABC):
     the item at the specified index replaced by the value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -928,6 +960,7 @@ class DataListSlice(ComfyNodeABC):
     containing the specified slice of the original list.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -965,6 +998,7 @@ class DataListSort(ComfyNodeABC):
     Options include sorting in reverse order and using a key function.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -998,6 +1032,7 @@ class DataListSum(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1031,6 +1066,7 @@ class DataListZip(ComfyNodeABC):
     The length of the output list will be equal to the length of the shortest input list.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1073,6 +1109,7 @@ class DataListToList(ComfyNodeABC):
     and converts it to a LIST object (a Python list as a single variable).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1098,6 +1135,7 @@ class DataListToSet(ComfyNodeABC):
     and converts it to a LIST object (a Python list as a single variable).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
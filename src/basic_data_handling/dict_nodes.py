@@ -14,6 +14,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 
 class DictCreate(ComfyNodeABC):
@@ -23,6 +24,7 @@ class DictCreate(ComfyNodeABC):
     This node creates and returns a new empty dictionary object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -54,6 +56,7 @@ class DictCreateFromBoolean(ComfyNodeABC):
     This node creates and returns a new empty dictionary object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -85,6 +88,7 @@ class DictCreateFromFloat(ComfyNodeABC):
     This node creates and returns a new empty dictionary object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -116,6 +120,7 @@ class DictCreateFromInt(ComfyNodeABC):
     This node creates and returns a new empty dictionary object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -147,6 +152,7 @@ class DictCreateFromString(ComfyNodeABC):
     This node creates and returns a new empty dictionary object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -178,6 +184,7 @@ class DictCreateFromItemsDataList(ComfyNodeABC):
     This node takes a list of key-value pairs (tuples) and builds a dictionary from them.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -211,6 +218,7 @@ class DictCreateFromItemsList(ComfyNodeABC):
     This node takes a list of key-value pairs (tuples) and builds a dictionary from them.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -244,6 +252,7 @@ class DictCreateFromLists(ComfyNodeABC):
     lengths, only pairs up to the length of the shorter list are used.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -272,6 +281,7 @@ class DictCompare(ComfyNodeABC):
     different values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -311,6 +321,7 @@ class DictContainsKey(ComfyNodeABC):
     exists in the dictionary, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -336,6 +347,7 @@ class DictExcludeKeys(ComfyNodeABC):
     containing all key-value pairs except those with keys in the provided list.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -362,6 +374,7 @@ class DictFilterByKeys(ComfyNodeABC):
     containing only the key-value pairs for the keys that exist in the original dictionary.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -389,6 +402,7 @@ class DictFromKeys(ComfyNodeABC):
     provided, None is used.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -417,6 +431,7 @@ class DictGet(ComfyNodeABC):
     Otherwise, it returns None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -446,6 +461,7 @@ class DictGetKeysValues(ComfyNodeABC):
     all keys and another containing all corresponding values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -474,6 +490,7 @@ class DictGetMultiple(ComfyNodeABC):
     value is used for that position.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -505,6 +522,7 @@ class DictInvert(ComfyNodeABC):
     hashable to be used as keys in the new dictionary.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -535,6 +553,7 @@ class DictItems(ComfyNodeABC):
     contains a key-value pair from the dictionary.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -558,6 +577,7 @@ class DictKeys(ComfyNodeABC):
     This node takes a dictionary and returns a list containing all of its keys.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -581,6 +601,7 @@ class DictLength(ComfyNodeABC):
     This node takes a dictionary as input and returns its length (number of items).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -606,6 +627,7 @@ class DictMerge(ComfyNodeABC):
     dictionary. If there are duplicate keys, values from later dictionaries take precedence.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -648,6 +670,7 @@ class DictPop(ComfyNodeABC):
     that default is returned. Otherwise, an error is raised.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -687,6 +710,7 @@ class DictPopItem(ComfyNodeABC):
     If the dictionary is empty, returns an error.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -721,6 +745,7 @@ class DictPopRandom(ComfyNodeABC):
     If the dictionary is empty, it returns empty values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -761,6 +786,7 @@ class DictRemove(ComfyNodeABC):
     the dictionary remains unchanged.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -791,6 +817,7 @@ class DictSet(ComfyNodeABC):
     a modified dictionary with the new key-value pair.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -820,6 +847,7 @@ class DictSetDefault(ComfyNodeABC):
     exist, the default value is inserted for the key and returned.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -850,6 +878,7 @@ class DictUpdate(ComfyNodeABC):
     keys, the values from the second dictionary take precedence.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -876,6 +905,7 @@ class DictValues(ComfyNodeABC):
     This node takes a dictionary and returns a list containing all of its values.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
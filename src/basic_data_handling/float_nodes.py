@@ -12,6 +12,8 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 
 class FloatCreate(ComfyNodeABC):
     """
@@ -21,6 +23,7 @@ class FloatCreate(ComfyNodeABC):
     directly converted to a FLOAT without any further processing.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -44,6 +47,7 @@ class FloatAdd(ComfyNodeABC):
     This node takes two floats as input and returns their sum.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -69,6 +73,7 @@ class FloatSubtract(ComfyNodeABC):
     the second float from the first.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -93,6 +98,7 @@ class FloatMultiply(ComfyNodeABC):
     This node takes two floats as input and returns their product.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -118,6 +124,7 @@ class FloatDivide(ComfyNodeABC):
     It raises a ValueError if the divisor is 0.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -145,6 +152,7 @@ class FloatDivideSafe(ComfyNodeABC):
     It returns positive or negative infinity if the divisor is 0 (assumed to be +0.0).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -174,6 +182,7 @@ class FloatAsIntegerRatio(ComfyNodeABC):
     which represent the ratio as numerator and denominator.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -200,6 +209,7 @@ class FloatFromHex(ComfyNodeABC):
     This node takes a hexadecimal float string as input and returns the float.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -223,6 +233,7 @@ class FloatHex(ComfyNodeABC):
     This node takes a float as input and returns its hexadecimal string representation.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -247,6 +258,7 @@ class FloatIsInteger(ComfyNodeABC):
     is an integer, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -271,6 +283,7 @@ class FloatPower(ComfyNodeABC):
     the first float to the power of the second.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -296,6 +309,7 @@ class FloatRound(ComfyNodeABC):
     and returns the rounded result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
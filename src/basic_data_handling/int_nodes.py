@@ -13,6 +13,8 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 
 class IntCreate(ComfyNodeABC):
     """
@@ -27,6 +29,7 @@ class IntCreate(ComfyNodeABC):
     Note: This doesn't handle ones' complement as the data size is unknown.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -51,6 +54,7 @@ class IntCreateWithBase(ComfyNodeABC):
     directly converted to an INT without any further processing.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -75,6 +79,7 @@ class IntAdd(ComfyNodeABC):
     This node takes two integers as input and returns their sum.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -100,6 +105,7 @@ class IntSubtract(ComfyNodeABC):
     the second integer from the first.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -124,6 +130,7 @@ class IntMultiply(ComfyNodeABC):
     This node takes two integers as input and returns their product.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -149,6 +156,7 @@ class IntDivide(ComfyNodeABC):
     division. It raises a ValueError if the divisor is 0.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -176,6 +184,7 @@ class IntDivideSafe(ComfyNodeABC):
     division. It returns the positive or negative infinity value if the divisor is 0.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -203,6 +212,7 @@ class IntBitCount(ComfyNodeABC):
     This node takes an integer as input and returns the count of set bits.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -228,6 +238,7 @@ class IntBitLength(ComfyNodeABC):
     to represent it, excluding the sign and leading zeros.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -252,6 +263,7 @@ class IntFromBytes(ComfyNodeABC):
     returns an integer.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -279,6 +291,7 @@ class IntModulus(ComfyNodeABC):
     first integer is divided by the second.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -306,6 +319,7 @@ class IntPower(ComfyNodeABC):
     the first integer to the power of the second.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -331,6 +345,7 @@ class IntToBytes(ComfyNodeABC):
     returns the bytes object representation of the integer.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
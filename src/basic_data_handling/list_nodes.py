@@ -14,6 +14,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 INT_MAX = 2**15-1 # the computer can do more but be nice to the eyes
 
@@ -26,6 +27,7 @@ class ListCreate(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -51,6 +53,7 @@ class ListCreateFromBoolean(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -76,6 +79,7 @@ class ListCreateFromFloat(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -101,6 +105,7 @@ class ListCreateFromInt(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -126,6 +131,7 @@ class ListCreateFromString(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -150,6 +156,7 @@ class ListAll:
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls) -> dict:
         return {
             "required": {
@@ -173,6 +180,7 @@ class ListAny:
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls) -> dict:
         return {
             "required": {
@@ -197,6 +205,7 @@ class ListAppend(ComfyNodeABC):
     with the item appended to the end.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -224,6 +233,7 @@ class ListContains(ComfyNodeABC):
     is present in the LIST, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -250,6 +260,7 @@ class ListCount(ComfyNodeABC):
     the value appears in the LIST.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -275,6 +286,7 @@ class ListEnumerate:
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls) -> dict:
         return {
             "required": {
@@ -302,6 +314,7 @@ class ListExtend(ComfyNodeABC):
     all elements from both lists.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -329,6 +342,7 @@ class ListFirst(ComfyNodeABC):
     If the LIST is empty, it returns None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -355,6 +369,7 @@ class ListGetItem(ComfyNodeABC):
     Out of range indices return None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -385,6 +400,7 @@ class ListIndex(ComfyNodeABC):
     of the LIST. Returns -1 if the value is not present.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -421,6 +437,7 @@ class ListInsert(ComfyNodeABC):
     LIST with the item inserted at the specified index.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -449,6 +466,7 @@ class ListLast(ComfyNodeABC):
     If the LIST is empty, it returns None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -473,6 +491,7 @@ class ListLength(ComfyNodeABC):
     This node takes a LIST as input and returns its length as an integer.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -498,6 +517,7 @@ class ListMax(ComfyNodeABC):
     Returns None if the LIST is empty or if items are not comparable.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -530,6 +550,7 @@ class ListMin(ComfyNodeABC):
     Returns None if the LIST is empty or if items are not comparable.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -564,6 +585,7 @@ class ListPop(ComfyNodeABC):
     When the LIST is empty, the item is None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -597,6 +619,7 @@ class ListPopRandom(ComfyNodeABC):
     and the removed element itself. If the LIST is empty, it returns None for the element.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -632,6 +655,7 @@ class ListRange(ComfyNodeABC):
     It takes start, stop, and step parameters to define the sequence.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -663,6 +687,7 @@ class ListRemove(ComfyNodeABC):
     is not present, the original LIST is returned with success set to False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -693,6 +718,7 @@ class ListReverse(ComfyNodeABC):
     This node takes a LIST as input and returns a new LIST with the items in reversed order.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -719,6 +745,7 @@ class ListSetItem(ComfyNodeABC):
     the item at the specified index replaced by the value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -749,6 +776,7 @@ class ListSlice(ComfyNodeABC):
     containing the specified slice of the original LIST.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -778,6 +806,7 @@ class ListSort(ComfyNodeABC):
     Option includes sorting in reverse order.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -813,6 +842,7 @@ class ListSum:
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls) -> dict:
         return {
             "required": {
@@ -842,6 +872,7 @@ class ListToDataList(ComfyNodeABC):
     individually by nodes that accept data lists.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -867,6 +898,7 @@ class ListToSet(ComfyNodeABC):
     from the LIST, removing any duplicates.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1,6 +1,9 @@
 import re
 import math
+import operator
+from functools import lru_cache
 from inspect import cleandoc
+from typing import Any, Callable, Optional
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -16,6 +19,96 @@ except ImportError:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
+
+
+def _checked_division(name: str, func: Callable[[float, float], float]) -> Callable[[float, float], float]:
+    def divide(a: float, b: float) -> float:
+        if b == 0:
+            raise ZeroDivisionError(f"Division by zero in operator '{name}'.")
+        return func(a, b)
+    return divide
+
+
+def _bind(func: Callable, operands: tuple[int, ...]) -> Callable[[list], Any]:
+    """Bind a function to the registers it reads, so executing it needs no lookups at all."""
+    if len(operands) == 0:
+        return lambda registers: func()
+    if len(operands) == 1:
+        i, = operands
+        return lambda registers: func(registers[i])
+    i, j = operands
+    return lambda registers: func(registers[i], registers[j])
+
+
+class FormulaProgram:
+    """
+    A formula compiled to a flat list of instructions working on registers.
+
+    The registers start with the values of the variables, followed by the constants. Each
+    instruction reads its operands from the registers and appends its result as a new register,
+    so the program runs in a single loop without any string comparisons or dictionary lookups.
+
+    `instructions` keeps the `(name, operands)` of every step and `disassemble()` prints the whole
+    program for debugging.
+    """
+
+    def __init__(self, postfix: tuple, variables: tuple[str, ...], constants: list[float],
+                 instructions: list[tuple[str, tuple[int, ...]]], steps: list[Callable[[list], Any]], result: int):
+        self.postfix = postfix
+        self.variables = variables
+        self.constants = constants
+        self.instructions = instructions
+        self.steps = steps
+        self.result = result
+
+    def evaluate(self, variables: dict) -> float:
+        """
+        Run the program with the variables of a dict.
+
+        All variables are checked before anything is calculated, so a missing variable is reported
+        even when the formula would raise an error, like `1 / 0`, before reaching it.
+        """
+        values = []
+        for var_name in self.variables:
+            if var_name not in variables:
+                raise ValueError(f"Variable '{var_name}' was not provided.")
+            values.append(float(variables[var_name]))
+        return self.run(values)
+
+    def run(self, values: list[float]) -> float:
+        """Run the program with the variable values given in the order of `variables`."""
+        registers = values + self.constants
+        append = registers.append
+        for step in self.steps:
+            append(step(registers))
+        return registers[self.result]
+
+    def register_name(self, index: int) -> str:
+        if index < len(self.variables):
+            return self.variables[index]
+        if index < len(self.variables) + len(self.constants):
+            return repr(self.constants[index - len(self.variables)])
+        return f"r{index}"
+
+    def disassemble(self) -> str:
+        first = len(self.variables) + len(self.constants)
+        lines = []
+        for n, (name, operands) in enumerate(self.instructions):
+            args = [self.register_name(i) for i in operands]
+            if name == "_NEG":
+                expression = f"-{args[0]}"
+            elif name in MathFormula.OPERATORS:
+                expression = f"{args[0]} {name} {args[1]}"
+            else:
+                expression = f"{name}({', '.join(args)})"
+            lines.append(f"r{first + n} = {expression}")
+        lines.append(f"return {self.register_name(self.result)}")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"<FormulaProgram variables={self.variables} instructions={len(self.instructions)}>"
+
 
 class MathFormula(ComfyNodeABC):
     """
@@ -23,7 +116,8 @@ class MathFormula(ComfyNodeABC):
 
     This node takes an arbitrary number of numerical inputs (single letters like `a`, `b`, `c`, etc.) and safely
     evaluates the formula with supported operations: +, -, *, /, //, %, **, parentheses, and mathematical
-    functions.
+    functions. Every variable of the formula must have an input, a missing one is reported before
+    anything is calculated.
 
     NOTE on Operator Precedence: This parser uses standard precedence rules. Unary minus binds tightly,
     so expressions like `-a ** 2` are interpreted as `(-a) ** 2`. To calculate `-(a ** 2)`,
@@ -41,6 +135,7 @@ class MathFormula(ComfyNodeABC):
     """
 
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -76,6 +171,27 @@ class MathFormula(ComfyNodeABC):
         "_NEG": (5, "RIGHT", 1), # Unary has higher precedence than exponentiation
     }
     OPERATORS = set(OPERATOR_PROPS.keys())
+    BINARY_OPERATORS = {op for op, props in OPERATOR_PROPS.items() if props[2] == 2}
+
+    OPERATOR_IMPLEMENTATIONS = {
+        "+": operator.add,
+        "-": operator.sub,
+        "*": operator.mul,
+        "/": _checked_division("/", operator.truediv),
+        "//": _checked_division("//", operator.floordiv),
+        "%": _checked_division("%", operator.mod),
+        "**": operator.pow,
+        "_NEG": operator.neg,
+    }
+
+    FUNC_IMPLEMENTATIONS = {
+        "pi": lambda: math.pi, "e": lambda: math.e, "abs": abs, "floor": math.floor, "ceil": math.ceil,
+        "round": round, "sin": math.sin, "cos": math.cos, "tan": math.tan, "asin": math.asin,
+        "acos": math.acos, "atan": math.atan, "degrees": math.degrees, "radians": math.radians,
+        "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh, "asinh": math.asinh, "acosh": math.acosh,
+        "atanh": math.atanh, "exp": math.exp, "log": math.log, "log10": math.log10, "log2": math.log2,
+        "sqrt": math.sqrt, "pow": math.pow, "atan2": math.atan2, "min": min, "max": max,
+    }
 
     TOKEN_REGEX = re.compile(
         r"([a-zA-Z_][a-zA-Z0-9_]*)"
@@ -84,11 +200,28 @@ class MathFormula(ComfyNodeABC):
     )
 
     def evaluate(self, formula: str, **kwargs) -> tuple[float]:
-        tokens = self.tokenize_formula(formula)
-        postfix_tokens = self.infix_to_postfix(tokens)
-        result = self.evaluate_postfix(postfix_tokens, kwargs)
+        program = self.compile_formula(formula)
+        result = program.evaluate(kwargs)
         return (result,)
 
+    def compile_formula(self, formula: str) -> FormulaProgram:
+        """
+        Tokenize the formula, convert it to postfix notation and compile it to a FormulaProgram.
+
+        The result only depends on the formula text, so it is kept in a bounded LRU cache
+        and repeated evaluations of the same formula skip the parsing.
+        """
+        return _compile_formula(type(self), formula)
+
+    @classmethod
+    def cache_info(cls):
+        """Return the hits, misses, maxsize and currsize of the compiled formula cache."""
+        return _compile_formula.cache_info()
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        _compile_formula.cache_clear()
+
     def tokenize_formula(self, formula: str) -> list[str]:
         allowed_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.,+-*/%() \t\n\r"
         for char in formula:
@@ -100,7 +233,6 @@ class MathFormula(ComfyNodeABC):
         output_queue = []
         op_stack = []
         prev_token = None
-        binary_operators = {op for op, props in self.OPERATOR_PROPS.items() if props[2] == 2}
 
         for i, token in enumerate(tokens):
             if self.is_number(token):
@@ -136,7 +268,7 @@ class MathFormula(ComfyNodeABC):
                 if op_stack and op_stack[-1] in self.SUPPORTED_FUNCTIONS:
                     output_queue.append(op_stack.pop())
             elif token in self.OPERATORS:
-                is_unary = token == '-' and (prev_token is None or prev_token in binary_operators or prev_token in ['(', ','])
+                is_unary = token == '-' and (prev_token is None or prev_token in self.BINARY_OPERATORS or prev_token in ['(', ','])
                 op_to_push = "_NEG" if is_unary else token
                 props = self.OPERATOR_PROPS[op_to_push]
                 prec = props[0]
@@ -162,6 +294,74 @@ class MathFormula(ComfyNodeABC):
 
         return output_queue
 
+    def compile_postfix(self, postfix: list) -> FormulaProgram:
+        """
+        Compile the postfix tokens to a FormulaProgram.
+
+        The stack of the postfix evaluation is resolved at compile time into register indices,
+        so the structural errors of the formula are already raised here.
+
+        While compiling, subexpressions without variables are calculated once (constant folding)
+        and repeated subexpressions are only calculated the first time (common subexpression
+        elimination). A constant subexpression that raises an error, like `1 / 0`, is not folded
+        but kept in the program, so the error is still raised when the formula is evaluated, after
+        the check for missing variables.
+        """
+        # The stack holds references: ("VAR", name), ("CONST", repr(value), value) or ("REG", instruction)
+        implementations = {**self.OPERATOR_IMPLEMENTATIONS, **self.FUNC_IMPLEMENTATIONS}
+        instructions: list[tuple[str, tuple]] = []
+        known: dict[tuple, tuple] = {}
+        stack: list[tuple] = []
+        for token in postfix:
+            if isinstance(token, float):
+                stack.append(("CONST", repr(token), token))
+                continue
+            if isinstance(token, tuple):
+                stack.append(("VAR", token[1]))
+                continue
+            if token in self.OPERATORS:
+                arity = self.OPERATOR_PROPS[token][2]
+                if len(stack) < arity:
+                    raise ValueError(f"Operator '{token}' needs {arity} operand(s).")
+            elif token in self.SUPPORTED_FUNCTIONS:
+                arity = self.FUNC_ARITIES[token]
+                if len(stack) < arity:
+                    raise ValueError(f"Function '{token}' needs {arity} argument(s).")
+            else:
+                raise ValueError(f"Internal error: Unknown token in postfix queue: {token}")
+            operands = tuple(stack[len(stack) - arity:])
+            del stack[len(stack) - arity:]
+
+            key = (token, operands)
+            if key not in known:
+                known[key] = ("REG", len(instructions))
+                if all(operand[0] == "CONST" for operand in operands):
+                    try:
+                        value = implementations[token](*[operand[2] for operand in operands])
+                        known[key] = ("CONST", repr(value), value)
+                    except (ArithmeticError, ValueError, TypeError):
+                        pass
+                if known[key][0] == "REG":
+                    instructions.append(key)
+            stack.append(known[key])
+
+        if len(stack) != 1:
+            raise ValueError("Invalid expression. The formula may be incomplete or have extra values.")
+
+        variables = tuple(dict.fromkeys(token[1] for token in postfix if isinstance(token, tuple)))
+        registers = {("VAR", var_name): index for index, var_name in enumerate(variables)}
+        constants = []
+        for operand in [operand for _, operands in instructions for operand in operands] + stack:
+            if operand[0] == "CONST" and operand not in registers:
+                registers[operand] = len(variables) + len(constants)
+                constants.append(operand[2])
+        for index in range(len(instructions)):
+            registers[("REG", index)] = len(variables) + len(constants) + index
+
+        instructions = [(name, tuple(registers[operand] for operand in operands)) for name, operands in instructions]
+        steps = [_bind(implementations[name], operands) for name, operands in instructions]
+        return FormulaProgram(tuple(postfix), variables, constants, instructions, steps, registers[stack[0]])
+
     def evaluate_postfix(self, postfix: list, variables: dict) -> float:
         stack = []
         for token in postfix:
@@ -200,52 +400,14 @@ class MathFormula(ComfyNodeABC):
         return stack[0]
 
     def apply_operator(self, a: float, b: float, operator: str) -> float:
-        if operator == "+": return a + b
-        if operator == "-": return a - b
-        if operator == "*": return a * b
-        if operator == "**": return a ** b
-        if b == 0 and operator in ['/', '//', '%']:
-            raise ZeroDivisionError(f"Division by zero in operator '{operator}'.")
-        if operator == "/": return a / b
-        if operator == "//": return a // b
-        if operator == "%": return a % b
-        raise ValueError(f"Unsupported operator: {operator}")
+        if operator not in self.BINARY_OPERATORS:
+            raise ValueError(f"Unsupported operator: {operator}")
+        return self.OPERATOR_IMPLEMENTATIONS[operator](a, b)
 
     def apply_function(self, func: str, args: list) -> float:
-        if func == "pi": return math.pi
-        if func == "e": return math.e
-        if len(args) == 1:
-            arg = args[0]
-            if func == "abs": return abs(arg)
-            if func == "floor": return math.floor(arg)
-            if func == "ceil": return math.ceil(arg)
-            if func == "round": return round(arg)
-            if func == "sin": return math.sin(arg)
-            if func == "cos": return math.cos(arg)
-            if func == "tan": return math.tan(arg)
-            if func == "asin": return math.asin(arg)
-            if func == "acos": return math.acos(arg)
-            if func == "atan": return math.atan(arg)
-            if func == "degrees": return math.degrees(arg)
-            if func == "radians": return math.radians(arg)
-            if func == "sinh": return math.sinh(arg)
-            if func == "cosh": return math.cosh(arg)
-            if func == "tanh": return math.tanh(arg)
-            if func == "asinh": return math.asinh(arg)
-            if func == "acosh": return math.acosh(arg)
-            if func == "atanh": return math.atanh(arg)
-            if func == "exp": return math.exp(arg)
-            if func == "log": return math.log(arg)
-            if func == "log10": return math.log10(arg)
-            if func == "log2": return math.log2(arg)
-            if func == "sqrt": return math.sqrt(arg)
-        if len(args) == 2:
-            a, b = args[0], args[1]
-            if func == "pow": return math.pow(a, b)
-            if func == "atan2": return math.atan2(a, b)
-            if func == "min": return min(a, b)
-            if func == "max": return max(a, b)
-        raise ValueError(f"Internal error: apply_function called with wrong number of args for '{func}'")
+        if func not in self.FUNC_IMPLEMENTATIONS or len(args) != self.FUNC_ARITIES[func]:
+            raise ValueError(f"Internal error: apply_function called with wrong number of args for '{func}'")
+        return self.FUNC_IMPLEMENTATIONS[func](*args)
 
     def is_number(self, value: str) -> bool:
         try:
@@ -254,10 +416,114 @@ class MathFormula(ComfyNodeABC):
         except (ValueError, TypeError):
             return False
 
+
+class MathFormulaDataList(MathFormula):
+    """
+    Evaluates a mathematical formula for every element of the connected Data Lists.
+
+    This node works like the formula node, but each variable input (`a`, `b`, `c`, etc.) can be
+    a Data List. The formula is parsed only once and then evaluated for all elements, vectorized
+    with NumPy when it is available and the formula only uses +, -, *, /, abs, sqrt, min, max, pi
+    and e, whose NumPy results are bit-identical to the formula node. The result is a Data List of
+    FLOATs.
+
+    If the lists have different lengths, the last element of the shorter list is repeated
+    till the lengths are matching.
+
+    Errors like a division by zero or a math domain error are raised exactly as in the
+    formula node.
+    """
+    RETURN_TYPES = (IO.FLOAT,)
+    RETURN_NAMES = ("list",)
+    CATEGORY = "Basic/maths"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "evaluate_list"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True,)
+
+    def evaluate_list(self, formula: list[str], **kwargs: list[Any]) -> tuple[list[float]]:
+        program = self.compile_formula(formula[0])
+        for var_name in program.variables:
+            if var_name not in kwargs:
+                raise ValueError(f"Variable '{var_name}' was not provided.")
+        variables = [kwargs[var_name] for var_name in program.variables]
+
+        length = max((len(values) for values in variables), default=1)
+        if any(len(values) == 0 for values in variables):
+            return ([],)
+        columns = [list(values) + [values[-1]] * (length - len(values)) for values in variables]
+
+        result = self.evaluate_program_numpy(program, columns, length)
+        if result is None:
+            columns = [[float(value) for value in values] for values in columns]
+            rows = zip(*columns) if columns else [()]
+            run = program.run
+            result = [run(list(row)) for row in rows]
+        return (result,)
+
+    def evaluate_program_numpy(self, program: FormulaProgram, columns: list[list], length: int) -> Optional[list[float]]:
+        """
+        Run the compiled program on whole columns with NumPy ufuncs.
+
+        Returns None when NumPy isn't available or when the vectorized evaluation can't
+        guarantee the same result as the scalar path, i.e. for non-finite inputs, for operations
+        that aren't correctly rounded in both (NumPy's transcendental functions differ from `math`
+        in the last bits, and floor, ceil and round return ints in Python) or when a floating point
+        error (division by zero, domain error, overflow) happens. The caller then evaluates element
+        by element, which raises the exact same error as the formula node.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            return None
+
+        # only the operations that IEEE 754 requires to be correctly rounded, or that are exact
+        implementations = {
+            "+": np.add, "-": np.subtract, "*": np.multiply, "/": np.true_divide, "_NEG": np.negative,
+            "pi": lambda: math.pi, "e": lambda: math.e, "abs": np.absolute, "sqrt": np.sqrt,
+            # same tie breaking as the builtins min(a, b) and max(a, b)
+            "min": lambda a, b: np.where(b < a, b, a),
+            "max": lambda a, b: np.where(b > a, b, a),
+        }
+        if any(name not in implementations for name, _ in program.instructions):
+            return None
+        # folded constants might be ints (e.g. floor(2.5)), complex or non-finite, which NumPy wouldn't
+        # treat like Python
+        constants = program.constants
+        if not all(type(value) is float for value in constants):
+            return None
+
+        try:
+            registers = [np.asarray(values, dtype=np.float64) for values in columns]
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if not all(np.isfinite(array).all() for array in registers) or not all(map(math.isfinite, constants)):
+            return None
+        registers.extend(constants)
+
+        try:
+            with np.errstate(divide="raise", over="raise", invalid="raise", under="ignore"):
+                for name, operands in program.instructions:
+                    registers.append(implementations[name](*[registers[i] for i in operands]))
+        except FloatingPointError:
+            return None
+
+        return np.broadcast_to(np.asarray(registers[program.result], dtype=np.float64), (length,)).tolist()
+
+FORMULA_CACHE_SIZE = 256
+
+@lru_cache(maxsize=FORMULA_CACHE_SIZE)
+def _compile_formula(node_class: type, formula: str) -> FormulaProgram:
+    node = node_class()
+    return node.compile_postfix(node.infix_to_postfix(node.tokenize_formula(formula)))
+
+
 NODE_CLASS_MAPPINGS = {
     "Basic data handling: MathFormula": MathFormula,
+    "Basic data handling: MathFormulaDataList": MathFormulaDataList,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: MathFormula": "formula",
+    "Basic data handling: MathFormulaDataList": "formula (Data List)",
 }
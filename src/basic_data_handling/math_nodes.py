@@ -14,6 +14,8 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 class MathAbs(ComfyNodeABC):
     """
     Returns the absolute value of a number.
@@ -21,6 +23,7 @@ class MathAbs(ComfyNodeABC):
     This node takes a number and returns its absolute value (magnitude without sign).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -45,6 +48,7 @@ class MathAcos(ComfyNodeABC):
     The arc cosine is the inverse operation of cosine, returning the angle whose cosine is the input value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -73,6 +77,7 @@ class MathAsin(ComfyNodeABC):
     The arc sine is the inverse operation of sine, returning the angle whose sine is the input value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -101,6 +106,7 @@ class MathAtan(ComfyNodeABC):
     The arc tangent is the inverse operation of tangent, returning the angle whose tangent is the input value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -130,6 +136,7 @@ class MathAtan2(ComfyNodeABC):
     the quadrant of the resulting angle.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -158,6 +165,7 @@ class MathCeil(ComfyNodeABC):
     This node takes a number and returns the smallest integer greater than or equal to the input value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -183,6 +191,7 @@ class MathCos(ComfyNodeABC):
     of the hypotenuse in a right-angled triangle.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -210,6 +219,7 @@ class MathDegrees(ComfyNodeABC):
     This node takes an angle in radians and returns the equivalent angle in degrees.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -233,6 +243,7 @@ class MathE(ComfyNodeABC):
     This node returns the value of e (Euler's number), which is approximately 2.71828.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {"required": {}}
 
@@ -252,6 +263,7 @@ class MathExp(ComfyNodeABC):
     This node takes a number and returns e (Euler's number) raised to the power of that number.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -275,6 +287,7 @@ class MathFloor(ComfyNodeABC):
     This node takes a number and returns the largest integer less than or equal to the input value.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -299,6 +312,7 @@ class MathLog(ComfyNodeABC):
     If the specified base is not 'e', calculates the logarithm with the specified base.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -325,6 +339,7 @@ class MathLog10(ComfyNodeABC):
     This node takes a positive number and returns its base-10 logarithm.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -349,6 +364,7 @@ class MathMax(ComfyNodeABC):
     The function works with both FLOAT and INT types.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -374,6 +390,7 @@ class MathMin(ComfyNodeABC):
     The function works with both FLOAT and INT types.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -398,6 +415,7 @@ class MathPi(ComfyNodeABC):
     This node returns the value of π, which is approximately 3.14159.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {"required": {}}
 
@@ -417,6 +435,7 @@ class MathRadians(ComfyNodeABC):
     This node takes an angle in degrees and returns the equivalent angle in radians.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -442,6 +461,7 @@ class MathSin(ComfyNodeABC):
     of the hypotenuse in a right-angled triangle.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -469,6 +489,7 @@ class MathSqrt(ComfyNodeABC):
     This node takes a non-negative number and returns its square root.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -494,6 +515,7 @@ class MathTan(ComfyNodeABC):
     of the adjacent side in a right-angled triangle.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
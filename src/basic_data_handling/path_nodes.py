@@ -1,6 +1,17 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from inspect import cleandoc
+from typing import Any, Iterator, NamedTuple, Optional
+import fnmatch
+import hashlib
 import os
 import glob
+import itertools
+import mmap
+import re
+import secrets
+import threading
+import time
 
 try:
     from comfy.comfy_types.node_typing import IO, ComfyNodeABC
@@ -16,6 +27,12 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._change_detection import CHANGE_DETECTION_STRATEGIES, file_change_signature
+from ._directory_index import get_scandir
+from ._image_cache import load_cached
+from ._input_types import cached_input_types
+from ._write_behind import atomic_write, get_write_behind_queue, report_write_failures
+
 try:
     from folder_paths import get_input_directory, get_output_directory
 except:
@@ -47,17 +64,87 @@ def load_image_helper(path: str):
         return None
 
 
+# the image conversions work on rows of about this many pixels at a time
+CONVERSION_CHUNK_PIXELS = 1 << 18
+
+
+def image_to_float32(img, bands: Optional[slice] = None, invert: bool = False):
+    """
+    Convert a PIL image into a float32 numpy array with values from 0.0 to 1.0.
+
+    The image is read in row chunks straight into a single preallocated output array, so there is
+    no full size uint8 copy and no float32 temporaries. `bands` selects channels of a multi-band
+    image, e.g. `slice(0, 3)` for RGB from RGBA. With `invert` the result is 1.0 - value, in place.
+    The values are the same as of `np.array(img).astype(np.float32) / 255.0`.
+    """
+    import numpy as np
+
+    width, height = img.size
+    rows = max(1, CONVERSION_CHUNK_PIXELS // max(width, 1))
+    out = None
+    for top in range(0, height, rows):
+        chunk = np.asarray(img.crop((0, top, width, min(top + rows, height))))
+        if bands is not None:
+            chunk = chunk[..., bands]
+        if out is None:
+            out = np.empty((height,) + chunk.shape[1:], dtype=np.float32)
+        np.divide(chunk, np.float32(255.0), out=out[top:top + chunk.shape[0]], dtype=np.float32)
+    if out is None:
+        out = np.asarray(img)[..., bands] if bands is not None else np.asarray(img)
+        out = out.astype(np.float32)
+    if invert:
+        np.subtract(np.float32(1.0), out, out=out)
+    return out
+
+
+def image_to_rgb_tensor(img):
+    """Convert a PIL image into an RGB IMAGE tensor with a batch dimension"""
+    import torch
+
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    # dropping the alpha of RGBA is what converting to RGB does
+    return torch.from_numpy(image_to_float32(img, slice(0, 3)))[None,]
+
+
+def load_image_tensors(path: str):
+    """Load an image as (RGB image tensor, mask tensor from the alpha channel), or None if it can't be loaded"""
+    img = load_image_helper(path)
+    if img is None:
+        return None
+    return image_to_rgb_tensor(img), extract_mask_from_alpha(img)
+
+
+def load_rgb_tensor(path: str):
+    """Load an image as RGB image tensor, or None if it can't be loaded"""
+    img = load_image_helper(path)
+    return None if img is None else image_to_rgb_tensor(img)
+
+
+def load_alpha_mask(path: str):
+    """Load the alpha channel of an image as mask tensor, or None if it can't be loaded"""
+    img = load_image_helper(path)
+    return None if img is None else extract_mask_from_alpha(img)
+
+
+def load_greyscale_mask(path: str, invert: bool = False):
+    """Load a greyscale image or the red channel of an image as mask tensor, or None if it can't be loaded"""
+    img = load_image_helper(path)
+    if img is None:
+        return None
+    mask_tensor = extract_mask_from_greyscale(img)
+    # Optionally invert the mask (1.0 - mask), in place as the tensor is new
+    return mask_tensor.neg_().add_(1.0) if invert else mask_tensor
+
+
 def extract_mask_from_alpha(img):
     """Extract a mask from the alpha channel of an image"""
-    import numpy as np
     import torch
 
     if 'A' in img.getbands():
-        alpha = np.array(img.getchannel('A')).astype(np.float32) / 255.0
-        mask_tensor = 1.0 - torch.from_numpy(alpha)
+        mask_tensor = torch.from_numpy(image_to_float32(img.getchannel('A'), invert=True))
     elif img.mode == 'P' and 'transparency' in img.info:
-        alpha = np.array(img.convert('RGBA').getchannel('A')).astype(np.float32) / 255.0
-        mask_tensor = 1.0 - torch.from_numpy(alpha)
+        mask_tensor = torch.from_numpy(image_to_float32(img.convert('RGBA').getchannel('A'), invert=True))
     else:
         # Create a blank mask if no alpha channel
         mask_tensor = torch.zeros((img.height, img.width), dtype=torch.float32)
@@ -70,28 +157,426 @@ def extract_mask_from_alpha(img):
 
 def extract_mask_from_greyscale(img):
     """Extract a mask from a greyscale image or the red channel of an RGB image"""
-    import numpy as np
     import torch
 
     if img.mode == 'L':
         # Image is already greyscale
-        gray = np.array(img).astype(np.float32) / 255.0
+        gray_img = img
     elif img.mode == 'RGB' or img.mode == 'RGBA':
         # Use the red channel of RGB or RGBA
-        gray = np.array(img.getchannel('R')).astype(np.float32) / 255.0
+        gray_img = img.getchannel('R')
     else:
         # Convert to greyscale if it's another format
         gray_img = img.convert('L')
-        gray = np.array(gray_img).astype(np.float32) / 255.0
 
     # Convert to tensor and invert (white pixels in image = transparent in mask)
-    mask_tensor = 1.0 - torch.from_numpy(gray)
+    mask_tensor = torch.from_numpy(image_to_float32(gray_img, invert=True))
 
     # Add batch dimension
     mask_tensor = mask_tensor.unsqueeze(0)
 
     return mask_tensor
 
+
+# the `{index}` field of a batch path, with an optional format spec like `{index:04d}`
+_INDEX_FIELD = re.compile(r"\{index(?::([^{}]*))?\}")
+
+
+def batch_file_paths(path: str, extension: str, count: int) -> list[str]:
+    """
+    Return the file paths for the images of a batch.
+
+    `path` can contain an `{index}` field with a format spec, e.g. "out/image_{index:04d}". Without
+    it a single image is saved to `path` and the images of a bigger batch are numbered like
+    "path_00000", before the extension when the path ends with it. Other braces in the path are
+    kept as they are. The extension is added when the path doesn't end with it.
+    """
+    suffix = f".{extension}".lower()
+    if _INDEX_FIELD.search(path):
+        paths = [_INDEX_FIELD.sub(lambda match: format(index, match.group(1) or ""), path) for index in range(count)]
+    elif count > 1:
+        stem = path[:-len(suffix)] if path.lower().endswith(suffix) else path
+        paths = [f"{stem}_{index:05d}" for index in range(count)]
+    else:
+        paths = [path]
+    return [file_path if file_path.lower().endswith(suffix) else f"{file_path}.{extension}" for file_path in paths]
+
+
+def save_pil_image(pil_img, path: str, format: str, quality: int = 95, compress_level: int = 6) -> None:
+    """Encode and save a PIL image with the options of its format"""
+    format = format.lower()
+    if format in ("jpg", "jpeg"):
+        pil_img.save(path, format="JPEG", quality=quality)
+    elif format == "webp":
+        pil_img.save(path, format="WEBP", quality=quality)
+    elif format == "jxl":
+        # JPEG XL specific options
+        pil_img.save(path, format="JXL", quality=quality)
+    elif format == "png":
+        pil_img.save(path, format="PNG", compress_level=compress_level)
+    else:
+        pil_img.save(path, format=format.upper())
+
+
+def save_batch(paths: list[str], make_image, workers: int = 0, atomic: bool = False, **save_options) -> None:
+    """
+    Create the PIL image `make_image(i)` for every path and save it, in a thread pool with
+    `workers` threads (0 uses one per CPU). PIL releases the GIL while encoding. With `atomic`
+    the files are written to a temporary file first, that is renamed when it is complete.
+    """
+    def save(index: int) -> None:
+        pil_img = make_image(index)
+        if atomic:
+            atomic_write(paths[index], lambda temporary_path: save_pil_image(pil_img, temporary_path, **save_options))
+        else:
+            save_pil_image(pil_img, paths[index], **save_options)
+
+    max_workers = min(workers or os.cpu_count() or 1, len(paths))
+    if max_workers <= 1:
+        for index in range(len(paths)):
+            save(index)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # list() to raise the first error
+            list(executor.map(save, range(len(paths))))
+
+
+def check_jxl_support(format: str) -> bool:
+    """Return False (after telling why) when JPEG XL is requested but pillow_jxl isn't installed"""
+    if format.lower() != "jxl":
+        return True
+    try:
+        import pillow_jxl  # noqa: F401 - imported but unused, kept for JPEG XL support
+    except ModuleNotFoundError:
+        print("Basic data handling: JPEG XL format requested but pillow_jxl module is not installed. "
+              "Please install it with 'pip install pillow-jxl-plugin'.")
+        return False
+    return True
+
+
+# number of line indexes of text files kept by PathLoadStringFileRange
+LINE_INDEX_CACHE_SIZE = 8
+# the line index is built from blocks of this many bytes
+LINE_INDEX_BLOCK_SIZE = 1 << 26
+
+_line_index_cache = OrderedDict()
+_line_index_cache_lock = threading.Lock()
+
+
+def build_line_index(buffer) -> list[int]:
+    """Return the byte offsets of the starts of the lines, a line ends after a newline"""
+    size = len(buffer)
+    if size == 0:
+        return []
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        offsets = [0]
+        position = buffer.find(b"\n")
+        while position != -1:
+            offsets.append(position + 1)
+            position = buffer.find(b"\n", position + 1)
+    else:
+        blocks = [np.zeros(1, dtype=np.int64)]
+        for block_start in range(0, size, LINE_INDEX_BLOCK_SIZE):
+            block = np.frombuffer(buffer, dtype=np.uint8, count=min(LINE_INDEX_BLOCK_SIZE, size - block_start),
+                                  offset=block_start)
+            blocks.append(np.flatnonzero(block == 10) + (block_start + 1))
+        offsets = np.concatenate(blocks)
+    # no empty line after a final newline
+    if offsets[-1] == size:
+        offsets = offsets[:-1]
+    return offsets
+
+
+def get_line_index(path: str, buffer, st: os.stat_result):
+    """Return the line index of a file, built once per version of the file"""
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    with _line_index_cache_lock:
+        index = _line_index_cache.get(key)
+        if index is not None:
+            _line_index_cache.move_to_end(key)
+            return index
+    index = build_line_index(buffer)
+    with _line_index_cache_lock:
+        _line_index_cache[key] = index
+        while len(_line_index_cache) > LINE_INDEX_CACHE_SIZE:
+            _line_index_cache.popitem(last=False)
+    return index
+
+
+def _line_start(buffer, position: int) -> int:
+    """Return the start of the first line that starts at or after the position"""
+    if position <= 0:
+        return 0
+    newline = buffer.find(b"\n", position - 1)
+    return len(buffer) if newline == -1 else newline + 1
+
+
+def _skip_lines(buffer, count: int, position: int = 0) -> int:
+    """Return the start of the line `count` lines after the one at the position, or the end of the file"""
+    for _ in range(count):
+        newline = buffer.find(b"\n", position)
+        if newline == -1:
+            return len(buffer)
+        position = newline + 1
+    return position
+
+
+# number of glob patterns whose results are kept by PathGlob
+GLOB_CACHE_SIZE = 64
+# directories modified this many seconds before a scan may still change within the same mtime tick
+GLOB_RACY_SECONDS = 2.0
+
+
+def _split_glob_pattern(pattern: str) -> tuple[str, list[str]]:
+    """Split a glob pattern into its leading directory without wildcards and the remaining components"""
+    parts = []
+    root = pattern
+    while glob.has_magic(root):
+        root, part = os.path.split(root)
+        parts.append(part)
+    parts.reverse()
+    return root, parts
+
+
+def _list_glob_dir(directory: str, part: str, dironly: bool, watched: set[str], scandir=os.scandir) -> list[str]:
+    """Return the entries of a directory matching one component of a glob pattern"""
+    watched.add(directory or os.curdir)
+    try:
+        with scandir(directory or os.curdir) as it:
+            names = [entry.name for entry in it if not dironly or entry.is_dir()]
+    except OSError:
+        return []
+    if not part.startswith("."):
+        names = [name for name in names if not name.startswith(".")]
+    return [os.path.join(directory, name) for name in fnmatch.filter(names, part)]
+
+
+def _walk_glob_dir(directory: str, dironly: bool, watched: set[str], scandir=os.scandir) -> list[str]:
+    """
+    Return a directory and everything below it for a recursive `**` component of a glob pattern.
+
+    The entries are in the order of `glob.glob`: depth first, every directory right before its
+    contents, and the entries of a directory in the order `scandir` returns them.
+    """
+    def read(current: str) -> Iterator[tuple[str, bool]]:
+        watched.add(current or os.curdir)
+        try:
+            with scandir(current or os.curdir) as it:
+                entries = [(entry.name, entry.is_dir()) for entry in it if not entry.name.startswith(".")]
+        except OSError:
+            entries = []
+        return iter([(os.path.join(current, name), is_dir) for name, is_dir in entries])
+
+    results = [os.path.join(directory, "")]
+    stack = [read(directory)]
+    while stack:
+        for path, is_dir in stack[-1]:
+            if is_dir:
+                results.append(path)
+                stack.append(read(path))
+                break
+            elif not dironly:
+                results.append(path)
+        else:
+            stack.pop()
+    return results
+
+
+def scan_glob(pattern: str, recursive: bool = False, scandir=os.scandir) -> tuple[list[str], set[str]]:
+    """
+    Find the paths matching a glob pattern, like `glob.glob`, in a single scan.
+
+    Also returns the directories the result depends on: every directory that was listed and the
+    parents of the literal components. Adding, removing or renaming an entry changes the mtime of
+    its directory, so their signatures tell whether the result may have changed. The directories are
+    read with `scandir`, e.g. the one of the directory index.
+    """
+    root, parts = _split_glob_pattern(pattern)
+    watched = set()
+    if not parts:
+        watched.add(os.path.dirname(pattern) or os.curdir)
+        exists = os.path.lexists(pattern) if os.path.basename(pattern) else os.path.isdir(pattern)
+        return ([pattern] if exists else []), watched
+
+    paths = [root]
+    for i, part in enumerate(parts):
+        dironly = i < len(parts) - 1
+        matches = []
+        for directory in paths:
+            if recursive and part == "**":
+                matches.extend(_walk_glob_dir(directory, dironly, watched, scandir))
+            elif glob.has_magic(part):
+                matches.extend(_list_glob_dir(directory, part, dironly, watched, scandir))
+            else:
+                watched.add(directory or os.curdir)
+                path = os.path.join(directory, part)
+                if os.path.isdir(path) if dironly or not part else os.path.lexists(path):
+                    matches.append(path)
+        paths = matches
+    return [path for path in paths if path], watched
+
+
+def directory_signature(directories) -> tuple:
+    """Return the (path, mtime, inode) of the directories, with None for the missing ones"""
+    signature = []
+    for directory in sorted(directories):
+        try:
+            st = os.stat(directory)
+            signature.append((directory, st.st_mtime_ns, st.st_ino))
+        except OSError:
+            signature.append((directory, None, None))
+    return tuple(signature)
+
+
+class GlobScan(NamedTuple):
+    paths: tuple[str, ...]
+    signature: tuple
+    # a directory was modified right before or during the scan, so its mtime can't be trusted yet
+    racy: bool
+    digest: str
+
+
+def _glob_scan(pattern: str, recursive: bool) -> GlobScan:
+    start_ns = time.time_ns()
+    paths, watched = scan_glob(pattern, recursive, get_scandir())
+    signature = directory_signature(watched)
+    racy_ns = start_ns - int(GLOB_RACY_SECONDS * 1e9)
+    racy = any(mtime is not None and mtime >= racy_ns for _, mtime, _ in signature)
+    digest = hashlib.md5(str(paths).encode()).hexdigest()
+    return GlobScan(tuple(paths), signature, racy, digest)
+
+
+def parse_extensions(extensions: str) -> tuple[str, ...]:
+    """Parse a comma separated list of file extensions like "png, .JPG" into (".png", ".jpg")"""
+    parsed = []
+    for extension in extensions.split(","):
+        extension = extension.strip().lower()
+        if extension:
+            parsed.append(extension if extension.startswith(".") else "." + extension)
+    return tuple(parsed)
+
+
+def natural_sort_key(name: str) -> list:
+    """Sort key that orders the numbers in a name by their value, e.g. img2 before img10"""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name.casefold())]
+
+
+def iter_directory(path: str, files_only: bool = False, dirs_only: bool = False, extensions: tuple[str, ...] = (),
+                   name_pattern: str = "", recursive: bool = False, max_depth: int = 0, scandir=os.scandir):
+    """
+    Yield (relative path, DirEntry) for the entries of a directory in a single `os.scandir` pass.
+
+    The filters only use the type information cached in the DirEntry, so no extra stat is needed
+    per entry. `extensions` and `name_pattern` only apply to files. With `recursive` the
+    subdirectories are walked as well, down to `max_depth` levels (0 means no limit), without
+    following symbolic links to directories. Subdirectories that can't be read are skipped like
+    `os.walk` does. The directories are read with `scandir`, e.g. the one of the directory index.
+    """
+    # files_only wins when both are set
+    dirs_only = dirs_only and not files_only
+    stack = [("", 1)]
+    while stack:
+        relative, depth = stack.pop()
+        subdirectories = []
+        try:
+            it = scandir(os.path.join(path, relative) if relative else path)
+        except OSError:
+            if not relative:
+                raise
+            continue
+        # the entries are yielded while the directory is read, so huge directories aren't held in memory
+        with it:
+            for entry in it:
+                entry_path = os.path.join(relative, entry.name) if relative else entry.name
+                is_dir = entry.is_dir()
+                if recursive and (max_depth <= 0 or depth < max_depth) and entry.is_dir(follow_symlinks=False):
+                    subdirectories.append((entry_path, depth + 1))
+                if is_dir:
+                    if files_only:
+                        continue
+                elif dirs_only or (files_only and not entry.is_file()):
+                    continue
+                elif extensions and not entry.name.lower().endswith(extensions):
+                    continue
+                elif name_pattern and not fnmatch.fnmatch(entry.name, name_pattern):
+                    continue
+                yield entry_path, entry
+        stack.extend(reversed(subdirectories))
+
+
+# server-side directory iterators of PathIterDir that weren't used for this many seconds are closed
+DIRECTORY_ITERATOR_IDLE_TIMEOUT = 600.0
+# at most this many directory iterators are kept open, the least recently used one is closed for a new one
+MAX_DIRECTORY_ITERATORS = 16
+
+
+class _DirectoryIterator:
+    """A paused `iter_directory` generator of PathIterDir, with the last batch it returned"""
+
+    def __init__(self, listing: tuple):
+        self.listing = listing
+        self.entries = iter_directory(*listing)
+        self.position = 0
+        self.lookahead = []
+        self.last_batch = None
+        self.last_used = time.monotonic()
+
+    def close(self):
+        self.entries.close()
+
+    def read(self, position: int, count: int) -> tuple[list[str], bool]:
+        """Return `count` entries from `position` on and whether the listing is exhausted"""
+        self.last_used = time.monotonic()
+        if self.last_batch is not None and self.last_batch[:2] == (position, count):
+            # the same cursor again, e.g. the prompt was queued once more
+            return self.last_batch[2]
+        if position < self.position:
+            self.close()
+            self.entries = iter_directory(*self.listing)
+            self.position = 0
+            self.lookahead = []
+        # skip to the position and read one entry more, to know whether the listing is exhausted
+        needed = position - self.position + count + 1 - len(self.lookahead)
+        try:
+            entries = self.lookahead + [entry_path for entry_path, _ in itertools.islice(self.entries, max(needed, 0))]
+        except Exception:
+            # a generator that raised is finished, reading on would quietly report the listing as done
+            self.close()
+            raise
+        entries = entries[position - self.position:]
+        batch, self.lookahead = entries[:count], entries[count:]
+        self.position = position + len(batch)
+        result = (batch, not self.lookahead)
+        self.last_batch = (position, count, result)
+        return result
+
+
+_directory_iterators: dict[str, _DirectoryIterator] = {}
+# the cursor of the listings that are iterated with auto_advance, by listing key
+_auto_advance_cursors: dict[str, str] = {}
+_directory_iterators_lock = threading.Lock()
+
+
+def _close_idle_directory_iterators() -> None:
+    deadline = time.monotonic() - DIRECTORY_ITERATOR_IDLE_TIMEOUT
+    for token, iterator in list(_directory_iterators.items()):
+        if iterator.last_used < deadline:
+            del _directory_iterators[token]
+            iterator.close()
+
+
+def _open_directory_iterator(listing: tuple) -> tuple[str, _DirectoryIterator]:
+    """Register a new directory iterator, closing the least recently used ones beyond MAX_DIRECTORY_ITERATORS"""
+    while len(_directory_iterators) >= MAX_DIRECTORY_ITERATORS:
+        token = min(_directory_iterators, key=lambda token: _directory_iterators[token].last_used)
+        _directory_iterators.pop(token).close()
+    token = secrets.token_hex(8)
+    iterator = _directory_iterators[token] = _DirectoryIterator(listing)
+    return token, iterator
+
+
 # the nodes:
 
 class PathAbspath(ComfyNodeABC):
@@ -102,6 +587,7 @@ class PathAbspath(ComfyNodeABC):
     by resolving any relative path components and symbolic links.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -127,6 +613,7 @@ class PathBasename(ComfyNodeABC):
     removing any directory information.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -151,6 +638,7 @@ class PathCommonPrefix(ComfyNodeABC):
     This node returns the longest common leading component of the given paths.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -180,6 +668,7 @@ class PathDirname(ComfyNodeABC):
     removing the filename.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -205,6 +694,7 @@ class PathExists(ComfyNodeABC):
     and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -230,6 +720,7 @@ class PathExpandVars(ComfyNodeABC):
     For example, $HOME or ${HOME} on Unix, or %USERPROFILE% on Windows.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -247,6 +738,42 @@ class PathExpandVars(ComfyNodeABC):
         return (os.path.expandvars(path),)
 
 
+class PathFlushWrites(ComfyNodeABC):
+    """
+    Waits until all pending write-behind saves are written.
+
+    The save nodes with 'write_behind' enabled return before their files are written. This node
+    waits until everything queued so far is on disk. 'success' is False and 'errors' lists the
+    failed writes when one of them failed. Connect any output to 'value' to run this node after
+    that node, it is passed through unchanged.
+    """
+    @classmethod
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return {
+            "optional": {
+                "value": (IO.ANY, {}),
+            }
+        }
+
+    RETURN_TYPES = (IO.ANY, IO.BOOLEAN, IO.STRING)
+    RETURN_NAMES = ("value", "success", "errors")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "flush_writes"
+    OUTPUT_NODE = True
+
+    @classmethod
+    def IS_CHANGED(s, **kwargs):
+        return float("NaN")  # always wait for the writes queued by this run
+
+    def flush_writes(self, value=None) -> tuple[Any, bool, str]:
+        failures = get_write_behind_queue().flush()
+        for failure in failures:
+            print(f"Basic data handling: Error in a write-behind save: {failure}")
+        return value, not failures, "\n".join(failures)
+
+
 class PathGetCwd(ComfyNodeABC):
     """
     Returns the current working directory.
@@ -254,6 +781,7 @@ class PathGetCwd(ComfyNodeABC):
     This node returns the current working directory as an absolute path.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {"required": {}}
 
@@ -275,6 +803,7 @@ class PathGetExtension(ComfyNodeABC):
     including the dot (e.g., '.txt').
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -300,6 +829,7 @@ class PathGetSize(ComfyNodeABC):
     Raises an error if the path doesn't exist or isn't a file.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -333,6 +863,7 @@ class PathGlob(ComfyNodeABC):
     [!seq] - matches any character not in seq
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -350,37 +881,32 @@ class PathGlob(ComfyNodeABC):
     FUNCTION = "glob_paths"
     OUTPUT_IS_LIST = (True,)
 
-    # Class variable to store the last matched paths
-    _last_matched_paths = {}
+    # The last scans, by (pattern, recursive, cwd), with the least recently used first
+    _glob_cache = OrderedDict()
+
+    @classmethod
+    def _cached_glob(cls, pattern: str, recursive: bool) -> GlobScan:
+        """
+        Return the scan of the pattern, reusing the last one while the signatures of its
+        directories are unchanged. So `IS_CHANGED` and `glob_paths` share a single scan.
+        """
+        key = (pattern, bool(recursive), os.getcwd())
+        scan = cls._glob_cache.get(key)
+        if scan is None or scan.racy or directory_signature(d for d, _, _ in scan.signature) != scan.signature:
+            scan = _glob_scan(pattern, recursive)
+        cls._glob_cache[key] = scan
+        cls._glob_cache.move_to_end(key)
+        while len(cls._glob_cache) > GLOB_CACHE_SIZE:
+            cls._glob_cache.popitem(last=False)
+        return scan
 
     @classmethod
     def IS_CHANGED(s, pattern: str, recursive: bool = False):
-        # Get current paths
-        current_paths = glob.glob(pattern, recursive=recursive)
-
-        # Create a key for this specific pattern and recursive setting
-        key = f"{pattern}_{recursive}"
-
-        # If we haven't seen this pattern before, store it and trigger recalculation
-        if key not in s._last_matched_paths:
-            s._last_matched_paths[key] = current_paths
-            return float("NaN")
-
-        # Compare with previous paths
-        previous_paths = s._last_matched_paths[key]
-        if previous_paths != current_paths:
-            # Update stored paths and trigger recalculation
-            s._last_matched_paths[key] = current_paths
-            return float("NaN")
-
-        # No changes, return a consistent value
-        import hashlib
-        m = hashlib.md5()
-        m.update(str(current_paths).encode())
-        return m.hexdigest()
+        # The same digest for the same matching paths, so the node only runs again when they changed
+        return s._cached_glob(pattern, recursive).digest
 
     def glob_paths(self, pattern: str, recursive: bool = False) -> tuple[list[str]]:
-        return (glob.glob(pattern, recursive=recursive),)
+        return (list(self._cached_glob(pattern, recursive).paths),)
 
 
 class PathIsAbsolute(ComfyNodeABC):
@@ -391,6 +917,7 @@ class PathIsAbsolute(ComfyNodeABC):
     and False if it's relative.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -416,6 +943,7 @@ class PathIsDir(ComfyNodeABC):
     and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -441,6 +969,7 @@ class PathIsFile(ComfyNodeABC):
     and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -458,6 +987,106 @@ class PathIsFile(ComfyNodeABC):
         return (os.path.isfile(path),)
 
 
+class PathIterDir(ComfyNodeABC):
+    """
+    Iterates over the contents of a directory in batches.
+
+    Instead of listing the whole directory at once, this node returns the next 'batch_size' entries
+    and a cursor. Pass the cursor back in to get the following batch, an empty cursor starts at the
+    beginning. 'done' is True for the last batch. With 'auto_advance' the node ignores the cursor
+    input and returns the next batch on every run, starting over after the last batch, so a huge
+    directory can be processed in chunks by queueing the workflow repeatedly.
+
+    The directory is read by a server-side iterator that is closed when it wasn't used for a while or
+    when too many are open, a cursor still works after that but has to read the directory up to its
+    position again. An error while reading is raised on every read with the cursor, not hidden as 'done'.
+    The options filter the entries like in "list dir".
+    """
+    @classmethod
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "path": (IO.STRING, {"default": ""}),
+                "batch_size": (IO.INT, {"default": 100, "min": 1}),
+            },
+            "optional": {
+                "cursor": (IO.STRING, {"default": ""}),
+                "auto_advance": (IO.BOOLEAN, {"default": False}),
+                "files_only": (IO.BOOLEAN, {"default": False}),
+                "dirs_only": (IO.BOOLEAN, {"default": False}),
+                "extensions": (IO.STRING, {"default": ""}),
+                "name_pattern": (IO.STRING, {"default": ""}),
+                "recursive": (IO.BOOLEAN, {"default": False}),
+                "max_depth": (IO.INT, {"default": 0, "min": 0}),
+            }
+        }
+
+    RETURN_TYPES = (IO.STRING, IO.STRING, IO.BOOLEAN)
+    RETURN_NAMES = ("entries", "cursor", "done")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "iterate_directory"
+    OUTPUT_IS_LIST = (True, False, False)
+
+    @classmethod
+    def IS_CHANGED(s, auto_advance: bool = False, **kwargs):
+        # with auto_advance every run returns the next batch
+        return float("NaN") if auto_advance else ""
+
+    def iterate_directory(self, path: str, batch_size: int = 100, cursor: str = "", auto_advance: bool = False,
+                          files_only: bool = False, dirs_only: bool = False, extensions: str = "", name_pattern: str = "",
+                          recursive: bool = False, max_depth: int = 0) -> tuple[list[str], str, bool]:
+        if not path:
+            path = os.getcwd()
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Directory does not exist: {path}")
+        if not os.path.isdir(path):
+            raise NotADirectoryError(f"Basic data handling: Path is not a directory: {path}")
+        if batch_size < 1:
+            raise ValueError("Basic data handling: batch_size must be at least 1")
+
+        listing = (os.path.abspath(path), files_only, dirs_only, parse_extensions(extensions), name_pattern, recursive, max_depth)
+        listing_key = hashlib.md5(repr(listing).encode()).hexdigest()[:12]
+
+        with _directory_iterators_lock:
+            _close_idle_directory_iterators()
+            if auto_advance:
+                cursor = _auto_advance_cursors.get(listing_key, "")
+
+            # the cursor is "<iterator token>:<listing key>:<position>"
+            token, position = "", 0
+            if cursor:
+                try:
+                    token, cursor_key, position = cursor.split(":")
+                    position = int(position)
+                except ValueError:
+                    raise ValueError(f"Basic data handling: Invalid cursor: {cursor}") from None
+                if cursor_key != listing_key:
+                    raise ValueError("Basic data handling: The cursor belongs to a different directory or options")
+
+            iterator = _directory_iterators.get(token)
+            if iterator is None:
+                token, iterator = _open_directory_iterator(listing)
+            try:
+                entries, done = iterator.read(position, batch_size)
+            except Exception:
+                # drop the failed iterator, the next read with this cursor starts a new one and reports the error again
+                _directory_iterators.pop(token, None)
+                _auto_advance_cursors.pop(listing_key, None)
+                raise
+            next_cursor = f"{token}:{listing_key}:{position + len(entries)}"
+
+            if auto_advance:
+                if done:
+                    _auto_advance_cursors.pop(listing_key, None)
+                else:
+                    _auto_advance_cursors[listing_key] = next_cursor
+
+        return entries, next_cursor, done
+
+
 class PathJoin(ComfyNodeABC):
     """
     Joins multiple path components into a single path.
@@ -467,6 +1096,7 @@ class PathJoin(ComfyNodeABC):
     for the operating system.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -496,8 +1126,18 @@ class PathListDir(ComfyNodeABC):
     If 'files_only' is True, it only returns files.
     If 'dirs_only' is True, it only returns directories.
     If both are False, it returns all contents.
+
+    Files can be filtered by a comma separated list of 'extensions' (e.g. "png, jpg") and by a
+    'name_pattern' with shell-style wildcards. With 'recursive' the subdirectories are listed as well,
+    down to 'max_depth' levels (0 means no limit), and the entries are paths relative to 'path'.
+    The entries can be sorted by name, natural order (img2 before img10), modification time or size.
+    The sizes and modification times (Unix time) of the entries are returned alongside when
+    'with_stats' is True or the entries are sorted by them, otherwise these lists are empty.
     """
+    SORT_OPTIONS = ["none", "name", "natural", "mtime", "size"]
+
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -506,17 +1146,26 @@ class PathListDir(ComfyNodeABC):
             "optional": {
                 "files_only": (IO.BOOLEAN, {"default": False}),
                 "dirs_only": (IO.BOOLEAN, {"default": False}),
+                "extensions": (IO.STRING, {"default": ""}),
+                "name_pattern": (IO.STRING, {"default": ""}),
+                "recursive": (IO.BOOLEAN, {"default": False}),
+                "max_depth": (IO.INT, {"default": 0, "min": 0}),
+                "sort_by": (cls.SORT_OPTIONS, {"default": "none"}),
+                "reverse": (IO.BOOLEAN, {"default": False}),
+                "with_stats": (IO.BOOLEAN, {"default": False}),
             }
         }
 
-    RETURN_TYPES = (IO.STRING,)
-    RETURN_NAMES = ("entries",)
+    RETURN_TYPES = (IO.STRING, IO.INT, IO.FLOAT)
+    RETURN_NAMES = ("entries", "sizes", "mtimes")
     CATEGORY = "Basic/Path"
     DESCRIPTION = cleandoc(__doc__ or "")
     FUNCTION = "list_directory"
-    OUTPUT_IS_LIST = (True,)
+    OUTPUT_IS_LIST = (True, True, True)
 
-    def list_directory(self, path: str, files_only: str = False, dirs_only: str = False) -> tuple[list[str]]:
+    def list_directory(self, path: str, files_only: bool = False, dirs_only: bool = False, extensions: str = "",
+                       name_pattern: str = "", recursive: bool = False, max_depth: int = 0, sort_by: str = "none",
+                       reverse: bool = False, with_stats: bool = False) -> tuple[list[str], list[int], list[float]]:
         if not path:
             path = os.getcwd()
 
@@ -524,15 +1173,41 @@ class PathListDir(ComfyNodeABC):
             raise FileNotFoundError(f"Directory does not exist: {path}")
         if not os.path.isdir(path):
             raise NotADirectoryError(f"Basic data handling: Path is not a directory: {path}")
+        if sort_by not in self.SORT_OPTIONS:
+            raise ValueError(f"Unknown sort_by '{sort_by}', expected one of {self.SORT_OPTIONS}")
+
+        rows = []
+        # the stat of a DirEntry is cached, so sorting and the outputs share a single one per entry
+        need_stats = with_stats or sort_by in ("mtime", "size")
+        # the directory index keeps the stats of the last time a directory was read, which may be stale
+        scandir = os.scandir if need_stats else get_scandir()
+        for entry_path, entry in iter_directory(path, files_only, dirs_only, parse_extensions(extensions),
+                                                name_pattern, recursive, max_depth, scandir):
+            if need_stats:
+                try:
+                    st = entry.stat()
+                    rows.append((entry_path, st.st_size, st.st_mtime))
+                except OSError:
+                    # e.g. a dangling symbolic link
+                    rows.append((entry_path, 0, 0.0))
+            else:
+                rows.append((entry_path, 0, 0.0))
 
-        entries = os.listdir(path)
-
-        if files_only:
-            entries = [e for e in entries if os.path.isfile(os.path.join(path, e))]
-        elif dirs_only:
-            entries = [e for e in entries if os.path.isdir(os.path.join(path, e))]
+        if sort_by == "name":
+            rows.sort(key=lambda row: row[0], reverse=reverse)
+        elif sort_by == "natural":
+            rows.sort(key=lambda row: natural_sort_key(row[0]), reverse=reverse)
+        elif sort_by == "mtime":
+            rows.sort(key=lambda row: row[2], reverse=reverse)
+        elif sort_by == "size":
+            rows.sort(key=lambda row: row[1], reverse=reverse)
+        elif reverse:
+            rows.reverse()
 
-        return (entries,)
+        entries = [row[0] for row in rows]
+        if not need_stats:
+            return entries, [], []
+        return entries, [row[1] for row in rows], [row[2] for row in rows]
 
 
 class PathNormalize(ComfyNodeABC):
@@ -544,6 +1219,7 @@ class PathNormalize(ComfyNodeABC):
     separator for the operating system.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -569,6 +1245,7 @@ class PathSetExtension(ComfyNodeABC):
     The extension should include the dot (e.g., '.jpg').
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -600,6 +1277,7 @@ class PathRelative(ComfyNodeABC):
     If 'start' is not provided, the current working directory is used.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -630,6 +1308,7 @@ class PathSplit(ComfyNodeABC):
     and the filename.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -655,6 +1334,7 @@ class PathSplitExt(ComfyNodeABC):
     the extension and the extension (including the dot).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -676,13 +1356,19 @@ class PathLoadStringFile(ComfyNodeABC):
     """
     Loads a text file in UTF-8 encoding and returns its content as a STRING
     without any further processing.
+    'change_detection' selects when the file counts as changed and is loaded again: on a new mtime
+    ('mtime'), on a new mtime, size or inode ('stat'), or only on new content ('content hash').
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "path": (IO.STRING, {"default": ""}),
             },
+            "optional": {
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
         }
 
     RETURN_TYPES = (IO.STRING, IO.BOOLEAN)
@@ -692,15 +1378,10 @@ class PathLoadStringFile(ComfyNodeABC):
     FUNCTION = "load_text"
 
     @classmethod
-    def IS_CHANGED(cls, path):
-        try:
-            if os.path.exists(path):
-                return os.path.getmtime(path)
-        except Exception:
-            pass
-        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
 
-    def load_text(self, path: str):
+    def load_text(self, path: str, change_detection: str = "mtime"):
         exists = os.path.exists(path)
 
         if not exists:
@@ -714,19 +1395,180 @@ class PathLoadStringFile(ComfyNodeABC):
             return ("", False)
 
 
+class PathLoadStringFileRange(ComfyNodeABC):
+    """
+    Loads a part of a text file without reading the rest of it.
+
+    The file is memory-mapped and only the requested part is read, so huge files (e.g. JSONL or
+    CSV corpora) can be processed piece by piece. 'unit' selects what 'start' and 'count' mean:
+    - lines: 'count' lines from line number 'start' (starting at 0)
+    - bytes: 'count' bytes from byte offset 'start'
+    - chunks: chunk number 'start' when the file is split into chunks of 'count' bytes, extended to
+      whole lines, so every line is in exactly one chunk
+    'text' is the part as it is in the file, 'lines' the Data List of its lines without line endings
+    and 'total' the number of lines, bytes or chunks of the file. The 'encoding' must encode a newline
+    as a single byte like UTF-8 does, so e.g. UTF-16 and UTF-32 files are rejected.
+    With 'use_index' the offsets of all lines are indexed once per version of the file, so any line
+    is found right away. Otherwise the lines before 'start' are counted and the total number of
+    lines is unknown (-1).
+    'change_detection' selects when the file counts as changed, like in "load STRING from file".
+    """
+    UNITS = ["lines", "bytes", "chunks"]
+
+    @classmethod
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "path": (IO.STRING, {"default": ""}),
+                "unit": (cls.UNITS, {"default": "lines"}),
+                "start": (IO.INT, {"default": 0, "min": 0}),
+                "count": (IO.INT, {"default": 1, "min": 1}),
+            },
+            "optional": {
+                "use_index": (IO.BOOLEAN, {"default": True}),
+                "encoding": (IO.STRING, {"default": "utf-8"}),
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
+        }
+
+    RETURN_TYPES = (IO.STRING, IO.STRING, IO.INT, IO.BOOLEAN)
+    RETURN_NAMES = ("text", "lines", "total", "exists")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "load_text_range"
+    OUTPUT_IS_LIST = (False, True, False, False)
+
+    @classmethod
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
+
+    def load_text_range(self, path: str, unit: str = "lines", start: int = 0, count: int = 1, use_index: bool = True,
+                        encoding: str = "utf-8", change_detection: str = "mtime") -> tuple[str, list[str], int, bool]:
+        if unit not in self.UNITS:
+            raise ValueError(f"Unknown unit '{unit}', expected one of {self.UNITS}")
+        # the lines and chunks are found by the newline byte, e.g. in UTF-16 or UTF-32 it is encoded differently
+        if "\n".encode(encoding) != b"\n":
+            raise ValueError(f"Basic data handling: The encoding '{encoding}' isn't supported, a newline must be "
+                             f"the single byte 0x0A like in UTF-8, ASCII or Latin-1")
+        if not os.path.isfile(path):
+            return ("", [], 0, False)
+
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == 0:
+                return ("", [], 0, True)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                size = len(buffer)
+                if unit == "bytes":
+                    total = size
+                    begin, end = min(start, size), min(start + count, size)
+                elif unit == "chunks":
+                    total = -(-size // count)
+                    begin, end = _line_start(buffer, start * count), _line_start(buffer, (start + 1) * count)
+                elif use_index:
+                    offsets = get_line_index(path, buffer, st)
+                    total = len(offsets)
+                    begin = int(offsets[start]) if start < total else size
+                    end = int(offsets[start + count]) if start + count < total else size
+                else:
+                    # the number of lines is unknown without reading the whole file
+                    total = -1
+                    begin = _skip_lines(buffer, start)
+                    end = _skip_lines(buffer, count, begin)
+                data = buffer[begin:end]
+
+        text = data.decode(encoding, errors="replace")
+        lines = text.split("\n") if text else []
+        if text.endswith("\n"):
+            lines.pop()
+        return (text, [line[:-1] if line.endswith("\r") else line for line in lines], total, True)
+
+
+class PathLoadImageBatch(ComfyNodeABC):
+    """
+    Loads the images of a list of file paths in parallel.
+
+    This node decodes the images of a Data List of paths in a thread pool with 'workers' threads
+    (0 uses one per CPU) and returns the RGB channels and the alpha channel as a mask, like
+    "load IMAGE+MASK from file (RGBA)". When all images have the same size, 'image' and 'mask' are
+    a single IMAGE and MASK batch, otherwise they are Data Lists with one image per path.
+    'exists' tells for every path whether it could be loaded, a path that couldn't be loaded gets an
+    empty image in the batch.
+    'change_detection' selects when a file counts as changed, like in "load STRING from file".
+    """
+    @classmethod
+    @cached_input_types
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "paths": (IO.STRING, {"default": ""}),
+            },
+            "optional": {
+                "workers": (IO.INT, {"default": 0, "min": 0}),
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
+        }
+
+    RETURN_TYPES = (IO.IMAGE, IO.MASK, IO.BOOLEAN)
+    RETURN_NAMES = ("image", "mask", "exists")
+    CATEGORY = "Basic/Path"
+    DESCRIPTION = cleandoc(__doc__ or "")
+    FUNCTION = "load_image_batch"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True, True, True)
+
+    @classmethod
+    def IS_CHANGED(cls, paths: list[str], change_detection: Optional[list[str]] = None, **kwargs):
+        strategy = change_detection[0] if change_detection else "mtime"
+        signatures = [file_change_signature(path, strategy) for path in paths]
+        if any(signature != signature for signature in signatures):
+            return float("NaN")  # Return NaN if a file doesn't exist or can't access it
+        return str(signatures)
+
+    def load_image_batch(self, paths: list[str], workers: Optional[list[int]] = None,
+                         change_detection: Optional[list[str]] = None) -> tuple[list, list, list[bool]]:
+        import torch
+
+        max_workers = (workers[0] if workers else 0) or os.cpu_count() or 1
+        if len(paths) <= 1 or max_workers == 1:
+            loaded = [load_cached(path, "rgba", load_image_tensors) for path in paths]
+        else:
+            # PIL releases the GIL while decoding, so the images are decoded in parallel
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+                loaded = list(executor.map(lambda path: load_cached(path, "rgba", load_image_tensors), paths))
+        exists = [result is not None for result in loaded]
+
+        sizes = {result[0].shape[1:3] for result in loaded if result is not None}
+        if len(sizes) == 1:
+            height, width = sizes.pop()
+            images = [result[0] if result else torch.zeros((1, height, width, 3), dtype=torch.float32) for result in loaded]
+            masks = [result[1] if result else torch.zeros((1, height, width), dtype=torch.float32) for result in loaded]
+            return [torch.cat(images)], [torch.cat(masks)], exists
+
+        images = [result[0] if result else torch.zeros((1, 1, 1, 3), dtype=torch.float32) for result in loaded]
+        masks = [result[1] if result else torch.zeros((1, 1, 1), dtype=torch.float32) for result in loaded]
+        return images, masks, exists
+
+
 class PathLoadImageRGB(ComfyNodeABC):
     """
     Loads an image from a file path and returns only the RGB channels.
 
     This node loads an image from the specified path and processes it to
     return only the RGB channels as a tensor, ignoring any alpha channel.
+    'change_detection' selects when the file counts as changed, like in "load STRING from file".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "path": (IO.STRING, {"default": ""}),
             },
+            "optional": {
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
         }
 
     RETURN_TYPES = (IO.IMAGE, IO.BOOLEAN)
@@ -736,32 +1578,20 @@ class PathLoadImageRGB(ComfyNodeABC):
     FUNCTION = "load_image_rgb"
 
     @classmethod
-    def IS_CHANGED(cls, path):
-        try:
-            if os.path.exists(path):
-                return os.path.getmtime(path)
-        except Exception:
-            pass
-        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
 
-    def load_image_rgb(self, path: str):
-        import numpy as np
+    def load_image_rgb(self, path: str, change_detection: str = "mtime"):
         import torch
 
-        img = load_image_helper(path)
+        # Converted to the RGB tensor format expected by ComfyUI (removing alpha if present)
+        image_tensor = load_cached(path, "rgb", load_rgb_tensor)
 
-        if img is None:
+        if image_tensor is None:
             # Create an empty 1x1 image
             empty_tensor = torch.zeros((1, 1, 1, 3), dtype=torch.float32)
             return (empty_tensor, False)
 
-        # Convert to RGB (removing alpha if present)
-        img_rgb = img.convert("RGB")
-
-        # Convert to tensor format expected by ComfyUI
-        image_tensor = np.array(img_rgb).astype(np.float32) / 255.0
-        image_tensor = torch.from_numpy(image_tensor)[None,]
-
         return (image_tensor, True)
 
 
@@ -772,13 +1602,18 @@ class PathLoadImageRGBA(ComfyNodeABC):
     This node loads an image from the specified path and processes it to
     return the RGB channels as a tensor and the Alpha channel as a mask tensor.
     If the image has no alpha channel, a blank mask is returned.
+    'change_detection' selects when the file counts as changed, like in "load STRING from file".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "path": (IO.STRING, {"default": ""}),
             },
+            "optional": {
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
         }
 
     RETURN_TYPES = (IO.IMAGE, IO.MASK, IO.BOOLEAN)
@@ -788,36 +1623,22 @@ class PathLoadImageRGBA(ComfyNodeABC):
     FUNCTION = "load_image_rgba"
 
     @classmethod
-    def IS_CHANGED(cls, path):
-        try:
-            if os.path.exists(path):
-                return os.path.getmtime(path)
-        except Exception:
-            pass
-        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
 
-    def load_image_rgba(self, path: str):
-        import numpy as np
+    def load_image_rgba(self, path: str, change_detection: str = "mtime"):
         import torch
 
-        img = load_image_helper(path)
+        # The RGB tensor format expected by ComfyUI and the alpha channel as mask
+        loaded = load_cached(path, "rgba", load_image_tensors)
 
-        if img is None:
+        if loaded is None:
             # Create empty 1x1 image and mask
             empty_image = torch.zeros((1, 1, 1, 3), dtype=torch.float32)
             empty_mask = torch.zeros((1, 1, 1), dtype=torch.float32)
             return (empty_image, empty_mask, False)
 
-        # Convert to RGB for the image
-        img_rgb = img.convert("RGB")
-
-        # Convert to tensor format expected by ComfyUI
-        image_tensor = np.array(img_rgb).astype(np.float32) / 255.0
-        image_tensor = torch.from_numpy(image_tensor)[None,]
-
-        # Extract alpha channel as mask
-        mask_tensor = extract_mask_from_alpha(img)
-
+        image_tensor, mask_tensor = loaded
         return (image_tensor, mask_tensor, True)
 
 
@@ -828,13 +1649,18 @@ class PathLoadMaskFromAlpha(ComfyNodeABC):
     This node loads an image from the specified path and extracts the alpha
     channel to use as a mask. If the image has no alpha channel, a blank mask
     is returned.
+    'change_detection' selects when the file counts as changed, like in "load STRING from file".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
                 "path": (IO.STRING, {"default": ""}),
             },
+            "optional": {
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
+            },
         }
 
     RETURN_TYPES = (IO.MASK, IO.BOOLEAN)
@@ -844,25 +1670,19 @@ class PathLoadMaskFromAlpha(ComfyNodeABC):
     FUNCTION = "load_mask_from_alpha"
 
     @classmethod
-    def IS_CHANGED(cls, path):
-        try:
-            if os.path.exists(path):
-                return os.path.getmtime(path)
-        except Exception:
-            pass
-        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
 
-    def load_mask_from_alpha(self, path: str):
+    def load_mask_from_alpha(self, path: str, change_detection: str = "mtime"):
         import torch
 
-        img = load_image_helper(path)
+        mask_tensor = load_cached(path, "alpha", load_alpha_mask)
 
-        if img is None:
+        if mask_tensor is None:
             # Return empty 1x1 mask
             empty_mask = torch.zeros((1, 1, 1), dtype=torch.float32)
             return (empty_mask, False)
 
-        mask_tensor = extract_mask_from_alpha(img)
         return (mask_tensor, True)
 
 
@@ -873,8 +1693,10 @@ class PathLoadMaskFromGreyscale(ComfyNodeABC):
     This node loads an image from the specified path and creates a mask from it.
     If the image is greyscale, the intensity is used directly.
     If the image is RGB, the red channel is used.
+    'change_detection' selects when the file counts as changed, like in "load STRING from file".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -882,6 +1704,7 @@ class PathLoadMaskFromGreyscale(ComfyNodeABC):
             },
             "optional": {
                 "invert": (IO.BOOLEAN, {"default": False}),
+                "change_detection": (CHANGE_DETECTION_STRATEGIES, {"default": "mtime"}),
             },
         }
 
@@ -892,30 +1715,22 @@ class PathLoadMaskFromGreyscale(ComfyNodeABC):
     FUNCTION = "load_mask_from_greyscale"
 
     @classmethod
-    def IS_CHANGED(cls, path):
-        try:
-            if os.path.exists(path):
-                return os.path.getmtime(path)
-        except Exception:
-            pass
-        return float("NaN")  # Return NaN if file doesn't exist or can't access modification time
+    def IS_CHANGED(cls, path, change_detection: str = "mtime", **kwargs):
+        return file_change_signature(path, change_detection)
 
-    def load_mask_from_greyscale(self, path: str, invert: bool = False):
+    def load_mask_from_greyscale(self, path: str, invert: bool = False, change_detection: str = "mtime"):
         import torch
 
-        img = load_image_helper(path)
+        if invert:
+            mask_tensor = load_cached(path, "greyscale inverted", lambda p: load_greyscale_mask(p, invert=True))
+        else:
+            mask_tensor = load_cached(path, "greyscale", load_greyscale_mask)
 
-        if img is None:
+        if mask_tensor is None:
             # Return empty 1x1 mask
             empty_mask = torch.zeros((1, 1, 1), dtype=torch.float32)
             return (empty_mask, False)
 
-        mask_tensor = extract_mask_from_greyscale(img)
-
-        # Optionally invert the mask (1.0 - mask)
-        if invert:
-            mask_tensor = 1.0 - mask_tensor
-
         return (mask_tensor, True)
 
 
@@ -925,8 +1740,11 @@ class PathSaveStringFile(ComfyNodeABC):
 
     This node takes a string and saves it to the specified path as a text file.
     Optionally, you can choose to create the directory if it doesn't exist.
+    With 'write_behind' the file is written in the background and the node returns right away,
+    see "flush pending writes".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -936,6 +1754,7 @@ class PathSaveStringFile(ComfyNodeABC):
             "optional": {
                 "create_dirs": (IO.BOOLEAN, {"default": True}),
                 "encoding": (IO.STRING, {"default": "utf-8"}),
+                "write_behind": (IO.BOOLEAN, {"default": False}),
             }
         }
 
@@ -946,7 +1765,8 @@ class PathSaveStringFile(ComfyNodeABC):
     FUNCTION = "save_text"
     OUTPUT_NODE = True
 
-    def save_text(self, text: str, path: str, create_dirs: bool = True, encoding: str = "utf-8"):
+    def save_text(self, text: str, path: str, create_dirs: bool = True, encoding: str = "utf-8",
+                  write_behind: bool = False):
         if not path:
             print("Basic data handling: Save failed - no path specified")
             return (False,)
@@ -957,8 +1777,16 @@ class PathSaveStringFile(ComfyNodeABC):
             if directory and create_dirs and not os.path.exists(directory):
                 os.makedirs(directory)
 
-            with open(path, "w", encoding=encoding) as f:
-                f.write(text)
+            def write(file_path):
+                with open(file_path, "w", encoding=encoding) as f:
+                    f.write(text)
+
+            if write_behind:
+                # Failures of earlier write-behind saves are reported now
+                earlier_failures = report_write_failures()
+                get_write_behind_queue().submit(f"saving {path}", lambda: atomic_write(path, write))
+                return (not earlier_failures,)
+            write(path)
 
             print(f"Basic data handling: Successfully saved text to {path}")
             return (True,)
@@ -973,8 +1801,14 @@ class PathSaveImageRGB(ComfyNodeABC):
 
     This node takes an image tensor and saves it to the specified path.
     Supports various image formats like PNG, JPG, WEBP, JXL (if pillow-jxl is installed), etc.
+    All images of a batch are saved, numbered like "path_00000.png", or with an `{index}` field in
+    the path like "path_{index:03d}". They are encoded in parallel by 'workers' threads (0 uses one
+    per CPU). 'compress_level' is the PNG compression from 0 (fastest) to 9 (smallest).
+    With 'write_behind' the images are encoded and written in the background and the node returns
+    right away, see "flush pending writes".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -985,6 +1819,9 @@ class PathSaveImageRGB(ComfyNodeABC):
                 "format": (IO.STRING, {"default": "png"}),
                 "quality": (IO.INT, {"default": 95, "min": 1, "max": 100}),
                 "create_dirs": (IO.BOOLEAN, {"default": True}),
+                "compress_level": (IO.INT, {"default": 6, "min": 0, "max": 9}),
+                "workers": (IO.INT, {"default": 0, "min": 0}),
+                "write_behind": (IO.BOOLEAN, {"default": False}),
             }
         }
 
@@ -995,59 +1832,46 @@ class PathSaveImageRGB(ComfyNodeABC):
     FUNCTION = "save_image"
     OUTPUT_NODE = True
 
-    def save_image(self, images, path: str, format: str = "png", quality: int = 95, create_dirs: bool = True):
+    def save_image(self, images, path: str, format: str = "png", quality: int = 95, create_dirs: bool = True,
+                   compress_level: int = 6, workers: int = 0, write_behind: bool = False):
         if not path:
             print("Basic data handling: Save failed - no path specified")
             return (False,)
 
-        # If the path doesn't have an extension or it doesn't match the format, add it
-        if not path.lower().endswith(f".{format.lower()}"):
-            path = f"{path}.{format.lower()}"
-
         try:
             import numpy as np
             from PIL import Image
 
-            # Check if pillow_jxl is available for JXL support
-            has_jxl_support = False
-            try:
-                import pillow_jxl # noqa: F401 - imported but unused, kept for JPEG XL support
-                has_jxl_support = True
-            except ModuleNotFoundError:
-                # pillow_jxl is not installed
-                if format.lower() == "jxl":
-                    print("Basic data handling: JPEG XL format requested but pillow_jxl module is not installed. "
-                          "Please install it with 'pip install pillow-jxl-plugin'.")
-                    return (False,)
+            if not check_jxl_support(format):
+                return (False,)
 
-            # Create directories if needed
-            directory = os.path.dirname(path)
-            if directory and create_dirs and not os.path.exists(directory):
-                os.makedirs(directory)
+            # If the path doesn't have an extension or it doesn't match the format, add it
+            paths = batch_file_paths(path, format.lower(), len(images))
 
-            # Convert from tensor format back to PIL Image
-            # Extract the first image from the batch
-            i = 0
-            img_tensor = images[i].cpu().numpy()
-
-            # Convert to uint8 format for PIL
-            img_np = (img_tensor * 255).astype(np.uint8)
-
-            # Create PIL image
-            pil_img = Image.fromarray(img_np)
-
-            # Save the image
-            if format.lower() == "jpg" or format.lower() == "jpeg":
-                pil_img.save(path, format="JPEG", quality=quality)
-            elif format.lower() == "webp":
-                pil_img.save(path, format="WEBP", quality=quality)
-            elif format.lower() == "jxl" and has_jxl_support:
-                # JPEG XL specific options
-                pil_img.save(path, format="JXL", quality=quality)
-            else:
-                pil_img.save(path, format=format.upper())
-
-            print(f"Basic data handling: Successfully saved image to {path}")
+            # Create directories if needed
+            for directory in {os.path.dirname(file_path) for file_path in paths}:
+                if directory and create_dirs and not os.path.exists(directory):
+                    os.makedirs(directory, exist_ok=True)
+
+            # Convert from tensor format back to PIL Images
+            images_np = images.cpu().numpy()
+
+            def make_image(i):
+                # Convert to uint8 format for PIL
+                return Image.fromarray((images_np[i] * 255).astype(np.uint8))
+
+            options = dict(format=format, quality=quality, compress_level=compress_level)
+            if write_behind:
+                # Failures of earlier write-behind saves are reported now
+                earlier_failures = report_write_failures()
+                get_write_behind_queue().submit(
+                    f"saving {paths[0]}", lambda: save_batch(paths, make_image, workers, atomic=True, **options)
+                )
+                return (not earlier_failures,)
+            save_batch(paths, make_image, workers, **options)
+
+            print(f"Basic data handling: Successfully saved {len(paths)} image(s) to {paths[0]}"
+                  + (f" .. {paths[-1]}" if len(paths) > 1 else ""))
             return (True,)
         except Exception as e:
             print(f"Basic data handling: Error saving image: {e}")
@@ -1061,8 +1885,15 @@ class PathSaveImageRGBA(ComfyNodeABC):
     This node takes an image tensor and a mask tensor and saves them to the
     specified path as an image with transparency, where the mask defines the
     alpha channel.
+    All images of a batch are saved, numbered like "path_00000.png", or with an `{index}` field in
+    the path like "path_{index:03d}". A mask batch with fewer masks than images repeats its last
+    mask. The images are encoded in parallel by 'workers' threads (0 uses one per CPU).
+    'compress_level' is the PNG compression from 0 (fastest) to 9 (smallest).
+    With 'write_behind' the images are encoded and written in the background and the node returns
+    right away, see "flush pending writes".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1075,6 +1906,9 @@ class PathSaveImageRGBA(ComfyNodeABC):
                 "quality": (IO.INT, {"default": 95, "min": 1, "max": 100}),
                 "invert_mask": (IO.BOOLEAN, {"default": False}),
                 "create_dirs": (IO.BOOLEAN, {"default": True}),
+                "compress_level": (IO.INT, {"default": 6, "min": 0, "max": 9}),
+                "workers": (IO.INT, {"default": 0, "min": 0}),
+                "write_behind": (IO.BOOLEAN, {"default": False}),
             }
         }
 
@@ -1087,7 +1921,8 @@ class PathSaveImageRGBA(ComfyNodeABC):
 
     def save_image_with_mask(self, images, mask, path: str, format: str = "png",
                             quality: int = 95, invert_mask: bool = False,
-                            create_dirs: bool = True):
+                            create_dirs: bool = True, compress_level: int = 6, workers: int = 0,
+                            write_behind: bool = False):
         if not path:
             print("Basic data handling: Save failed - no path specified")
             return (False,)
@@ -1097,67 +1932,52 @@ class PathSaveImageRGBA(ComfyNodeABC):
             print("Basic data handling: JPEG format doesn't support transparency. Using PNG instead.")
             format = "png"
 
-        # If the path doesn't have an extension or it doesn't match the format, add it
-        if not path.lower().endswith(f".{format.lower()}"):
-            path = f"{path}.{format.lower()}"
-
         try:
             import numpy as np
             from PIL import Image
 
-            # Check if pillow_jxl is available for JXL support
-            has_jxl_support = False
-            try:
-                import pillow_jxl # noqa: F401 - imported but unused, kept for JPEG XL support
-                has_jxl_support = True
-            except ModuleNotFoundError:
-                # pillow_jxl is not installed
-                if format.lower() == "jxl":
-                    print("Basic data handling: JPEG XL format requested but pillow_jxl module is not installed. "
-                          "Please install it with 'pip install pillow-jxl-plugin'.")
-                    return (False,)
-
-            # Create directories if needed
-            directory = os.path.dirname(path)
-            if directory and create_dirs and not os.path.exists(directory):
-                os.makedirs(directory)
-
-            # Convert from tensor format back to PIL Image
-            # Extract the first image from the batch
-            i = 0
-            img_tensor = images[i].cpu().numpy()
-            mask_tensor = mask[i].cpu()
-
-            # Invert the mask if needed (1.0 becomes transparent, 0.0 becomes opaque)
-            if invert_mask:
-                mask_tensor = 1.0 - mask_tensor
+            if not check_jxl_support(format):
+                return (False,)
 
-            # Convert to alpha channel (0-255)
-            alpha_np = (255.0 * (1.0 - mask_tensor.numpy())).astype(np.uint8)
+            # If the path doesn't have an extension or it doesn't match the format, add it
+            paths = batch_file_paths(path, format.lower(), len(images))
 
-            # Convert to uint8 format for PIL
-            img_np = (img_tensor * 255).astype(np.uint8)
-
-            # Create PIL image (RGB)
-            pil_img = Image.fromarray(img_np)
-
-            # Create alpha channel image
-            alpha_img = Image.fromarray(alpha_np, mode='L')
-
-            # Convert to RGBA and add alpha channel
-            pil_img_rgba = pil_img.convert("RGBA")
-            pil_img_rgba.putalpha(alpha_img)
-
-            # Save the image
-            if format.lower() == "webp":
-                pil_img_rgba.save(path, format="WEBP", quality=quality)
-            elif format.lower() == "jxl" and has_jxl_support:
-                # JPEG XL supports alpha channel
-                pil_img_rgba.save(path, format="JXL", quality=quality)
-            else:
-                pil_img_rgba.save(path, format=format.upper())
-
-            print(f"Basic data handling: Successfully saved image with mask to {path}")
+            # Create directories if needed
+            for directory in {os.path.dirname(file_path) for file_path in paths}:
+                if directory and create_dirs and not os.path.exists(directory):
+                    os.makedirs(directory, exist_ok=True)
+
+            # Convert from tensor format back to PIL Images
+            images_np = images.cpu().numpy()
+            masks_np = mask.cpu().numpy()
+
+            def make_image(i):
+                mask_np = masks_np[min(i, len(masks_np) - 1)]
+
+                # Invert the mask if needed (1.0 becomes transparent, 0.0 becomes opaque)
+                if invert_mask:
+                    mask_np = 1.0 - mask_np
+
+                # Convert to alpha channel (0-255)
+                alpha_np = (255.0 * (1.0 - mask_np)).astype(np.uint8)
+
+                # Create PIL image (RGB) from uint8 format, convert to RGBA and add alpha channel
+                pil_img_rgba = Image.fromarray((images_np[i] * 255).astype(np.uint8)).convert("RGBA")
+                pil_img_rgba.putalpha(Image.fromarray(alpha_np, mode='L'))
+                return pil_img_rgba
+
+            options = dict(format=format, quality=quality, compress_level=compress_level)
+            if write_behind:
+                # Failures of earlier write-behind saves are reported now
+                earlier_failures = report_write_failures()
+                get_write_behind_queue().submit(
+                    f"saving {paths[0]}", lambda: save_batch(paths, make_image, workers, atomic=True, **options)
+                )
+                return (not earlier_failures,)
+            save_batch(paths, make_image, workers, **options)
+
+            print(f"Basic data handling: Successfully saved {len(paths)} image(s) with mask to {paths[0]}"
+                  + (f" .. {paths[-1]}" if len(paths) > 1 else ""))
             return (True,)
         except Exception as e:
             print(f"Basic data handling: Error saving image with mask: {e}")
@@ -1171,6 +1991,7 @@ class PathInputDir(ComfyNodeABC):
     This is where input images are usually stored when using ComfyUI
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {}
 
@@ -1192,6 +2013,7 @@ class PathOutputDir(ComfyNodeABC):
     This is where output images are usually stored when using ComfyUI
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {}
 
@@ -1213,6 +2035,7 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: PathDirname": PathDirname,
     "Basic data handling: PathExists": PathExists,
     "Basic data handling: PathExpandVars": PathExpandVars,
+    "Basic data handling: PathFlushWrites": PathFlushWrites,
     "Basic data handling: PathGetCwd": PathGetCwd,
     "Basic data handling: PathGetExtension": PathGetExtension,
     "Basic data handling: PathSetExtension": PathSetExtension,
@@ -1222,6 +2045,7 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: PathIsAbsolute": PathIsAbsolute,
     "Basic data handling: PathIsDir": PathIsDir,
     "Basic data handling: PathIsFile": PathIsFile,
+    "Basic data handling: PathIterDir": PathIterDir,
     "Basic data handling: PathJoin": PathJoin,
     "Basic data handling: PathListDir": PathListDir,
     "Basic data handling: PathNormalize": PathNormalize,
@@ -1230,6 +2054,8 @@ NODE_CLASS_MAPPINGS = {
     "Basic data handling: PathSplit": PathSplit,
     "Basic data handling: PathSplitExt": PathSplitExt,
     "Basic data handling: PathLoadStringFile": PathLoadStringFile,
+    "Basic data handling: PathLoadStringFileRange": PathLoadStringFileRange,
+    "Basic data handling: PathLoadImageBatch": PathLoadImageBatch,
     "Basic data handling: PathLoadImageRGB": PathLoadImageRGB,
     "Basic data handling: PathLoadImageRGBA": PathLoadImageRGBA,
     "Basic data handling: PathLoadMaskFromAlpha": PathLoadMaskFromAlpha,
@@ -1246,6 +2072,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: PathDirname": "dirname",
     "Basic data handling: PathExists": "exists",
     "Basic data handling: PathExpandVars": "expand vars",
+    "Basic data handling: PathFlushWrites": "flush pending writes",
     "Basic data handling: PathGetCwd": "get current working directory",
     "Basic data handling: PathGetExtension": "get extension",
     "Basic data handling: PathSetExtension": "set extension",
@@ -1255,6 +2082,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: PathIsAbsolute": "is absolute",
     "Basic data handling: PathIsDir": "is dir",
     "Basic data handling: PathIsFile": "is file",
+    "Basic data handling: PathIterDir": "iterate dir",
     "Basic data handling: PathJoin": "join",
     "Basic data handling: PathListDir": "list dir",
     "Basic data handling: PathNormalize": "normalize",
@@ -1263,6 +2091,8 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "Basic data handling: PathSplit": "split",
     "Basic data handling: PathSplitExt": "splitext",
     "Basic data handling: PathLoadStringFile": "load STRING from file",
+    "Basic data handling: PathLoadStringFileRange": "load STRING range from file",
+    "Basic data handling: PathLoadImageBatch": "load IMAGE+MASK batch from files",
     "Basic data handling: PathLoadImageRGB": "load IMAGE from file (RGB)",
     "Basic data handling: PathLoadImageRGBA": "load IMAGE+MASK from file (RGBA)",
     "Basic data handling: PathLoadMaskFromAlpha": "load MASK from alpha channel",
@@ -13,11 +13,14 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 class RegexFindallDataList(ComfyNodeABC):
     """
     Returns all non-overlapping matches of a pattern in the string as a list of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -41,6 +44,7 @@ class RegexFindallList(ComfyNodeABC):
     Returns all non-overlapping matches of a pattern in the string as a list of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -64,6 +68,7 @@ class RegexGroupDict(ComfyNodeABC):
     If no match is found, it returns an empty DICT.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -90,6 +95,7 @@ class RegexSearchGroupsDataList(ComfyNodeABC):
     If no match is found, it returns an empty LIST.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -117,6 +123,7 @@ class RegexSearchGroupsList(ComfyNodeABC):
     If no match is found, it returns an empty data list.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -142,6 +149,7 @@ class RegexSplitDataList(ComfyNodeABC):
     Splits the string at each match of the pattern and returns a list of substrings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -165,6 +173,7 @@ class RegexSplitList(ComfyNodeABC):
     Splits the string at each match of the pattern and returns a list of substrings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -187,6 +196,7 @@ class RegexSub(ComfyNodeABC):
     Substitutes matches of the pattern in the string with a replacement string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -212,6 +222,7 @@ class RegexTest(ComfyNodeABC):
     Returns True if a match is found, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -14,6 +14,7 @@ except:
     ComfyNodeABC = object
 
 from ._dynamic_input import ContainsDynamicDict
+from ._input_types import cached_input_types
 
 
 class SetCreate(ComfyNodeABC):
@@ -24,6 +25,7 @@ class SetCreate(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -49,6 +51,7 @@ class SetCreateFromBoolean(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -74,6 +77,7 @@ class SetCreateFromFloat(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -99,6 +103,7 @@ class SetCreateFromInt(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -124,6 +129,7 @@ class SetCreateFromString(ComfyNodeABC):
     extended based on the number of inputs provided.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": ContainsDynamicDict({
@@ -149,6 +155,7 @@ class SetAdd(ComfyNodeABC):
     with the item added. If the item is already present, the SET remains unchanged.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -176,6 +183,7 @@ class SetAll(ComfyNodeABC):
     evaluate to True (or if the SET is empty), and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -201,6 +209,7 @@ class SetAny(ComfyNodeABC):
     in the SET evaluates to True, and False otherwise (including if the SET is empty).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -226,6 +235,7 @@ class SetContains(ComfyNodeABC):
     is present in the SET, and False otherwise.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -252,6 +262,7 @@ class SetDifference(ComfyNodeABC):
     elements in the first SET but not in the second SET.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -279,6 +290,7 @@ class SetDiscard(ComfyNodeABC):
     with the item removed. Unlike remove, no error is raised if the item is not present.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -310,6 +322,7 @@ class SetEnumerate(ComfyNodeABC):
     within a single operation.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -337,6 +350,7 @@ class SetIntersection(ComfyNodeABC):
     only elements present in all input SETs.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -374,6 +388,7 @@ class SetIsDisjoint(ComfyNodeABC):
     This node takes two SETs as input and returns True if they have no elements in common.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -400,6 +415,7 @@ class SetIsSubset(ComfyNodeABC):
     (all elements in set1 are also in set2).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -426,6 +442,7 @@ class SetIsSuperset(ComfyNodeABC):
     (set1 contains all elements in set2).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -451,6 +468,7 @@ class SetLength(ComfyNodeABC):
     This node takes a SET as input and returns its length (number of elements) as an integer.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -477,6 +495,7 @@ class SetPop(ComfyNodeABC):
     When the SET is empty, the item is None.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -507,6 +526,7 @@ class SetPopRandom(ComfyNodeABC):
     and the removed element itself. If the SET is empty, it returns None for the element.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -543,6 +563,7 @@ class SetRemove(ComfyNodeABC):
     the original SET is returned with success set to False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -578,6 +599,7 @@ class SetSum(ComfyNodeABC):
     it may raise an error.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -607,6 +629,7 @@ class SetSymmetricDifference(ComfyNodeABC):
     elements in either SET but not in both.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -634,6 +657,7 @@ class SetUnion(ComfyNodeABC):
     all elements from all the input SETs.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -673,6 +697,7 @@ class SetToDataList(ComfyNodeABC):
     individually by nodes that accept data lists.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -699,6 +724,7 @@ class SetToList(ComfyNodeABC):
     since SETs are unordered collections.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -12,9 +12,12 @@ except:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 class StringCapitalize(ComfyNodeABC):
     """Converts the first character of the input string to uppercase and all other characters to lowercase."""
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -40,6 +43,7 @@ class StringCasefold(ComfyNodeABC):
     Use this node when you need the most accurate case-insensitive text matching.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -65,6 +69,7 @@ class StringCenter(ComfyNodeABC):
     single character to use as padding.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -94,6 +99,7 @@ class StringCenter(ComfyNodeABC):
 class StringConcat(ComfyNodeABC):
     """Combines two text strings together, joining them end-to-end."""
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -119,6 +125,7 @@ class StringCount(ComfyNodeABC):
     You can optionally specify start and end positions to limit the search range.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -153,6 +160,7 @@ class StringDecode(ComfyNodeABC):
     Useful for processing encoded data received from files or network sources.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -202,6 +210,7 @@ class StringEncode(ComfyNodeABC):
     network transmission in specific formats.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -238,6 +247,7 @@ class StringEndswith(ComfyNodeABC):
     Optional start and end parameters allow you to check only a specific portion of the string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -272,6 +282,7 @@ class StringExpandtabs(ComfyNodeABC):
     with a default value of 8 characters.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -300,6 +311,7 @@ class StringFind(ComfyNodeABC):
     Optional start and end parameters allow you to limit the search to a specific portion of the string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -335,6 +347,7 @@ class StringFormatMap(ComfyNodeABC):
     would produce "Hello, World".
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -367,6 +380,7 @@ class StringIn(ComfyNodeABC):
     otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -392,6 +406,7 @@ class StringIsAlnum(ComfyNodeABC):
     (letters or numbers) and there is at least one character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -416,6 +431,7 @@ class StringIsAlpha(ComfyNodeABC):
     (letters) and there is at least one character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -440,6 +456,7 @@ class StringIsAscii(ComfyNodeABC):
     set and there is at least one character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -466,6 +483,7 @@ class StringIsDecimal(ComfyNodeABC):
     used to form decimal numbers in various locales.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -490,6 +508,7 @@ class StringIsDigit(ComfyNodeABC):
     and there is at least one character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -515,6 +534,7 @@ class StringIsIdentifier(ComfyNodeABC):
     and can only contain letters, digits, or underscores.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -539,6 +559,7 @@ class StringIsLower(ComfyNodeABC):
     and there is at least one cased character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -564,6 +585,7 @@ class StringIsNumeric(ComfyNodeABC):
     digit characters and characters that have the Unicode numeric value property.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -588,6 +610,7 @@ class StringIsPrintable(ComfyNodeABC):
     otherwise False. Printable characters are those which are not control characters.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -612,6 +635,7 @@ class StringIsSpace(ComfyNodeABC):
     and there is at least one character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -637,6 +661,7 @@ class StringIsTitle(ComfyNodeABC):
     uppercase character and continue with lowercase.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -661,6 +686,7 @@ class StringIsUpper(ComfyNodeABC):
     and there is at least one cased character, otherwise False.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -685,6 +711,7 @@ class StringLength(ComfyNodeABC):
     It works the same way as Python's built-in len() function for strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -710,6 +737,7 @@ class StringDataListJoin(ComfyNodeABC):
     not at the beginning or end of the result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -738,6 +766,7 @@ class StringListJoin(ComfyNodeABC):
     not at the beginning or end of the result.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -764,6 +793,7 @@ class StringLjust(ComfyNodeABC):
     If fillchar is provided, it is used as the padding character instead of a space.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -794,6 +824,7 @@ class StringLower(ComfyNodeABC):
     This node returns a copy of the string with all uppercase characters converted to lowercase.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -819,6 +850,7 @@ class StringLstrip(ComfyNodeABC):
     If chars is not provided, whitespace characters are removed.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -848,6 +880,7 @@ class StringRemoveprefix(ComfyNodeABC):
     if the string starts with that prefix, otherwise returns the original string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -873,6 +906,7 @@ class StringRemovesuffix(ComfyNodeABC):
     if the string ends with that suffix, otherwise returns the original string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -899,6 +933,7 @@ class StringUnescape(ComfyNodeABC):
     are represented literally rather than interpreted.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -934,6 +969,7 @@ class StringEscape(ComfyNodeABC):
     for formats that require escaped sequences instead of literal special characters.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -967,6 +1003,7 @@ class StringReplace(ComfyNodeABC):
     first count occurrences are replaced.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -997,6 +1034,7 @@ class StringRfind(ComfyNodeABC):
     Optional start and end parameters allow you to limit the search to a specific portion of the string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1030,6 +1068,7 @@ class StringRjust(ComfyNodeABC):
     If fillchar is provided, it is used as the padding character instead of a space.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1063,6 +1102,7 @@ class StringRsplitDataList(ComfyNodeABC):
     Creates a data list of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1096,6 +1136,7 @@ class StringRsplitList(ComfyNodeABC):
     Creates a LIST of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1127,6 +1168,7 @@ class StringRstrip(ComfyNodeABC):
     If chars is not provided, whitespace characters are removed.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1160,6 +1202,7 @@ class StringSplitDataList(ComfyNodeABC):
     Creates a data list of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1198,6 +1241,7 @@ class StringSplitList(ComfyNodeABC):
     Creates a LIST of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1232,6 +1276,7 @@ class StringSplitlinesDataList(ComfyNodeABC):
     Creates a data list of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1262,6 +1307,7 @@ class StringSplitlinesList(ComfyNodeABC):
     Creates a LIST of strings.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1291,6 +1337,7 @@ class StringStartswith(ComfyNodeABC):
     Optional start and end parameters allow you to check only a specific portion of the string.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1325,6 +1372,7 @@ class StringStrip(ComfyNodeABC):
     If chars is not provided, whitespace characters are removed.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1354,6 +1402,7 @@ class StringSwapcase(ComfyNodeABC):
     and lowercase characters converted to uppercase.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1378,6 +1427,7 @@ class StringTitle(ComfyNodeABC):
     character and the remaining characters are lowercase.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1401,6 +1451,7 @@ class StringUpper(ComfyNodeABC):
     This node returns a copy of the string with all lowercase characters converted to uppercase.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -1426,6 +1477,7 @@ class StringZfill(ComfyNodeABC):
     after the sign character rather than before.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -15,6 +15,8 @@ except ImportError:
         ANY = "*"
     ComfyNodeABC = object
 
+from ._input_types import cached_input_types
+
 # Add custom IO types for DATETIME and TIMEDELTA
 IO.DATETIME = "DATETIME"
 IO.TIMEDELTA = "TIMEDELTA"
@@ -26,6 +28,7 @@ class TimeNow(ComfyNodeABC):
     Note: Output changes for every run, providing a fresh timestamp each time.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": {
@@ -57,6 +60,7 @@ class TimeToUnix(ComfyNodeABC):
     Converts a DATETIME object to a Unix timestamp (a float representing seconds since the epoch).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -82,6 +86,7 @@ class UnixToTime(ComfyNodeABC):
     Converts a Unix timestamp (float or int) to a DATETIME object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -108,6 +113,7 @@ class TimeFormat(ComfyNodeABC):
     Common format codes: %Y (year), %m (month), %d (day), %H (hour), %M (minute), %S (second).
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -134,6 +140,7 @@ class TimeParse(ComfyNodeABC):
     Parses a string containing a date and time into a DATETIME object, using a specified format code.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -160,6 +167,7 @@ class TimeDelta(ComfyNodeABC):
     Creates a TIMEDELTA object, which represents a duration and can be used for date calculations.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "optional": {
@@ -190,6 +198,7 @@ class TimeAddDelta(ComfyNodeABC):
     Adds a TIMEDELTA (duration) to a DATETIME object, resulting in a new DATETIME.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -215,6 +224,7 @@ class TimeSubtractDelta(ComfyNodeABC):
     Subtracts a TIMEDELTA (duration) from a DATETIME object, resulting in a new DATETIME.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -240,6 +250,7 @@ class TimeDifference(ComfyNodeABC):
     Calculates the difference between two DATETIME objects, returning a TIMEDELTA object.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": {
@@ -266,6 +277,7 @@ class TimeExtract(ComfyNodeABC):
     Weekday is returned as an integer, where Monday is 0 and Sunday is 6.
     """
     @classmethod
+    @cached_input_types
     def INPUT_TYPES(cls):
         return {
             "required": { "datetime": (IO.DATETIME, {}) }
@@ -0,0 +1,209 @@
+"""
+Benchmark suite for the nodes.
+
+By default this runs as a quick smoke test with tiny sizes, so the harness itself stays working.
+For a real benchmark run set BASIC_DATA_HANDLING_BENCHMARK to the path of a JSON file:
+
+    BASIC_DATA_HANDLING_BENCHMARK=benchmark.json python -m pytest tests/test_benchmarks.py
+
+The JSON file contains the package import time, the INPUT_TYPES construction cost and the latency
+of the FUNCTION of every node in NODE_CLASS_MAPPINGS, and scaling curves for the Data List, LIST,
+DICT and SET nodes with 10 to 1M elements, so the results of two releases can be diffed.
+"""
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+
+from src.basic_data_handling import NODE_CLASS_MAPPINGS
+
+ROOT = Path(__file__).parent.parent
+
+FULL_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+SMOKE_SIZES = (10, 100)
+
+SCALING_MODULES = ("data_list_nodes", "list_nodes", "dict_nodes", "set_nodes")
+UNSUPPORTED_TYPES = {"IMAGE", "MASK", "BYTES", "E/O"}
+# a scaling curve stops when a single call takes longer, as the next size would take far too long
+MAX_CALL_TIME = 0.5
+
+
+def _measure(func, min_time: float) -> float:
+    """Return the time of a single call in seconds, calling it repeatedly until min_time is reached."""
+    number = 1
+    while True:
+        elapsed = timeit.timeit(func, number=number)
+        if elapsed >= min_time or number >= 1_000_000:
+            return elapsed / number
+        number *= 10
+
+
+def _representative_value(input_type, options: dict):
+    if "default" in options:
+        return options["default"]
+    if isinstance(input_type, list):
+        return input_type[0]
+    return {
+        "STRING": "hello world",
+        "INT": 1,
+        "FLOAT": 1.0,
+        "FLOAT,INT": 1.0,
+        "BOOLEAN": True,
+        "LIST": [3, 1, 2],
+        "SET": {1, 2, 3},
+        "DICT": {"a": 1, "b": 2},
+        "DATETIME": datetime.datetime(2024, 1, 1, 12, 0, 0),
+        "TIMEDELTA": datetime.timedelta(hours=1),
+    }.get(input_type, 1)
+
+
+def _sized_value(input_type, size: int):
+    if input_type == "DICT":
+        return {f"key{i}": i for i in range(size)}
+    if input_type == "SET":
+        return set(range(size))
+    if input_type == "BOOLEAN":
+        return [i % 2 == 0 for i in range(size)]
+    if input_type == "STRING":
+        return [str(i) for i in range(size)]
+    return list(range(size))
+
+
+def _inputs(node_class):
+    """Yield (name, type, options, required) for all inputs of a node."""
+    input_types = node_class.INPUT_TYPES()
+    for section in ("required", "optional"):
+        for name, spec in input_types.get(section, {}).items():
+            options = spec[1] if len(spec) > 1 else {}
+            yield name, spec[0], options, section == "required"
+
+
+def _node_kwargs(node_class, size=None):
+    """
+    Build representative keyword arguments for the FUNCTION of the node.
+
+    With a size the container inputs (LIST, DICT, SET and the data lists of INPUT_IS_LIST nodes)
+    get that many elements. Returns None when the node can't be called standalone or, for a size,
+    has no container input.
+    """
+    input_is_list = getattr(node_class, "INPUT_IS_LIST", False)
+    kwargs = {}
+    sized = False
+    for name, input_type, options, required in _inputs(node_class):
+        if isinstance(input_type, str) and input_type in UNSUPPORTED_TYPES:
+            return None
+        if not required and "default" not in options and "_dynamic" not in options:
+            continue
+        if size is not None and (input_type in ("LIST", "DICT", "SET") or (input_is_list and "default" not in options)):
+            sized = True
+            kwargs[name] = _sized_value(input_type, size)
+            continue
+        value = _representative_value(input_type, options)
+        kwargs[name] = [value] if input_is_list else value
+    if size is not None and not sized:
+        return None
+    return kwargs
+
+
+def benchmark_import_time() -> dict:
+    """Import the package in a fresh interpreter with `-X importtime` and return its cumulative import time in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.basic_data_handling"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if name.strip() == "src.basic_data_handling":
+                return {"import_us": int(cumulative)}
+    raise RuntimeError("The import time of the package was not reported")
+
+
+def benchmark_nodes(min_time: float) -> dict:
+    results = {}
+    for node_name, node_class in NODE_CLASS_MAPPINGS.items():
+        build_input_types = node_class.INPUT_TYPES.__wrapped__
+        result = {
+            "input_types_build_s": _measure(lambda: build_input_types(node_class), min_time),
+            "input_types_cached_s": _measure(node_class.INPUT_TYPES, min_time),
+        }
+        kwargs = _node_kwargs(node_class)
+        if kwargs is None:
+            result["skipped"] = "inputs can't be created standalone"
+        else:
+            function = getattr(node_class(), node_class.FUNCTION)
+            try:
+                function(**kwargs)
+                result["call_s"] = _measure(lambda: function(**kwargs), min_time)
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+        results[node_name] = result
+    return results
+
+
+def benchmark_scaling(sizes: tuple[int, ...], min_time: float) -> dict:
+    results = {}
+    for node_name, node_class in NODE_CLASS_MAPPINGS.items():
+        if node_class.__module__.rsplit(".", 1)[1] not in SCALING_MODULES:
+            continue
+        function = getattr(node_class(), node_class.FUNCTION)
+        curve = {}
+        too_slow = False
+        for size in sizes:
+            if too_slow:
+                curve[str(size)] = f"skipped: a call took longer than {MAX_CALL_TIME}s at a smaller size"
+                continue
+            kwargs = _node_kwargs(node_class, size)
+            if kwargs is None:
+                break
+            try:
+                function(**kwargs)
+                curve[str(size)] = _measure(lambda: function(**kwargs), min_time)
+                too_slow = curve[str(size)] > MAX_CALL_TIME
+            except Exception as e:
+                curve[str(size)] = f"{type(e).__name__}: {e}"
+        if curve:
+            results[node_name] = curve
+    return results
+
+
+def run_benchmarks(sizes: tuple[int, ...], min_time: float) -> dict:
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "sizes": list(sizes),
+        "import_time": benchmark_import_time(),
+        "nodes": benchmark_nodes(min_time),
+        "scaling": benchmark_scaling(sizes, min_time),
+    }
+
+
+def test_benchmarks(tmp_path, monkeypatch):
+    output = os.environ.get("BASIC_DATA_HANDLING_BENCHMARK")
+    if output:
+        output = os.path.abspath(output)
+        sizes, min_time = FULL_SIZES, 0.05
+    else:
+        output = str(tmp_path / "benchmark.json")
+        sizes, min_time = SMOKE_SIZES, 0.0
+
+    # nodes that write files write them into the temporary directory
+    monkeypatch.chdir(tmp_path)
+    results = run_benchmarks(sizes, min_time)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    with open(output, encoding="utf-8") as f:
+        results = json.load(f)
+    assert results["import_time"]["import_us"] > 0
+    assert set(results["nodes"]) == set(NODE_CLASS_MAPPINGS)
+    assert "call_s" in results["nodes"]["Basic data handling: MathFormula"]
+    assert set(results["scaling"]["Basic data handling: DataListLength"]) == {str(size) for size in sizes}
+    assert set(results["scaling"]["Basic data handling: ListLength"]) == {str(size) for size in sizes}
+    assert set(results["scaling"]["Basic data handling: DictSet"]) == {str(size) for size in sizes}
+    assert set(results["scaling"]["Basic data handling: SetAdd"]) == {str(size) for size in sizes}
@@ -0,0 +1,117 @@
+import hashlib
+import math
+import os
+
+import pytest
+from PIL import Image
+
+from src.basic_data_handling import _change_detection
+from src.basic_data_handling._change_detection import cached_file_hash, file_change_signature, hash_file
+from src.basic_data_handling.path_nodes import (
+    PathLoadImageBatch, PathLoadImageRGB, PathLoadMaskFromGreyscale, PathLoadStringFile, PathLoadStringFileRange,
+)
+
+
+@pytest.fixture
+def hash_cache(monkeypatch):
+    monkeypatch.setattr(_change_detection, "_hash_cache", _change_detection.OrderedDict())
+    return _change_detection._hash_cache
+
+
+def test_hash_file(tmp_path, monkeypatch):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert hash_file(str(path)) == hash_file(str(path))
+    assert hash_file(str(path)) != hash_file(str(empty))
+
+    # blake2b when xxhash isn't installed
+    monkeypatch.setattr(_change_detection, "_new_hasher", lambda: hashlib.blake2b(digest_size=16))
+    assert hash_file(str(path)) == hashlib.blake2b(b"content", digest_size=16).hexdigest()
+    assert hash_file(str(empty)) == hashlib.blake2b(b"", digest_size=16).hexdigest()
+
+
+def test_cached_file_hash(tmp_path, monkeypatch, hash_cache):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+    os.utime(path, (1_000_000, 1_000_000))
+    hashes = []
+    monkeypatch.setattr(_change_detection, "hash_file", lambda p: hashes.append(p) or hash_file(p))
+
+    digest = cached_file_hash(str(path))
+    assert cached_file_hash(str(path)) == digest
+    assert len(hashes) == 1
+
+    # a new stat signature is hashed again, the same content gives the same hash
+    path.write_bytes(b"content")
+    os.utime(path, (2_000_000, 2_000_000))
+    assert cached_file_hash(str(path)) == digest
+    assert len(hashes) == 2
+
+    # a file modified just now isn't cached, it may change again within the same mtime tick
+    path.write_bytes(b"changed")
+    new_digest = cached_file_hash(str(path))
+    assert new_digest != digest
+    assert cached_file_hash(str(path)) == new_digest
+    assert len(hashes) == 4
+
+
+def test_file_change_signature(tmp_path, hash_cache):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"content")
+    os.utime(path, (1_000_000, 1_000_000))
+    signatures = {strategy: file_change_signature(str(path), strategy) for strategy in ("mtime", "stat", "content hash")}
+    assert signatures["mtime"] == 1_000_000
+
+    # touching the file only changes the mtime based signatures
+    os.utime(path, (2_000_000, 2_000_000))
+    assert file_change_signature(str(path), "mtime") != signatures["mtime"]
+    assert file_change_signature(str(path), "stat") != signatures["stat"]
+    assert file_change_signature(str(path), "content hash") == signatures["content hash"]
+
+    # a replaced file with the same mtime is noticed by the stat and the content
+    replacement = tmp_path / "replacement.txt"
+    replacement.write_bytes(b"other content")
+    os.utime(replacement, (2_000_000, 2_000_000))
+    stat_signature = file_change_signature(str(path), "stat")
+    os.replace(replacement, path)
+    assert file_change_signature(str(path), "mtime") == 2_000_000
+    assert file_change_signature(str(path), "stat") != stat_signature
+    assert file_change_signature(str(path), "content hash") != signatures["content hash"]
+
+    for strategy in ("mtime", "stat", "content hash"):
+        assert math.isnan(file_change_signature(str(tmp_path / "missing.txt"), strategy))
+
+
+def test_loader_nodes_change_detection(tmp_path, hash_cache):
+    text_path = str(tmp_path / "file.txt")
+    with open(text_path, "w") as f:
+        f.write("line\n")
+    image_path = str(tmp_path / "image.png")
+    Image.new("RGB", (4, 4)).save(image_path)
+
+    def signatures(strategy):
+        return [
+            PathLoadStringFile.IS_CHANGED(text_path, change_detection=strategy),
+            PathLoadStringFileRange.IS_CHANGED(text_path, unit="lines", start=0, change_detection=strategy),
+            PathLoadImageRGB.IS_CHANGED(image_path, change_detection=strategy),
+            PathLoadMaskFromGreyscale.IS_CHANGED(image_path, invert=True, change_detection=strategy),
+            PathLoadImageBatch.IS_CHANGED([image_path, text_path], change_detection=[strategy]),
+        ]
+
+    os.utime(text_path, (1_000_000, 1_000_000))
+    os.utime(image_path, (1_000_000, 1_000_000))
+    before = {strategy: signatures(strategy) for strategy in ("mtime", "stat", "content hash")}
+    os.utime(text_path, (2_000_000, 2_000_000))
+    os.utime(image_path, (2_000_000, 2_000_000))
+    for strategy, expected in before.items():
+        after = signatures(strategy)
+        if strategy == "content hash":
+            assert after == expected
+        else:
+            assert all(a != b for a, b in zip(after, expected))
+
+    # the mtime stays the default and the nodes accept the input
+    assert PathLoadImageRGB.IS_CHANGED(image_path) == 2_000_000
+    assert PathLoadStringFile().load_text(text_path, change_detection="content hash") == ("line\n", True)
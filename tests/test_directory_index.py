@@ -0,0 +1,130 @@
+import os
+import time
+
+import pytest
+
+from src.basic_data_handling import _directory_index
+from src.basic_data_handling._directory_index import DirectoryIndex, get_directory_index, get_scandir
+from src.basic_data_handling.path_nodes import PathGlob, PathListDir, scan_glob
+
+
+def _make_tree(root):
+    for path in ("a.txt", "b.png", "sub/c.txt", "sub/deep/d.txt", ".hidden/e.txt"):
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(path)
+    # old enough that the directories aren't racy
+    for directory in (root, root / "sub", root / "sub" / "deep", root / ".hidden"):
+        os.utime(directory, (time.time() - 60, time.time() - 60))
+
+
+def _listing(scandir, path):
+    with scandir(path) as it:
+        return sorted((entry.name, entry.path, entry.is_dir(), entry.is_file(), entry.stat().st_size) for entry in it)
+
+
+@pytest.fixture
+def count_scandir(monkeypatch):
+    calls = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(_directory_index.os, "scandir", lambda path=".": calls.append(path) or original_scandir(path))
+    return calls
+
+
+def test_index_scandir(tmp_path):
+    root = tmp_path / "root"
+    _make_tree(root)
+    index = DirectoryIndex(str(tmp_path / "index.sqlite"), max_age=0.0)
+    for directory in (root, root / "sub"):
+        assert _listing(index.scandir, str(directory)) == _listing(os.scandir, str(directory))
+
+    with pytest.raises(OSError):
+        index.scandir(str(root / "missing"))
+    with index.scandir(str(root / "sub")) as it:
+        deep = next(entry for entry in it if entry.name == "deep")
+    assert deep.is_dir() and deep.is_dir(follow_symlinks=False) and not deep.is_symlink()
+
+
+def test_index_is_persistent_and_refreshed(tmp_path, count_scandir):
+    root = tmp_path / "root"
+    _make_tree(root)
+    index_path = str(tmp_path / "index.sqlite")
+    DirectoryIndex(index_path, max_age=0.0).scandir(str(root))
+    assert len(count_scandir) == 1
+
+    # a new index on the same file doesn't read the unchanged directory again
+    index = DirectoryIndex(index_path, max_age=0.0)
+    listing = _listing(index.scandir, str(root))
+    assert len(count_scandir) == 1
+
+    # a new entry changes the mtime of the directory
+    (root / "new.txt").write_text("new")
+    assert _listing(index.scandir, str(root)) != listing
+    assert len(count_scandir) == 2
+    # which is racy right now, so it is read once more
+    index.scandir(str(root))
+    assert len(count_scandir) == 3
+    os.utime(root, (time.time() - 30, time.time() - 30))
+    index.scandir(str(root))
+    index.scandir(str(root))
+    assert len(count_scandir) == 4
+
+
+def test_index_max_age(tmp_path, count_scandir, monkeypatch):
+    root = tmp_path / "root"
+    _make_tree(root)
+    index = DirectoryIndex(str(tmp_path / "index.sqlite"), max_age=3600.0)
+    index.scandir(str(root))
+    stats = []
+    original_stat = os.stat
+    monkeypatch.setattr(_directory_index.os, "stat", lambda path: stats.append(path) or original_stat(path))
+    # checked recently, so answered without a stat
+    index.scandir(str(root))
+    assert stats == []
+    assert len(count_scandir) == 1
+
+
+def test_path_nodes_with_index(tmp_path, monkeypatch, count_scandir):
+    root = tmp_path / "root"
+    _make_tree(root)
+    monkeypatch.setattr(_directory_index, "_indexes", {})
+    monkeypatch.delenv("BASIC_DATA_HANDLING_DIRECTORY_INDEX", raising=False)
+    assert get_directory_index() is None
+    assert get_scandir() is os.scandir
+
+    expected_glob = sorted(scan_glob(str(root / "**" / "*.txt"), True)[0])
+    expected_list = PathListDir().list_directory(str(root), recursive=True, sort_by="name", with_stats=True)
+
+    monkeypatch.setenv("BASIC_DATA_HANDLING_DIRECTORY_INDEX", str(tmp_path / "index.sqlite"))
+    assert get_directory_index() is get_directory_index()
+    monkeypatch.setattr(PathGlob, "_glob_cache", type(PathGlob._glob_cache)())
+    count_scandir.clear()
+    assert sorted(PathGlob().glob_paths(str(root / "**" / "*.txt"), True)[0]) == expected_glob
+    assert count_scandir
+    assert PathListDir().list_directory(str(root), recursive=True, sort_by="name", with_stats=True) == expected_list
+    assert os.path.exists(tmp_path / "index.sqlite")
+
+
+def test_index_caches_are_bounded(tmp_path):
+    root = tmp_path / "root"
+    _make_tree(root)
+    index = DirectoryIndex(str(tmp_path / "index.sqlite"), max_age=3600.0, max_directories=2)
+    for directory in (root, root / "sub", root / "sub" / "deep", root / ".hidden"):
+        index.scandir(str(directory))
+    assert list(index._checked) == [str(root / "sub" / "deep"), str(root / ".hidden")]
+    assert list(index._entries) == [str(root / "sub" / "deep"), str(root / ".hidden")]
+
+
+def test_path_list_dir_stats_are_fresh_with_index(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    _make_tree(root)
+    monkeypatch.setattr(_directory_index, "_indexes", {})
+    monkeypatch.setenv("BASIC_DATA_HANDLING_DIRECTORY_INDEX", str(tmp_path / "index.sqlite"))
+    node = PathListDir()
+    node.list_directory(str(root), files_only=True, with_stats=True)
+
+    # changing a file doesn't change the mtime of its directory, so the index doesn't notice it
+    (root / "a.txt").write_text("a much longer content")
+    os.utime(root / "a.txt", (time.time() + 60, time.time() + 60))
+    entries, sizes, _ = node.list_directory(str(root), files_only=True, with_stats=True)
+    assert sizes[entries.index("a.txt")] == len("a much longer content")
+    assert node.list_directory(str(root), files_only=True, sort_by="mtime", reverse=True)[0][0] == "a.txt"
@@ -0,0 +1,69 @@
+import copy
+import pickle
+
+from src.basic_data_handling._dynamic_input import DYNAMIC_KEY_CACHE_SIZE, ContainsDynamicDict
+
+
+def test_dynamic_number_keys():
+    item = ("*", {"_dynamic": "number"})
+    other = ("INT", {})
+    d = ContainsDynamicDict({"item_0": item, "other": other})
+
+    assert "item_0" in d
+    assert "item_1" in d
+    assert "item_123" in d
+    assert d["item_42"] is item
+    assert "other" in d
+    assert d["other"] is other
+
+    assert "item_" not in d
+    assert "item_x" not in d
+    assert "items_1" not in d
+    assert "other1" not in d
+
+    # repeated lookups give the same answer from the memo
+    assert "item_7" in d and "item_7" in d
+    assert "nope" not in d and "nope" not in d
+
+    # the memo is bounded, however many different keys are asked for
+    for i in range(5000):
+        assert f"item_{i}" in d
+    assert len(d._resolved) == DYNAMIC_KEY_CACHE_SIZE
+
+
+def test_dynamic_dict_pickle_and_deepcopy():
+    item = ("*", {"_dynamic": "number"})
+    d = ContainsDynamicDict({"item_0": item, "other": ("INT", {})})
+    assert "item_3" in d
+
+    for copied in (pickle.loads(pickle.dumps(d)), copy.deepcopy(d)):
+        assert type(copied) is ContainsDynamicDict
+        assert dict(copied) == dict(d)
+        assert copied["item_9"] == item and "other1" not in copied
+        # the copy fills its own memo, not the one of the original
+        assert "item_9" in copied._resolved and "item_9" not in d._resolved
+
+
+def test_dynamic_grouped_keys():
+    key = ("STRING", {"_dynamic": "number", "_dynamicGroup": 0})
+    value = ("*", {"_dynamic": "number", "_dynamicGroup": 0})
+    d = ContainsDynamicDict({"key_0": key, "value_0": value, "else": ("*", {})})
+
+    assert d["key_5"] is key
+    assert d["value_5"] is value
+    assert "else" in d
+    assert "else_1" not in d
+
+
+def test_dynamic_letter_keys():
+    a = ("FLOAT,INT", {"default": 0.0, "_dynamic": "letter"})
+    d = ContainsDynamicDict({"a": a})
+
+    assert "a" in d
+    assert "b" in d
+    assert "Z" in d
+    assert d["e"] is a
+
+    assert "ab" not in d
+    assert "a1" not in d
+    assert "" not in d
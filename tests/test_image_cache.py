@@ -0,0 +1,99 @@
+import os
+
+import torch
+from PIL import Image
+
+from src.basic_data_handling import _image_cache
+from src.basic_data_handling._image_cache import ImageCache, tensors_nbytes
+from src.basic_data_handling.path_nodes import (
+    PathLoadImageRGB, PathLoadImageRGBA, PathLoadMaskFromAlpha, PathLoadMaskFromGreyscale,
+)
+
+
+def test_image_cache_is_bounded_by_bytes():
+    cache = ImageCache(max_bytes=3 * 400)
+    tensors = [torch.zeros(100, dtype=torch.float32) for _ in range(4)]
+    assert tensors_nbytes(tensors[0]) == 400
+    assert tensors_nbytes((tensors[0], torch.zeros(10, dtype=torch.uint8))) == 410
+
+    for i in range(3):
+        cache.put(("key", i), tensors[i])
+    assert cache.get(("key", 0)) is tensors[0]
+    # key 1 is now the least recently used one
+    cache.put(("key", 3), tensors[3])
+    assert len(cache) == 3
+    assert cache.current_bytes == 1200
+    assert cache.get(("key", 1)) is None
+    assert cache.get(("key", 0)) is tensors[0]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # too big to be cached at all
+    cache.put(("big",), torch.zeros(1000))
+    assert cache.get(("big",)) is None
+    cache.clear()
+    assert len(cache) == 0 and cache.current_bytes == 0
+
+
+def test_load_cached(tmp_path):
+    cache = ImageCache(max_bytes=1 << 20)
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"1234")
+    loads = []
+
+    def loader(p):
+        loads.append(p)
+        return torch.tensor([float(len(loads))])
+
+    first = cache.load(str(path), "mode", loader)
+    second = cache.load(str(path), "mode", loader)
+    assert torch.equal(second, first) and len(loads) == 1
+    # every load gets its own copy, so changing it in place doesn't change the cache
+    second += 10
+    assert torch.equal(cache.load(str(path), "mode", loader), first)
+    # a different mode is a different entry
+    cache.load(str(path), "other", loader)
+    assert len(loads) == 2
+
+    # a changed file is never served from the cache
+    path.write_bytes(b"12345")
+    assert not torch.equal(cache.load(str(path), "mode", loader), first)
+    assert len(loads) == 3
+    os.utime(path, ns=(0, 0))
+    cache.load(str(path), "mode", loader)
+    assert len(loads) == 4
+
+    # missing files and failed loads aren't cached
+    assert cache.load(str(tmp_path / "missing"), "mode", lambda p: None) is None
+    assert len(cache) == 4
+
+
+def test_loader_nodes_use_the_cache(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    monkeypatch.setattr(_image_cache, "_image_cache", ImageCache(max_bytes=1 << 30))
+    path = str(tmp_path / "image.png")
+    Image.new("RGBA", (16, 8), color=(200, 100, 50, 25)).save(path)
+    decodes = []
+    original_helper = path_nodes.load_image_helper
+    monkeypatch.setattr(path_nodes, "load_image_helper", lambda p: decodes.append(p) or original_helper(p))
+
+    for _ in range(2):
+        rgb = PathLoadImageRGB().load_image_rgb(path)
+        rgba = PathLoadImageRGBA().load_image_rgba(path)
+        alpha = PathLoadMaskFromAlpha().load_mask_from_alpha(path)
+        grey = PathLoadMaskFromGreyscale().load_mask_from_greyscale(path)
+        inverted = PathLoadMaskFromGreyscale().load_mask_from_greyscale(path, invert=True)
+    assert len(decodes) == 5
+    assert torch.equal(PathLoadImageRGB().load_image_rgb(path)[0], rgb[0])
+    assert len(decodes) == 5
+    assert torch.equal(rgb[0], rgba[0]) and torch.equal(alpha[0], rgba[1])
+    assert torch.allclose(inverted[0], 1.0 - grey[0])
+
+    # disabled by default and with a cap of 0
+    monkeypatch.setattr(_image_cache, "_image_cache", None)
+    monkeypatch.delenv("BASIC_DATA_HANDLING_IMAGE_CACHE_MB", raising=False)
+    assert _image_cache.get_image_cache().max_bytes == 0
+    monkeypatch.setattr(_image_cache, "_image_cache", ImageCache(max_bytes=0))
+    PathLoadImageRGB().load_image_rgb(path)
+    PathLoadImageRGB().load_image_rgb(path)
+    assert len(decodes) == 7
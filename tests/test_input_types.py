@@ -0,0 +1,66 @@
+import copy
+import json
+import pickle
+import pytest
+
+from src.basic_data_handling import NODE_CLASS_MAPPINGS
+from src.basic_data_handling._dynamic_input import ContainsDynamicDict
+from src.basic_data_handling._input_types import FrozenDict, cached_input_types
+
+
+@pytest.mark.parametrize("node_name", sorted(NODE_CLASS_MAPPINGS))
+def test_all_input_types_are_cached(node_name):
+    node_class = NODE_CLASS_MAPPINGS[node_name]
+    input_types = node_class.INPUT_TYPES()
+    assert node_class.INPUT_TYPES() is input_types
+    assert isinstance(input_types, FrozenDict)
+    for section in input_types.values():
+        assert isinstance(section, FrozenDict) or type(section).__name__ == "FrozenContainsDynamicDict"
+    json.dumps(input_types)
+
+
+def test_frozen_input_types():
+    class Node:
+        @classmethod
+        @cached_input_types
+        def INPUT_TYPES(cls):
+            return {
+                "required": {
+                    "mode": (["a", "b"], {"default": "a"}),
+                },
+                "optional": ContainsDynamicDict({
+                    "item_0": ("*", {"_dynamic": "number"}),
+                }),
+            }
+
+    class SubNode(Node):
+        pass
+
+    input_types = Node.INPUT_TYPES()
+    assert SubNode.INPUT_TYPES() is not input_types
+    assert SubNode.INPUT_TYPES() == input_types
+
+    # Nothing can be modified
+    with pytest.raises(TypeError):
+        input_types["hidden"] = {}
+    with pytest.raises(TypeError):
+        input_types["required"].pop("mode")
+    with pytest.raises(TypeError):
+        input_types["optional"]["item_1"] = ("*", {})
+    with pytest.raises(TypeError):
+        input_types["required"]["mode"][1]["default"] = "b"
+
+    # Combo choices stay lists and dynamic inputs are still resolved
+    assert isinstance(input_types["required"]["mode"][0], list)
+    assert "item_5" in input_types["optional"]
+    assert input_types["optional"]["item_5"][1]["_dynamic"] == "number"
+
+    # Copies are mutable and keep the dynamic behaviour
+    copied = input_types["optional"].copy()
+    copied["other"] = ("INT", {})
+    assert isinstance(copied, ContainsDynamicDict) and "item_3" in copied
+    deep = copy.deepcopy(input_types)
+    deep["required"]["mode"][1]["default"] = "b"
+    assert "item_3" in deep["optional"]
+    assert input_types["required"]["mode"][1]["default"] == "a"
+    assert pickle.loads(pickle.dumps(input_types)) == input_types
@@ -1,7 +1,9 @@
+import os
 import pytest
 import math
+import sys
 from math import sin, cos
-from src.basic_data_handling.math_formula_node import MathFormula
+from src.basic_data_handling.math_formula_node import MathFormula, MathFormulaDataList
 
 def test_basic_formula_evaluation():
     """Test basic formula evaluation with simple operations."""
@@ -310,3 +312,171 @@ def test_infix_to_postfix():
     # Test constant function calls
     formula = "pi() + e()"
     assert node.evaluate(formula)[0] == pytest.approx(math.pi + math.e)
+
+def test_compiled_formula_cache():
+    """Test that repeated evaluations of a formula reuse the compiled postfix program."""
+    node = MathFormula()
+    MathFormula.cache_clear()
+
+    assert node.evaluate("a * b + 1", a=2, b=3)[0] == pytest.approx(7.0)
+    assert node.evaluate("a * b + 1", a=4, b=5)[0] == pytest.approx(21.0)
+    assert MathFormula().evaluate("a * b + 1", a=1, b=1)[0] == pytest.approx(2.0)
+
+    info = MathFormula.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+    # Invalid formulas are not cached and raise every time
+    for _ in range(2):
+        with pytest.raises(ValueError, match=r"Unknown function"):
+            node.evaluate("foo(a)", a=1)
+    assert MathFormula.cache_info().currsize == 1
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_formula_data_list(monkeypatch, use_numpy):
+    """Test the Data List formula node against the scalar formula node."""
+    if not use_numpy:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    node = MathFormulaDataList()
+    scalar = MathFormula()
+
+    a = [0.5 * i for i in range(-10, 11)]
+    b = [1, 2, 3]
+    formula = "a * b - sin(a) + max(a, b) ** 2 / (b + 1) + pi() // 1"
+    result = node.evaluate_list([formula], a=a, b=b)[0]
+    b_extended = b + [b[-1]] * (len(a) - len(b))
+    expected = [scalar.evaluate(formula, a=_a, b=_b)[0] for _a, _b in zip(a, b_extended)]
+    assert result == expected
+
+    # the vectorized operations are bit-identical to the scalar path
+    a = [math.sqrt(2) * i - 7.3 for i in range(200)]
+    b = [1 / 3 + i for i in range(200)]
+    formula = "sqrt(abs(a * b)) / (b + 0.1) - max(a, -b) * min(a, b) + e() - -a"
+    expected = [scalar.evaluate(formula, a=_a, b=_b)[0] for _a, _b in zip(a, b)]
+    assert node.evaluate_list([formula], a=a, b=b)[0] == expected
+
+    # Folded constants keep the type of the scalar path, e.g. the int of floor
+    assert node.evaluate_list(["floor(2.5)"])[0] == [scalar.evaluate("floor(2.5)")[0]] == [2]
+    assert type(node.evaluate_list(["floor(2.5)"])[0][0]) is int
+    assert node.evaluate_list(["floor(a)"], a=[2.5])[0] == [2]
+    assert node.evaluate_list(["a + floor(2.5)"], a=[0.5])[0] == [scalar.evaluate("a + floor(2.5)", a=0.5)[0]]
+
+    # Formulas without variables still return a single element list
+    assert node.evaluate_list(["2 * pi()"])[0] == pytest.approx([2 * math.pi])
+
+    # Empty lists give an empty result
+    assert node.evaluate_list(["a + 1"], a=[])[0] == []
+
+    # Errors are identical to the scalar path
+    with pytest.raises(ZeroDivisionError, match=r"Division by zero in operator '/'"):
+        node.evaluate_list(["a / b"], a=[1, 2, 3], b=[1, 0, 2])
+    with pytest.raises(ZeroDivisionError, match=r"Division by zero in operator '%'"):
+        node.evaluate_list(["a % b"], a=[1, 2], b=[0])
+    with pytest.raises(ValueError, match=r"math domain error"):
+        node.evaluate_list(["sqrt(a)"], a=[4, 1, -1])
+    with pytest.raises(ValueError, match=r"math domain error"):
+        node.evaluate_list(["log(a)"], a=[1, 0])
+    with pytest.raises(OverflowError):
+        node.evaluate_list(["exp(a)"], a=[1, 1000])
+    with pytest.raises(ValueError, match=r"Variable 'b' was not provided"):
+        node.evaluate_list(["a + b"], a=[1])
+
+def test_compiled_program():
+    """Test that the compiled program is inspectable and matches the postfix interpreter."""
+    node = MathFormula()
+
+    program = node.compile_formula("a * sin(-b) + 3")
+    assert program.variables == ("a", "b")
+    assert program.constants == [3.0]
+    assert [name for name, _ in program.instructions] == ["_NEG", "sin", "*", "+"]
+    assert program.disassemble() == "\n".join([
+        "r3 = -b",
+        "r4 = sin(r3)",
+        "r5 = a * r4",
+        "r6 = r5 + 3.0",
+        "return r6",
+    ])
+    assert program.run([2.0, math.pi / 2]) == pytest.approx(1.0)
+    assert program.evaluate({"a": 2, "b": math.pi / 2}) == pytest.approx(1.0)
+
+    # A single variable needs no instructions at all
+    program = node.compile_formula("a")
+    assert program.instructions == []
+    assert program.evaluate({"a": 4}) == 4.0
+
+    # Structural errors are raised while compiling
+    with pytest.raises(ValueError, match=r"Invalid expression"):
+        node.compile_formula("a b")
+    with pytest.raises(ValueError, match=r"Operator '\+' needs 2 operand\(s\)"):
+        node.evaluate("a +", a=1)
+
+def test_compiled_program_matches_the_interpreter():
+    """The compiled program gives the same result as the postfix interpreter on a 200 term polynomial."""
+    node = MathFormula()
+    formula = " + ".join(f"{k + 1} * a ** {k % 5} - b / {k + 1}" for k in range(200))
+    variables = {"a": 1.01, "b": 2}
+    program = node.compile_formula(formula)
+
+    assert program.evaluate(variables) == node.evaluate_postfix(list(program.postfix), variables)
+
+
+@pytest.mark.skipif(not os.environ.get("BASIC_DATA_HANDLING_BENCHMARK"),
+                    reason="timing comparison, only with BASIC_DATA_HANDLING_BENCHMARK set")
+def test_compiled_program_benchmark():
+    """Microbenchmark of the compiled program against the postfix interpreter on a 200 term polynomial."""
+    import timeit
+    node = MathFormula()
+    formula = " + ".join(f"{k + 1} * a ** {k % 5} - b / {k + 1}" for k in range(200))
+    variables = {"a": 1.01, "b": 2}
+    program = node.compile_formula(formula)
+
+    interpreted = min(timeit.repeat(lambda: node.evaluate_postfix(program.postfix, variables), number=20, repeat=5))
+    compiled = min(timeit.repeat(lambda: program.evaluate(variables), number=20, repeat=5))
+    assert compiled < interpreted
+
+def test_constant_folding_and_common_subexpressions():
+    """Test that the compiler folds constant subexpressions and reuses repeated ones."""
+    node = MathFormula()
+
+    program = node.compile_formula("pi() / 180 * a")
+    assert program.constants == [pytest.approx(math.pi / 180)]
+    assert [name for name, _ in program.instructions] == ["*"]
+    assert program.evaluate({"a": 90}) == pytest.approx(math.pi / 2)
+
+    program = node.compile_formula("sqrt(2) * b + sqrt(2) * c")
+    assert program.constants == [pytest.approx(math.sqrt(2))]
+    assert [name for name, _ in program.instructions] == ["*", "*", "+"]
+    assert program.evaluate({"b": 1, "c": 2}) == pytest.approx(3 * math.sqrt(2))
+
+    program = node.compile_formula("sin(a) * b + sin(a) * c")
+    assert [name for name, _ in program.instructions] == ["sin", "*", "*", "+"]
+    assert program.evaluate({"a": math.pi / 2, "b": 2, "c": 3}) == pytest.approx(5.0)
+
+    # A formula without variables becomes a single constant
+    program = node.compile_formula("2 * pi() + e() ** 2")
+    assert program.instructions == []
+    assert node.evaluate("2 * pi() + e() ** 2")[0] == pytest.approx(2 * math.pi + math.e ** 2)
+
+    # Constant errors are still raised at evaluation time, in formula order
+    program = node.compile_formula("a + 1 / 0")
+    assert [name for name, _ in program.instructions] == ["/", "+"]
+    with pytest.raises(ZeroDivisionError, match=r"Division by zero in operator '/'"):
+        node.evaluate("a + 1 / 0", a=1)
+    with pytest.raises(ValueError, match=r"math domain error"):
+        node.evaluate("sqrt(a) + 1 / 0", a=-1)
+    with pytest.raises(ValueError, match=r"math domain error"):
+        node.evaluate("a + sqrt(-1)", a=1)
+
+    # Missing variables are reported before anything is calculated, wherever they are in the formula
+    for formula in ("1 / 0 + a", "a + 1 / 0", "b / 0 + a", "sqrt(-1) * a"):
+        with pytest.raises(ValueError, match=r"Variable 'a' was not provided"):
+            node.evaluate(formula, b=1)
+
+    # Signed zeros are different constants
+    assert math.copysign(1, node.evaluate("a * 0 + a * -0", a=-1)[0]) == 1
+    assert math.copysign(1, node.evaluate("a * -0", a=1)[0]) == -1
+
+    # Folded constants are used by the Data List node as well
+    result = MathFormulaDataList().evaluate_list(["sqrt(2) * a + floor(2.5)"], a=[1, 2])[0]
+    assert result == pytest.approx([math.sqrt(2) + 2, 2 * math.sqrt(2) + 2])
@@ -1,3 +1,4 @@
+import glob
 import os
 import pytest
 import platform
@@ -9,9 +10,9 @@ from src.basic_data_handling.path_nodes import (
     PathJoin, PathAbspath, PathExists, PathIsFile, PathIsDir, PathGetSize,
     PathSplit, PathSplitExt, PathBasename, PathDirname, PathGetExtension,
     PathSetExtension, PathNormalize, PathRelative, PathGlob, PathExpandVars, PathGetCwd,
-    PathListDir, PathIsAbsolute, PathCommonPrefix, PathLoadStringFile, PathSaveStringFile,
-    PathLoadImageRGB, PathSaveImageRGB, PathLoadImageRGBA, PathSaveImageRGBA,
-    PathLoadMaskFromAlpha, PathLoadMaskFromGreyscale,
+    PathListDir, PathIterDir, PathIsAbsolute, PathCommonPrefix, PathLoadStringFile, PathLoadStringFileRange, PathSaveStringFile,
+    PathLoadImageBatch, PathLoadImageRGB, PathSaveImageRGB, PathLoadImageRGBA, PathSaveImageRGBA,
+    PathLoadMaskFromAlpha, PathLoadMaskFromGreyscale, batch_file_paths, iter_directory, scan_glob,
 )
 
 
@@ -440,6 +441,216 @@ def test_path_load_save_image_rgb(tmp_path, monkeypatch):
         load_node.load_image_rgb(str(tmp_path / "nonexistent.png"))
 
 
+def test_path_load_image_batch(tmp_path):
+    paths = []
+    for i, color in enumerate([(255, 0, 0, 255), (0, 255, 0, 128), (0, 0, 255, 0)]):
+        path = str(tmp_path / f"image{i}.png")
+        Image.new("RGBA", (8, 6), color=color).save(path)
+        paths.append(path)
+    missing = str(tmp_path / "missing.png")
+    node = PathLoadImageBatch()
+
+    images, masks, exists = node.load_image_batch(paths + [missing], workers=[4])
+    assert exists == [True, True, True, False]
+    assert len(images) == len(masks) == 1
+    assert images[0].shape == (4, 6, 8, 3)
+    assert masks[0].shape == (4, 6, 8)
+    for i, path in enumerate(paths):
+        image, mask, _ = PathLoadImageRGBA().load_image_rgba(path)
+        assert torch.equal(images[0][i], image[0])
+        assert torch.equal(masks[0][i], mask[0])
+    assert torch.count_nonzero(images[0][3]) == 0
+
+    # different sizes are returned as a Data List
+    Image.new("RGB", (4, 4), color="white").save(tmp_path / "small.png")
+    images, masks, exists = node.load_image_batch([paths[0], str(tmp_path / "small.png"), missing])
+    assert exists == [True, True, False]
+    assert [image.shape for image in images] == [(1, 6, 8, 3), (1, 4, 4, 3), (1, 1, 1, 3)]
+    assert [mask.shape for mask in masks] == [(1, 6, 8), (1, 4, 4), (1, 1, 1)]
+
+    assert node.load_image_batch([]) == ([], [], [])
+    assert PathLoadImageBatch.IS_CHANGED(paths) == PathLoadImageBatch.IS_CHANGED(paths)
+    assert PathLoadImageBatch.IS_CHANGED(paths + [missing]) != PathLoadImageBatch.IS_CHANGED(paths + [missing])
+
+
+def _reference_float32(img):
+    # the conversion the loaders used before image_to_float32
+    return np.array(img).astype(np.float32) / 255.0
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "LA", "P", "PA", "1", "I;16", "CMYK"])
+@pytest.mark.parametrize("chunk_pixels", [7, 1 << 18])
+def test_image_conversion_matches_reference(monkeypatch, mode, chunk_pixels):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    monkeypatch.setattr(path_nodes, "CONVERSION_CHUNK_PIXELS", chunk_pixels)
+    rng = np.random.default_rng(0)
+    img = Image.fromarray(rng.integers(0, 256, (13, 11, 4), dtype=np.uint8), "RGBA").convert(mode)
+    if mode == "P":
+        img.info["transparency"] = 3
+
+    rgb = _reference_float32(img.convert("RGB"))
+    assert torch.equal(path_nodes.image_to_rgb_tensor(img), torch.from_numpy(rgb)[None,])
+    assert np.array_equal(path_nodes.image_to_float32(img), _reference_float32(img))
+
+    if "A" in img.getbands():
+        alpha = 1.0 - torch.from_numpy(_reference_float32(img.getchannel("A")))
+    elif mode == "P":
+        alpha = 1.0 - torch.from_numpy(_reference_float32(img.convert("RGBA").getchannel("A")))
+    else:
+        alpha = torch.zeros((13, 11))
+    assert torch.equal(path_nodes.extract_mask_from_alpha(img), alpha.unsqueeze(0))
+
+    if mode == "L":
+        gray = img
+    elif mode in ("RGB", "RGBA"):
+        gray = img.getchannel("R")
+    else:
+        gray = img.convert("L")
+    assert torch.equal(path_nodes.extract_mask_from_greyscale(img), (1.0 - torch.from_numpy(_reference_float32(gray))).unsqueeze(0))
+
+
+def test_image_conversion_peak_memory():
+    import tracemalloc
+    from src.basic_data_handling.path_nodes import image_to_rgb_tensor
+
+    img = Image.new("RGBA", (1024, 1024), color=(10, 20, 30, 40))
+
+    def peak(convert):
+        tracemalloc.start()
+        convert()
+        result = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return result
+
+    # the memory needed on top of the float32 output itself
+    output_size = 1024 * 1024 * 3 * 4
+    reference_overhead = peak(lambda: torch.from_numpy(_reference_float32(img.convert("RGB")))[None,]) - output_size
+    assert peak(lambda: image_to_rgb_tensor(img)) - output_size < reference_overhead / 2
+
+
+def test_path_save_image_batch(tmp_path):
+    images = torch.rand(3, 16, 24, 3)
+    node = PathSaveImageRGB()
+
+    assert node.save_image(images, str(tmp_path / "batch"), workers=2) == (True,)
+    paths = [tmp_path / f"batch_{i:05d}.png" for i in range(3)]
+    for i, path in enumerate(paths):
+        expected = (images[i].numpy() * 255).astype(np.uint8)
+        assert np.array_equal(np.array(Image.open(path)), expected)
+
+    assert node.save_image(images, str(tmp_path / "frames" / "frame_{index:03d}.png"), workers=1) == (True,)
+    assert sorted(os.listdir(tmp_path / "frames")) == ["frame_000.png", "frame_001.png", "frame_002.png"]
+
+    # the PNG compression level trades time for size
+    noise = torch.rand(1, 64, 64, 3).round()
+    node.save_image(noise, str(tmp_path / "level0"), compress_level=0)
+    node.save_image(noise, str(tmp_path / "level9"), compress_level=9)
+    assert os.path.getsize(tmp_path / "level9.png") < os.path.getsize(tmp_path / "level0.png")
+
+    assert node.save_image(images, str(tmp_path / "webp"), format="webp") == (True,)
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".webp")]) == 3
+
+
+def test_batch_file_paths():
+    # the number goes before a matching extension
+    assert batch_file_paths("out/img.png", "png", 3) == ["out/img_00000.png", "out/img_00001.png", "out/img_00002.png"]
+    assert batch_file_paths("out/img.PNG", "png", 2) == ["out/img_00000.png", "out/img_00001.png"]
+    assert batch_file_paths("out/img.jpg", "png", 2) == ["out/img.jpg_00000.png", "out/img.jpg_00001.png"]
+    assert batch_file_paths("out/img.png", "png", 1) == ["out/img.png"]
+    assert batch_file_paths("out/img", "webp", 1) == ["out/img.webp"]
+    # braces other than an {index} field are part of the path
+    assert batch_file_paths("out/{x}/img", "png", 2) == ["out/{x}/img_00000.png", "out/{x}/img_00001.png"]
+    assert batch_file_paths("out/{x}/{index:03d}.png", "png", 2) == ["out/{x}/000.png", "out/{x}/001.png"]
+    assert batch_file_paths("out/{index}_{index}", "png", 2) == ["out/0_0.png", "out/1_1.png"]
+
+
+def test_path_save_image_rgba_batch(tmp_path):
+    images = torch.rand(2, 8, 8, 3)
+    mask = torch.zeros(1, 8, 8)
+    mask[0, :, :4] = 1.0
+    node = PathSaveImageRGBA()
+
+    assert node.save_image_with_mask(images, mask, str(tmp_path / "rgba"), workers=2) == (True,)
+    for i in range(2):
+        saved = np.array(Image.open(tmp_path / f"rgba_{i:05d}.png"))
+        assert saved.shape == (8, 8, 4)
+        assert np.array_equal(saved[..., :3], (images[i].numpy() * 255).astype(np.uint8))
+        # the single mask is used for both images
+        assert (saved[:, :4, 3] == 0).all() and (saved[:, 4:, 3] == 255).all()
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+@pytest.mark.parametrize("use_index", [True, False])
+def test_path_load_string_file_range(tmp_path, monkeypatch, numpy_available, use_index):
+    import sys
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    if not numpy_available:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.setattr(path_nodes, "LINE_INDEX_BLOCK_SIZE", 7)
+    monkeypatch.setattr(path_nodes, "_line_index_cache", path_nodes.OrderedDict())
+    lines = [f'{{"id": {i}, "text": "zeile {i} \u00e4"}}' for i in range(50)]
+    path = tmp_path / "corpus.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    content = path.read_bytes()
+    node = PathLoadStringFileRange()
+
+    text, result_lines, total, exists = node.load_text_range(str(path), "lines", 10, 3, use_index)
+    assert exists
+    assert result_lines == lines[10:13]
+    assert text == "\n".join(lines[10:13]) + "\n"
+    assert total == (50 if use_index else -1)
+    assert node.load_text_range(str(path), "lines", 48, 5, use_index)[1] == lines[48:]
+    assert node.load_text_range(str(path), "lines", 60, 5, use_index)[:2] == ("", [])
+
+    text, _, total, _ = node.load_text_range(str(path), "bytes", 5, 20)
+    assert text == content[5:25].decode("utf-8", errors="replace")
+    assert total == len(content)
+
+    chunks = []
+    _, _, total, _ = node.load_text_range(str(path), "chunks", 0, 100)
+    for i in range(total):
+        chunks.extend(node.load_text_range(str(path), "chunks", i, 100)[1])
+    assert total == -(-len(content) // 100)
+    assert chunks == lines
+
+    assert node.load_text_range(str(tmp_path / "missing.txt")) == ("", [], 0, False)
+    (tmp_path / "empty.txt").write_text("")
+    assert node.load_text_range(str(tmp_path / "empty.txt")) == ("", [], 0, True)
+
+    # the newline isn't the byte 0x0A in UTF-16 and UTF-32, so the offsets would be wrong
+    assert node.load_text_range(str(path), "lines", 1, 1, use_index, encoding="latin-1")[1] == \
+        [lines[1].encode("utf-8").decode("latin-1")]
+    for encoding in ("utf-16", "utf-16-le", "utf-32"):
+        with pytest.raises(ValueError, match="encoding"):
+            node.load_text_range(str(path), "lines", 0, 1, use_index, encoding=encoding)
+
+
+def test_line_index(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    assert list(path_nodes.build_line_index(b"a\nbb\r\n\nc")) == [0, 2, 6, 7]
+    assert list(path_nodes.build_line_index(b"a\nb\n")) == [0, 2]
+    assert list(path_nodes.build_line_index(b"")) == []
+
+    monkeypatch.setattr(path_nodes, "_line_index_cache", path_nodes.OrderedDict())
+    builds = []
+    original_build = path_nodes.build_line_index
+    monkeypatch.setattr(path_nodes, "build_line_index", lambda buffer: builds.append(1) or original_build(buffer))
+    path = tmp_path / "file.txt"
+    path.write_text("a\nb\nc\n")
+    node = PathLoadStringFileRange()
+    assert node.load_text_range(str(path), "lines", 2)[1] == ["c"]
+    assert node.load_text_range(str(path), "lines", 0)[1] == ["a"]
+    assert len(builds) == 1
+    # a new version of the file gets a new index
+    path.write_text("x\ny\n")
+    os.utime(path, ns=(0, 0))
+    assert node.load_text_range(str(path), "lines", 1)[1:3] == (["y"], 2)
+    assert len(builds) == 2
+
+
 
 def test_path_normalize():
     node = PathNormalize()
@@ -519,6 +730,61 @@ def test_path_glob(tmp_path):
     assert len(no_match_result[0]) == 0
 
 
+
+@pytest.mark.parametrize("pattern", [
+    "*.txt", "*", "**", "**/*.txt", "sub*/*.txt", "*/deep/*", "*/", ".*", "sub1/**/", "sub1/file.txt", "nomatch/*",
+])
+@pytest.mark.parametrize("recursive", [False, True])
+def test_scan_glob_matches_glob(tmp_path, monkeypatch, pattern, recursive):
+    for path in ("a.txt", ".hidden.txt", "sub1/file.txt", "sub1/deep/x.png", "sub2/.hid/y.txt", "sub2/deep/z.txt"):
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("content")
+
+    for base in ("", str(tmp_path) + os.sep):
+        monkeypatch.chdir(tmp_path)
+        paths, watched = scan_glob(base + pattern, recursive)
+        assert paths == glob.glob(base + pattern, recursive=recursive)
+        assert watched
+
+
+def test_path_glob_single_scan(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    (tmp_path / "file1.txt").write_text("content")
+    scans = []
+    original_scan = path_nodes._glob_scan
+    monkeypatch.setattr(path_nodes, "_glob_scan", lambda *args: scans.append(args) or original_scan(*args))
+    # directories modified right now can't be trusted, pretend the scans happen much later
+    monkeypatch.setattr(path_nodes, "GLOB_RACY_SECONDS", -3600.0)
+    monkeypatch.setattr(PathGlob, "_glob_cache", path_nodes.OrderedDict())
+
+    pattern = str(tmp_path / "*.txt")
+    digest = PathGlob.IS_CHANGED(pattern)
+    assert PathGlob().glob_paths(pattern) == ([str(tmp_path / "file1.txt")],)
+    assert PathGlob.IS_CHANGED(pattern) == digest
+    assert len(scans) == 1
+
+    # a new file changes the directory signature, so it is scanned once more
+    (tmp_path / "file2.txt").write_text("content")
+    new_digest = PathGlob.IS_CHANGED(pattern)
+    assert new_digest != digest
+    assert sorted(PathGlob().glob_paths(pattern)[0]) == [str(tmp_path / "file1.txt"), str(tmp_path / "file2.txt")]
+    assert len(scans) == 2
+
+    # a change that doesn't affect the matches keeps the digest
+    (tmp_path / "image.png").write_text("image")
+    assert PathGlob.IS_CHANGED(pattern) == new_digest
+
+
+def test_path_glob_cache_is_bounded(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    monkeypatch.setattr(PathGlob, "_glob_cache", path_nodes.OrderedDict())
+    for i in range(path_nodes.GLOB_CACHE_SIZE + 10):
+        PathGlob.IS_CHANGED(str(tmp_path / f"{i}*.txt"))
+    assert len(PathGlob._glob_cache) == path_nodes.GLOB_CACHE_SIZE
+    assert (str(tmp_path / "0*.txt"), False, os.getcwd()) not in PathGlob._glob_cache
+
 def test_path_expand_vars(monkeypatch):
     node = PathExpandVars()
     monkeypatch.setenv("TEST_VAR", "test_value")
@@ -600,6 +866,137 @@ def test_path_list_dir(tmp_path):
     assert len(node.list_directory("")[0]) > 0
 
 
+
+def test_path_list_dir_options(tmp_path, monkeypatch):
+    node = PathListDir()
+    for name, size in (("img10.png", 10), ("img2.PNG", 2), ("img1.jpg", 1), ("notes.txt", 5)):
+        (tmp_path / name).write_bytes(b"x" * size)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "img3.png").write_bytes(b"x" * 3)
+    (tmp_path / "sub" / "deep").mkdir()
+    (tmp_path / "sub" / "deep" / "img4.png").write_bytes(b"x" * 4)
+    os.utime(tmp_path / "img1.jpg", (1000, 1000))
+    os.utime(tmp_path / "img10.png", (3000, 3000))
+    os.utime(tmp_path / "img2.PNG", (2000, 2000))
+
+    # only the cached type information of the entries is used, no extra stat
+    def no_stat(*args, **kwargs):
+        raise AssertionError("unexpected stat")
+    with monkeypatch.context() as m:
+        m.setattr(os.path, "isfile", no_stat)
+        m.setattr(os.path, "isdir", lambda p: True)
+        entries, sizes, mtimes = node.list_directory(str(tmp_path), files_only=True, extensions="png", sort_by="natural")
+    assert entries == ["img2.PNG", "img10.png"]
+    assert sizes == mtimes == []
+
+    entries, sizes, mtimes = node.list_directory(str(tmp_path), files_only=True, sort_by="name")
+    assert entries == ["img1.jpg", "img10.png", "img2.PNG", "notes.txt"]
+    assert node.list_directory(str(tmp_path), name_pattern="img?.*", sort_by="name")[0] == ["img1.jpg", "img2.PNG", "sub"]
+
+    entries, sizes, mtimes = node.list_directory(str(tmp_path), extensions=".png, jpg", sort_by="mtime", reverse=True)
+    assert entries == ["sub", "img10.png", "img2.PNG", "img1.jpg"]
+    assert sizes[1:] == [10, 2, 1]
+    assert mtimes[1:] == [3000.0, 2000.0, 1000.0]
+
+    entries, sizes, _ = node.list_directory(str(tmp_path), files_only=True, sort_by="size", with_stats=True)
+    assert entries == ["img1.jpg", "img2.PNG", "notes.txt", "img10.png"]
+    assert sizes == [1, 2, 5, 10]
+
+    recursive = node.list_directory(str(tmp_path), files_only=True, extensions="png", recursive=True, sort_by="natural")
+    assert recursive[0] == ["img2.PNG", "img10.png", os.path.join("sub", "deep", "img4.png"), os.path.join("sub", "img3.png")]
+    depth_limited = node.list_directory(str(tmp_path), dirs_only=True, recursive=True, max_depth=1)
+    assert depth_limited[0] == ["sub"]
+    assert sorted(node.list_directory(str(tmp_path), dirs_only=True, recursive=True)[0]) == ["sub", os.path.join("sub", "deep")]
+
+    # files_only wins when both are set
+    files = sorted(node.list_directory(str(tmp_path), files_only=True)[0])
+    assert sorted(node.list_directory(str(tmp_path), files_only=True, dirs_only=True)[0]) == files
+    assert sorted(PathIterDir().iterate_directory(str(tmp_path), 10, files_only=True, dirs_only=True)[0]) == files
+
+    # like os.walk, a subdirectory that can't be read is skipped
+    def scandir(path):
+        if path == os.path.join(str(tmp_path), "sub"):
+            raise PermissionError(path)
+        return os.scandir(path)
+    assert sorted(entry_path for entry_path, _ in iter_directory(str(tmp_path), recursive=True, scandir=scandir)) == \
+        ["img1.jpg", "img10.png", "img2.PNG", "notes.txt", "sub"]
+    with pytest.raises(PermissionError):
+        list(iter_directory(os.path.join(str(tmp_path), "sub"), scandir=scandir))
+
+
+def test_path_iter_dir(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    for i in range(7):
+        (tmp_path / f"file{i}.txt").write_text("content")
+    (tmp_path / "image.png").write_text("image")
+    node = PathIterDir()
+    expected = sorted(PathListDir().list_directory(str(tmp_path), extensions="txt")[0])
+
+    entries, cursor, done = node.iterate_directory(str(tmp_path), 3, extensions="txt")
+    batches = [entries]
+    assert not done
+    # the same cursor again returns the same batch
+    assert node.iterate_directory(str(tmp_path), 3, cursor=cursor, extensions="txt") == \
+        node.iterate_directory(str(tmp_path), 3, cursor=cursor, extensions="txt")
+    while not done:
+        entries, cursor, done = node.iterate_directory(str(tmp_path), 3, cursor=cursor, extensions="txt")
+        batches.append(entries)
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert sorted(sum(batches, [])) == expected
+
+    # a closed iterator is recreated from the cursor
+    _, cursor, _ = node.iterate_directory(str(tmp_path), 4, extensions="txt")
+    monkeypatch.setattr(path_nodes, "DIRECTORY_ITERATOR_IDLE_TIMEOUT", -1.0)
+    entries, _, done = node.iterate_directory(str(tmp_path), 4, cursor=cursor, extensions="txt")
+    assert len(entries) == 3 and done
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError):
+        node.iterate_directory(str(tmp_path), 4, cursor=cursor)
+    with pytest.raises(ValueError):
+        node.iterate_directory(str(tmp_path), 4, cursor="invalid")
+
+
+def test_path_iter_dir_limits_and_errors(tmp_path, monkeypatch):
+    import src.basic_data_handling.path_nodes as path_nodes
+
+    node = PathIterDir()
+    monkeypatch.setattr(path_nodes, "MAX_DIRECTORY_ITERATORS", 2)
+    monkeypatch.setattr(path_nodes, "_directory_iterators", {})
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "file1.txt").write_text("content")
+        (tmp_path / name / "file2.txt").write_text("content")
+        node.iterate_directory(str(tmp_path / name), 1)
+    assert len(path_nodes._directory_iterators) == 2
+
+    def failing_iter_directory(*args):
+        yield "first", None
+        yield "second", None
+        raise PermissionError("unreadable")
+
+    monkeypatch.setattr(path_nodes, "iter_directory", failing_iter_directory)
+    entries, cursor, done = node.iterate_directory(str(tmp_path), 1)
+    assert entries == ["first"] and not done
+    # the error is reported on this read and on the following ones, never as an empty last batch
+    for _ in range(2):
+        with pytest.raises(PermissionError):
+            node.iterate_directory(str(tmp_path), 1, cursor=cursor)
+
+
+def test_path_iter_dir_auto_advance(tmp_path):
+    for i in range(5):
+        (tmp_path / f"file{i}.txt").write_text("content")
+    node = PathIterDir()
+    assert PathIterDir.IS_CHANGED(auto_advance=True) != PathIterDir.IS_CHANGED(auto_advance=True)
+    assert PathIterDir.IS_CHANGED(auto_advance=False) == PathIterDir.IS_CHANGED(auto_advance=False)
+
+    runs = [node.iterate_directory(str(tmp_path), 2, auto_advance=True) for _ in range(4)]
+    assert [len(entries) for entries, _, _ in runs] == [2, 2, 1, 2]
+    assert [done for _, _, done in runs] == [False, False, True, False]
+    assert sorted(sum((entries for entries, _, _ in runs[:3]), [])) == [f"file{i}.txt" for i in range(5)]
+
 def test_path_is_absolute():
     node = PathIsAbsolute()
     # Test with absolute paths
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.basic_data_handling import _profiling
+
+ROOT = Path(__file__).parent.parent
+
+
+def _node_classes():
+    class Node:
+        FUNCTION = "run"
+
+        @classmethod
+        def IS_CHANGED(cls, **kwargs):
+            return "same"
+
+        def check_lazy_status(self, values, flag):
+            return []
+
+        def run(self, values, flag):
+            if flag is None:
+                raise ValueError("no flag")
+            return (values * 2, len(values))
+
+    class SubNode(Node):
+        FUNCTION = "run_ui"
+
+        def run_ui(self, values, flag):
+            return {"ui": {}, "result": (values,)}
+
+    return Node, SubNode
+
+
+def test_profiling_records_calls():
+    Node, SubNode = _node_classes()
+    _profiling.reset_profile()
+    _profiling.instrument_node_classes({"Node": Node, "SubNode": SubNode})
+    # instrumenting twice doesn't wrap twice
+    _profiling.instrument_node_class("Node", Node)
+
+    node = Node()
+    assert node.run(values=[1, 2, 3], flag=True) == ([1, 2, 3, 1, 2, 3], 3)
+    node.run(values="ab", flag=False)
+    node.check_lazy_status(values=[1], flag=True)
+    assert Node.IS_CHANGED(values=[1, 2]) == "same"
+    SubNode().run_ui(values=[1], flag=True)
+    SubNode.IS_CHANGED(values=[])
+
+    profile = _profiling.get_profile()
+    run = profile["Node"]["run"]
+    assert run["calls"] == 2 and run["errors"] == 0
+    assert run["input_size_total"] == 3 + 2
+    assert run["input_size_max"] == 3
+    assert run["output_size_max"] == 6
+    assert run["total_time"] >= run["max_time"] > 0
+    assert profile["Node"]["check_lazy_status"]["calls"] == 1
+    assert profile["Node"]["IS_CHANGED"]["calls"] == 1
+    assert profile["SubNode"]["run_ui"]["output_size_total"] == 1
+    assert profile["SubNode"]["IS_CHANGED"]["calls"] == 1
+
+    # calls that raise are recorded as well
+    with pytest.raises(ValueError):
+        node.run(values=[1, 2, 3, 4], flag=None)
+    run = _profiling.get_profile()["Node"]["run"]
+    assert run["calls"] == 3 and run["errors"] == 1
+    assert run["input_size_max"] == 4 and run["output_size_max"] == 6
+
+    text = _profiling.report()
+    assert text.splitlines()[0].startswith("node")
+    assert "run_ui" in text
+    _profiling.reset_profile()
+    assert _profiling.get_profile() == {}
+
+
+def test_profiling_environment(tmp_path):
+    """Enabled by the environment and written as JSON on exit."""
+    code = (
+        "import src.basic_data_handling as p; "
+        "node = p.NODE_CLASS_MAPPINGS['Basic data handling: MathFormula']; "
+        "node().evaluate('a + 1', a=2)"
+    )
+    output = tmp_path / "profile.json"
+    env = {"BASIC_DATA_HANDLING_PROFILE": "1", "BASIC_DATA_HANDLING_PROFILE_OUTPUT": str(output), "PATH": ""}
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, check=True)
+    profile = json.loads(output.read_text())
+    assert profile["Basic data handling: MathFormula"]["evaluate"]["calls"] == 1
+
+    # disabled by default: nothing is wrapped
+    result = subprocess.run(
+        [sys.executable, "-c", "import src.basic_data_handling.math_formula_node as m; "
+                               "print(hasattr(m.MathFormula.evaluate, '__profiled__'))"],
+        cwd=ROOT, env={"PATH": ""}, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.strip() == "False"
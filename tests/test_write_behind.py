@@ -0,0 +1,114 @@
+import os
+import threading
+
+import pytest
+import torch
+from PIL import Image
+
+from src.basic_data_handling import _write_behind
+from src.basic_data_handling._write_behind import WriteBehindQueue, atomic_write
+from src.basic_data_handling.path_nodes import PathFlushWrites, PathSaveImageRGB, PathSaveImageRGBA, PathSaveStringFile
+
+
+@pytest.fixture
+def write_queue(monkeypatch):
+    write_queue = WriteBehindQueue(max_pending=2)
+    monkeypatch.setattr(_write_behind, "_write_behind_queue", write_queue)
+    yield write_queue
+    write_queue.flush()
+
+
+def test_atomic_write(tmp_path, monkeypatch):
+    path = str(tmp_path / "file.txt")
+    synced = []
+    original_fsync = os.fsync
+
+    def fsync(fd):
+        # the temporary file is synced before it replaces the file
+        assert not os.path.exists(path) or open(path).read() != "new"
+        synced.append(fd)
+        original_fsync(fd)
+
+    monkeypatch.setattr(_write_behind.os, "fsync", fsync)
+
+    def write(temporary_path):
+        assert temporary_path != path
+        with open(temporary_path, "w") as f:
+            f.write("new")
+
+    atomic_write(path, write)
+    assert open(path).read() == "new" and len(synced) == 1
+
+    def failing_write(temporary_path):
+        with open(temporary_path, "w") as f:
+            f.write("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        atomic_write(path, failing_write)
+    # the old file is untouched and no temporary file is left behind
+    assert open(path).read() == "new"
+    assert os.listdir(tmp_path) == ["file.txt"]
+
+
+def test_write_behind_queue(write_queue):
+    release = threading.Event()
+    done = []
+    write_queue.submit("blocked", lambda: release.wait(5) and done.append("blocked"))
+    write_queue.submit("second", lambda: done.append("second"))
+    assert write_queue.pending() == 2
+    release.set()
+
+    def fail():
+        raise OSError("disk full")
+
+    write_queue.submit("failing", fail)
+    assert write_queue.flush() == ["failing: disk full"]
+    assert done == ["blocked", "second"]
+    assert write_queue.pending() == 0
+    assert write_queue.flush() == []
+
+
+def test_save_nodes_write_behind(tmp_path, write_queue):
+    text_path = str(tmp_path / "text.txt")
+    assert PathSaveStringFile().save_text("hello", text_path, write_behind=True) == (True,)
+    images = torch.rand(2, 4, 4, 3)
+    assert PathSaveImageRGB().save_image(images, str(tmp_path / "rgb"), write_behind=True) == (True,)
+    assert PathSaveImageRGBA().save_image_with_mask(images, torch.zeros(1, 4, 4), str(tmp_path / "rgba"),
+                                                    write_behind=True) == (True,)
+
+    assert PathFlushWrites().flush_writes(value=42) == (42, True, "")
+    assert open(text_path).read() == "hello"
+    assert Image.open(tmp_path / "rgb_00001.png").size == (4, 4)
+    assert Image.open(tmp_path / "rgba_00000.png").mode == "RGBA"
+    assert sorted(os.listdir(tmp_path)) == ["rgb_00000.png", "rgb_00001.png", "rgba_00000.png", "rgba_00001.png", "text.txt"]
+
+
+def test_write_behind_failures_are_reported(tmp_path, write_queue):
+    missing_dir_path = str(tmp_path / "missing" / "text.txt")
+    node = PathSaveStringFile()
+    assert node.save_text("hello", missing_dir_path, create_dirs=False, write_behind=True) == (True,)
+    write_queue._queue.join()
+
+    # the next execution of a save node reports the failure
+    assert node.save_text("hello", str(tmp_path / "ok.txt"), write_behind=True) == (False,)
+    assert node.save_text("hello", str(tmp_path / "ok2.txt"), write_behind=True) == (True,)
+
+    assert node.save_text("hello", missing_dir_path, create_dirs=False, write_behind=True) == (True,)
+    value, success, errors = PathFlushWrites().flush_writes()
+    assert value is None and not success
+    assert missing_dir_path in errors
+    assert PathFlushWrites.IS_CHANGED() != PathFlushWrites.IS_CHANGED()
+
+
+def test_synchronous_saves_leave_write_behind_failures_to_flush(tmp_path, write_queue):
+    missing_dir_path = str(tmp_path / "missing" / "text.txt")
+    node = PathSaveStringFile()
+    assert node.save_text("hello", missing_dir_path, create_dirs=False, write_behind=True) == (True,)
+    write_queue._queue.join()
+
+    # a synchronous save reports only its own errors and doesn't take the earlier failure
+    assert node.save_text("hello", str(tmp_path / "ok.txt")) == (True,)
+    assert node.save_text("hello", missing_dir_path, create_dirs=False) == (False,)
+    value, success, errors = PathFlushWrites().flush_writes()
+    assert not success and missing_dir_path in errors